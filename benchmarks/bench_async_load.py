@@ -0,0 +1,86 @@
+"""Measure how responsive the event loop stays while a form loads.
+
+Runs `AsyncFormLoader` against a minimal stand-in for the Tk event loop
+that runs `after()` callbacks when they are due, and records the longest
+time the loop spent inside a single callback, and the longest a callback
+ran late, which includes time the worker thread held the GIL. This measures the loader, not Tk, so it runs
+without a display. Run with:
+
+    python -m benchmarks.bench_async_load [WIDGETS]
+"""
+from itertools import count
+from tempfile import TemporaryDirectory
+import heapq
+import os
+import sys
+import time
+
+from vpy.designer.loading import AsyncFormLoader
+from vpy.model.ui.loader import Loader
+from vpy.uikits.tkinter import TkInterKit
+
+from .forms import write_form
+
+
+class EventLoop:
+    def __init__(self) -> None:
+        self._timers = []
+        self._ids = count()
+        self.max_callback = 0.0
+        self.max_lateness = 0.0
+
+    def after(self, ms, callback):
+        timer_id = next(self._ids)
+        heapq.heappush(
+            self._timers, (time.perf_counter() + ms / 1000, timer_id, callback)
+        )
+        return timer_id
+
+    def after_cancel(self, timer_id):
+        self._timers = [t for t in self._timers if t[1] != timer_id]
+        heapq.heapify(self._timers)
+
+    def run(self) -> None:
+        while self._timers:
+            now = time.perf_counter()
+            if self._timers[0][0] <= now:
+                due, _, callback = heapq.heappop(self._timers)
+                self.max_lateness = max(self.max_lateness, now - due)
+                callback()
+                self.max_callback = max(
+                    self.max_callback, time.perf_counter() - now
+                )
+            else:
+                # Stands in for waiting on window system events
+                time.sleep(0.001)
+
+
+def main(widgets: int = 10_000) -> None:
+    with TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "form.ini")
+        write_form(path, widgets)
+        loop = EventLoop()
+        placed = []
+        loader = AsyncFormLoader(
+            loop,
+            Loader(get_class=TkInterKit().widget_class_factory),
+            placed.append,
+        )
+        blocking_start = time.perf_counter()
+        Loader(get_class=TkInterKit().widget_class_factory).load_file(path)
+        blocking = time.perf_counter() - blocking_start
+        start = time.perf_counter()
+        loader.start(path)
+        loop.run()
+        elapsed = time.perf_counter() - start
+
+    print(f"{widgets} widgets, ms")
+    print(f"       blocking load: {blocking * 1000:.1f}")
+    print(f"          async load: {elapsed * 1000:.1f}")
+    print(f"    longest callback: {loop.max_callback * 1000:.1f}")
+    print(f"  most late callback: {loop.max_lateness * 1000:.1f}")
+    print(f"   placement batches: {loader.stats.batches}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,46 @@
+"""Compare loading many UI definition files serially and in parallel.
+
+    python -m benchmarks.bench_batch [FILES] [WIDGETS_PER_FILE]
+"""
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import os
+import sys
+import time
+
+from vpy.model.ui.batch import load_many
+from vpy.model.ui.loader import Loader
+from vpy.uikits.tkinter import TkInterKit
+
+from .forms import write_form
+
+
+KIT = "vpy.uikits.tkinter:TkInterKit"
+
+
+def main(files: int = 200, widgets: int = 2_000) -> None:
+    with TemporaryDirectory() as tmpdir:
+        paths = [Path(tmpdir) / f"form{i}.ini" for i in range(files)]
+        for path in paths:
+            write_form(str(path), widgets)
+        print(f"{files} files, {widgets} widgets each")
+
+        load = Loader(get_class=TkInterKit().widget_class_factory)
+        start = time.perf_counter()
+        for path in paths:
+            with open(path) as f:
+                load(f)
+        print(f"     serial: {time.perf_counter() - start:.2f}s")
+
+        workers = 1
+        while workers <= (os.cpu_count() or 1):
+            start = time.perf_counter()
+            load_many(paths, KIT, max_workers=workers)
+            print(
+                f"  {workers:>2} workers: {time.perf_counter() - start:.2f}s"
+            )
+            workers *= 2
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,29 @@
+"""Compare cold and warm loads through the UI definition cache.
+
+    python -m benchmarks.bench_cache [WIDGETS]
+"""
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import sys
+import time
+
+from vpy.model.ui.cache import CachingLoader
+from vpy.uikits.tkinter import TkInterKit
+
+from .forms import write_form
+
+
+def main(widgets: int = 20_000) -> None:
+    with TemporaryDirectory() as tmpdir:
+        path = Path(tmpdir) / "form.ini"
+        write_form(str(path), widgets)
+        load = CachingLoader(get_class=TkInterKit().widget_class_factory)
+        print(f"{widgets} widgets")
+        for name in ("cold", "warm"):
+            start = time.perf_counter()
+            load(path)
+            print(f"{name:>6}: {(time.perf_counter() - start) * 1e3:.1f}ms")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
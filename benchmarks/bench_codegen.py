@@ -0,0 +1,64 @@
+"""Measure generating tkinter code for a project of many forms.
+
+Loads a project of forms with the given total amount of widgets, then
+times compiling every form separately and compiling all of them into a
+single module. Then times compiling one form holding all the widgets
+from scratch, and again after changing the text of a single button,
+which only generates code for the path to that button, both with and
+without telling the code generator which widget changed. Run with:
+
+    python -m benchmarks.bench_codegen [WIDGETS] [FORMS]
+"""
+import sys
+import time
+
+from vpy.model.ui.loader import Loader
+from vpy.uikits.tkinter import TkInterKit
+
+from .forms import generate_form
+
+
+def main(widgets: int = 10_000, forms: int = 100) -> None:
+    kit = TkInterKit()
+    load = Loader(get_class=kit.widget_class_factory)
+    models = {}
+    for i in range(forms):
+        model = models[f"decorate_form{i}"] = load(generate_form(widgets // forms))
+        # Keep the code caches of the forms apart
+        model.name = f"Form{i}"
+
+    start = time.perf_counter()
+    for model in models.values():
+        kit.compile_user_class_dec(model)
+    per_form = time.perf_counter() - start
+
+    start = time.perf_counter()
+    code = TkInterKit().compile_module(models)
+    module = time.perf_counter() - start
+
+    print(f"{widgets} widgets in {forms} forms, {len(code) / 2**20:.1f} MiB")
+    print(f"  per form: {per_form:.3f}s")
+    print(f"    module: {module:.3f}s")
+
+    model = load(generate_form(widgets))
+    button = model.children[0]
+    start = time.perf_counter()
+    kit.compile_user_class_dec(model)
+    cold = time.perf_counter() - start
+    button.text = "Changed"
+    start = time.perf_counter()
+    kit.compile_user_class_dec(model)
+    edit = time.perf_counter() - start
+    button.text = "Changed again"
+    start = time.perf_counter()
+    kit.compile_user_class_dec(model, changed=[button])
+    hinted_edit = time.perf_counter() - start
+
+    print(f"{widgets} widgets in one form")
+    print(f"                 cold: {cold:.3f}s")
+    print(f"             one edit: {edit:.3f}s")
+    print(f"  one edit, with hint: {hinted_edit:.3f}s")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
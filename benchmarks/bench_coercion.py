@@ -0,0 +1,69 @@
+"""Measure the per-widget cost of turning parsed sections into widgets.
+
+Compares the precompiled coercion plans with the former approach that
+inspected the widget class fields for every widget. Run with:
+
+    python -m benchmarks.bench_coercion [WIDGETS]
+"""
+from dataclasses import fields
+import sys
+import time
+
+from vpy.model.ui.loader import Loader, LoaderError, _getboolean
+from vpy.model.ui.parser import parse_sections
+from vpy.model.ui.base import Widget
+from vpy.uikits.tkinter import TkInterKit
+
+from .forms import generate_form
+
+
+class ReflectiveLoader(Loader):
+    """Field coercion as it was done before coercion plans existed"""
+    def _load_widget(self, section: str, items: dict[str, str]) -> Widget:
+        cls = self.widget_class(section, items)
+        wgt_cfg = {
+            field.name: self._data_for_field(field, section, items)
+            for field in fields(cls)
+            if field.name in items
+        }
+        return cls(name=section, **wgt_cfg)
+
+    @staticmethod
+    def _data_for_field(field, section: str, items: dict[str, str]) -> object:
+        types_and_getters = {
+            int: int,
+            bool: _getboolean,
+            str: str,
+        }
+        for type_, getter in types_and_getters.items():
+            if issubclass(type_, field.type):
+                try:
+                    return getter(items[field.name])
+                except ValueError:
+                    raise LoaderError(
+                        f"Invalid {type_.__name__} value "
+                        f"for {section}.{field.name}"
+                    )
+        else:
+            raise TypeError(f"Unsupported Widget field type: {field.type}")
+
+
+def _per_widget_cost(loader: Loader, sections: list) -> float:
+    start = time.perf_counter()
+    for section, items in sections:
+        loader._load_widget(section, items)
+    return (time.perf_counter() - start) / len(sections)
+
+
+def main(widgets: int = 50_000, rounds: int = 5) -> None:
+    sections = list(parse_sections(generate_form(widgets)))
+    get_class = TkInterKit().widget_class_factory
+    print(f"{widgets} widgets, best of {rounds} rounds")
+    for name, loader_cls in [("reflective", ReflectiveLoader), ("plans", Loader)]:
+        loader = loader_cls(get_class=get_class)
+        cost = min(_per_widget_cost(loader, sections) for _ in range(rounds))
+        print(f"{name:>12}: {cost * 1e6:.2f}us per widget")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
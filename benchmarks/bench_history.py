@@ -0,0 +1,78 @@
+"""Measure undo history of a large form.
+
+Commits a number of random field edits to a structurally shared
+history, then undoes all of them while keeping a live widget tree in
+sync, and compares with deep-copying the whole tree on every edit as a
+naive history would. Run with:
+
+    python -m benchmarks.bench_history [WIDGETS] [EDITS]
+"""
+import copy
+import random
+import sys
+import time
+import tracemalloc
+
+from vpy.model.ui.history import History, set_fields, snapshot, sync
+from vpy.model.ui.loader import Loader
+from vpy.uikits.tkinter import TkInterKit
+
+from .forms import generate_tree_form
+
+
+def main(widgets: int = 10000, edits: int = 10000) -> None:
+    load = Loader(get_class=TkInterKit().widget_class_factory)
+    root = load(generate_tree_form(widgets, fanout=10, depth=6))
+    rnd = random.Random(0)
+
+    paths = []
+    stack = [(snapshot(root), ())]
+    while stack:
+        node, path = stack.pop()
+        if node.children is None:
+            paths.append(path)
+        stack.extend(
+            (child, (*path, i)) for i, child in enumerate(node.children or ())
+        )
+    edit_paths = [rnd.choice(paths) for _ in range(edits)]
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    history = History(snapshot(root), max_versions=edits + 1)
+    for i, path in enumerate(edit_paths):
+        history.commit(set_fields(history.current, path, margin_x=i % 7 + 1))
+    commit_time = time.perf_counter() - start
+    history_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    live = history.current.to_widget()
+    start = time.perf_counter()
+    while history.can_undo:
+        current = history.current
+        sync(live, current, history.undo())
+    undo_time = time.perf_counter() - start
+    assert live == root
+
+    # Far too slow to copy the tree for every edit
+    copies = min(edits, 10)
+    start = time.perf_counter()
+    for _ in range(copies):
+        copy.deepcopy(root)
+    copy_time = (time.perf_counter() - start) / copies
+    tracemalloc.start()
+    version = copy.deepcopy(root)
+    copy_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del version
+
+    print(f"{widgets} widgets, {edits} edits, depth {max(map(len, paths))}")
+    print(f"  shared: {commit_time / edits * 1e6:.1f} us and"
+          f" {history_memory / edits / 1024:.2f} KiB per edit"
+          f" ({history.bytes / edits / 1024:.2f} KiB estimated)")
+    print(f"    undo: {undo_time / edits * 1e6:.1f} us per edit, with sync")
+    print(f"deepcopy: {copy_time * 1e6:.1f} us and"
+          f" {copy_memory / 1024:.2f} KiB per edit")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
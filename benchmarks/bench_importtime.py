@@ -0,0 +1,69 @@
+"""Measure the import time of the entry points of the vpy packages.
+
+Every module is imported in fresh interpreters with `python -X
+importtime`, and the median cumulative time it took is reported, along
+with whether importing it pulled in tkinter, multiprocessing or package
+metadata. Run with:
+
+    python -m benchmarks.bench_importtime [RUNS]
+"""
+from statistics import median
+import subprocess
+import sys
+
+
+ENTRY_POINTS = [
+    "vpy.model.ui.parser",
+    "vpy.model.ui.loader",
+    "vpy.model.ui.lazy",
+    "vpy.model.ui.cache",
+    "vpy.model.ui.batch",
+    "vpy.uikits.registry",
+    "vpy.uikits.tkinter",
+    "vpy.uikits.tkinter.codegen",
+    "vpy.uikits.runtime",
+    "vpy.main",
+]
+
+HEAVY_MODULES = ["tkinter", "multiprocessing", "importlib.metadata"]
+MARKER = "-- vpy import --\n"
+
+
+def _import_time(module: str) -> tuple[int, list[str]]:
+    """Microseconds importing the module took, and the heavy modules it
+    imported"""
+    result = subprocess.run(
+        [
+            sys.executable, "-X", "importtime", "-c",
+            f"import sys; sys.stderr.write({MARKER!r});"
+            f" import {module};"
+            f" print(*[m for m in {HEAVY_MODULES!r} if m in sys.modules])",
+        ],
+        capture_output=True, text=True, check=True,
+    )
+    # Imports done at interpreter startup are listed before the marker,
+    # the outermost ones done by the import statement after it
+    _, _, report = result.stderr.partition(MARKER)
+    total_us = 0
+    for line in report.splitlines():
+        _, cumulative_us, name = line.split("|")
+        if not name.startswith("  "):
+            total_us += int(cumulative_us)
+    return total_us, result.stdout.split()
+
+
+def main(runs: int = 5) -> None:
+    print(f"Median of {runs} runs, ms")
+    for module in ENTRY_POINTS:
+        times = []
+        for _ in range(runs):
+            total_us, heavy = _import_time(module)
+            times.append(total_us)
+        print(
+            f"  {module:<28} {median(times) / 1000:>7.1f}"
+            f"  {' '.join(heavy)}"
+        )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
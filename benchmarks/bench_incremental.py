@@ -0,0 +1,39 @@
+"""Compare full loads with incremental reloads after a small edit.
+
+    python -m benchmarks.bench_incremental [WIDGETS]
+"""
+import sys
+import time
+
+from vpy.model.ui.incremental import IncrementalLoader
+from vpy.model.ui.loader import Loader
+from vpy.uikits.tkinter import TkInterKit
+
+from .forms import generate_form
+
+
+def main(widgets: int = 50_000) -> None:
+    get_class = TkInterKit().widget_class_factory
+    lines = list(generate_form(widgets))
+    edited = [
+        "text: Edited button" if line == "text: Button number 1" else line
+        for line in lines
+    ]
+    print(f"{widgets} widgets")
+
+    start = time.perf_counter()
+    Loader(get_class=get_class)(lines)
+    print(f"        full load: {time.perf_counter() - start:.3f}s")
+
+    load = IncrementalLoader(get_class=get_class)
+    load(lines)
+    start = time.perf_counter()
+    changes = load(edited)
+    print(
+        f"  incremental load: {time.perf_counter() - start:.3f}s"
+        f" ({len(changes.changed)} widgets changed)"
+    )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
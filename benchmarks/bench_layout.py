@@ -0,0 +1,52 @@
+"""Measure headless grid layout of a large form.
+
+Times laying out a whole form from scratch, against changing the text of
+one deeply nested button and laying out again, which only recomputes the
+containers above it. Run with:
+
+    python -m benchmarks.bench_layout [WIDGETS]
+"""
+import sys
+import time
+
+from benchmarks.forms import generate_tree_form
+from vpy.model.ui.layout import GridLayout
+from vpy.model.ui.loader import Loader
+from vpy.uikits.tkinter import TkInterKit
+
+
+def main(widgets: int = 20000) -> None:
+    load = Loader(get_class=TkInterKit().widget_class_factory)
+    root = load(generate_tree_form(widgets, fanout=10, depth=6))
+
+    start = time.perf_counter()
+    layout = GridLayout(root)
+    rects = dict((id(w), r) for w, r in layout.rects())
+    full = time.perf_counter() - start
+
+    # Any widget that is not a container, invalidating it relays out
+    # every container up to the root
+    leaf, stack = None, [root]
+    while stack:
+        widget = stack.pop()
+        children = getattr(widget, "children", None)
+        if children is None:
+            leaf = widget
+        else:
+            stack.extend(children)
+
+    repeat = 100
+    start = time.perf_counter()
+    for i in range(repeat):
+        leaf.text = "x" * (i % 20)
+        layout.invalidate(leaf)
+        layout.rect(leaf)
+    incremental = (time.perf_counter() - start) / repeat
+
+    print(f"{len(rects)} widgets, {layout.stats.misses} container layouts")
+    print(f"          full layout: {full * 1000:.1f} ms")
+    print(f"invalidate + relayout: {incremental * 1000:.3f} ms")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
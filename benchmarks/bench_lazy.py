@@ -0,0 +1,53 @@
+"""Measure time to the first widget with eager and lazy loading.
+
+For forms of growing size, compares loading the whole widget tree with
+indexing the file through `LazyLoader`, with and without checking every
+parent link, and then building a single widget in the middle of the
+form. Run with:
+
+    python -m benchmarks.bench_lazy [WIDGETS...]
+"""
+from tempfile import TemporaryDirectory
+from time import perf_counter
+import os
+import sys
+
+from vpy.model.ui.lazy import LazyLoader
+from vpy.model.ui.loader import Loader
+from vpy.uikits.tkinter import TkInterKit
+
+from .forms import write_form
+
+
+def main(*sizes: int) -> None:
+    get_class = TkInterKit().widget_class_factory
+    print(f"{'widgets':>8}  {'eager':>8}  {'strict':>8}  {'lazy':>8}  {'widget':>8}")
+    with TemporaryDirectory() as tmpdir:
+        for widgets in sizes or (1_000, 10_000, 100_000):
+            path = os.path.join(tmpdir, f"form{widgets}.ini")
+            write_form(path, widgets)
+            name = f"Button{widgets // 2 + 1}"
+
+            start = perf_counter()
+            Loader(get_class=get_class).load_file(path)
+            eager = perf_counter() - start
+
+            start = perf_counter()
+            LazyLoader(get_class=get_class)(path)
+            strict = perf_counter() - start
+
+            start = perf_counter()
+            root = LazyLoader(get_class=get_class, strict=False)(path)
+            lazy = perf_counter() - start
+            start = perf_counter()
+            root.find(name).text
+            first_widget = perf_counter() - start
+
+            print(
+                f"{widgets:>8}  {eager:>7.3f}s  {strict:>7.3f}s"
+                f"  {lazy:>7.3f}s  {first_widget * 1000:>6.2f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,67 @@
+"""Measure the memory each widget takes with tracemalloc.
+
+Compares the slotted widget classes with equivalent dataclasses that
+keep their fields in a per-instance `__dict__`, as the widget classes
+used to. Run with:
+
+    python -m benchmarks.bench_memory [WIDGETS]
+"""
+from dataclasses import field, fields, make_dataclass
+import sys
+import tracemalloc
+
+from vpy.model.ui.loader import Loader
+from vpy.model.ui.widgets import Button
+from vpy.model.ui.layout_widgets import Frame
+
+from .forms import generate_form
+
+
+def _with_dict(cls: type) -> type:
+    return make_dataclass(
+        cls.__name__,
+        [
+            (
+                f.name,
+                f.type,
+                field(default=f.default, default_factory=f.default_factory),
+            )
+            for f in fields(cls)
+        ],
+        kw_only=True,
+    )
+
+
+MODELS = {
+    "dict": {"Button": _with_dict(Button), "Frame": _with_dict(Frame)},
+    "slots": {"Button": Button, "Frame": Frame},
+}
+
+
+def _traced_bytes(fn, *args) -> int:
+    tracemalloc.start()
+    try:
+        result = fn(*args)
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return size
+
+
+def _bare_widgets(cls: type, widgets: int) -> list:
+    return [cls(name="Button", grid_row=1) for _ in range(widgets)]
+
+
+def main(widgets: int = 100_000) -> None:
+    lines = list(generate_form(widgets))
+    print(f"{widgets} widgets, bytes per widget")
+    print(f"{'':>6}  {'loaded tree':>12}  {'bare widget':>12}")
+    for name, classes in MODELS.items():
+        tree = _traced_bytes(Loader(get_class=classes.get), lines)
+        bare = _traced_bytes(_bare_widgets, classes["Button"], widgets)
+        print(f"{name:>6}  {tree / widgets:>12.0f}  {bare / widgets:>12.0f}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,77 @@
+"""Compare reading a UI definition into memory with memory-mapping it.
+
+Writes a large synthetic definition file, then parses it, in a fresh
+process for every mode so peak RSS can be compared, both from lines
+read into strings and straight from the memory-mapped file. Pass
+`--load` to build the widget tree as well. Run with:
+
+    python -m benchmarks.bench_mmap [SIZE_MB] [--load]
+"""
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from tempfile import TemporaryDirectory
+from time import perf_counter
+import os
+import resource
+import sys
+
+from vpy.model.ui.loader import Loader
+from vpy.model.ui.parser import parse_file_sections, parse_sections
+from vpy.uikits.tkinter import TkInterKit
+
+from .forms import write_form
+
+# Roughly the size a widget generated by `write_form` takes on disk
+BYTES_PER_WIDGET = 115
+
+
+def _read_text(path: str, load: bool) -> None:
+    with open(path) as f:
+        lines = f.read().splitlines()
+    if load:
+        Loader(get_class=TkInterKit().widget_class_factory)(lines)
+    else:
+        for _ in parse_sections(lines):
+            pass
+
+
+def _read_mmap(path: str, load: bool) -> None:
+    if load:
+        Loader(get_class=TkInterKit().widget_class_factory).load_file(path)
+    else:
+        for _ in parse_file_sections(path):
+            pass
+
+
+MODES = {"text": _read_text, "mmap": _read_mmap}
+
+
+def _measure(mode: str, path: str, load: bool) -> tuple[float, int]:
+    start = perf_counter()
+    MODES[mode](path, load)
+    elapsed = perf_counter() - start
+    return elapsed, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def main(size_mb: int = 100, load: bool = False) -> None:
+    with TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "form.ini")
+        write_form(path, size_mb * 2**20 // BYTES_PER_WIDGET)
+        file_size = os.path.getsize(path)
+        print(
+            f"{file_size / 2**20:.0f} MB file,"
+            f" {'load' if load else 'parse'} time and peak RSS"
+        )
+        for mode in MODES:
+            with ProcessPoolExecutor(
+                max_workers=1, mp_context=get_context("spawn")
+            ) as pool:
+                elapsed, max_rss = \
+                    pool.submit(_measure, mode, path, load).result()
+            print(f"{mode:>6}  {elapsed:>8.2f}s  {max_rss / 2**10:>8.0f} MB")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    load = "--load" in args
+    main(*(int(arg) for arg in args if arg != "--load"), load=load)
@@ -0,0 +1,74 @@
+"""Compare the streaming loader with the former ConfigParser based one.
+
+Every measurement runs in a fresh process so the reported peak RSS
+values are not influenced by one another. Run with:
+
+    python -m benchmarks.bench_parser [WIDGETS]
+"""
+from collections.abc import Iterable, Iterator
+from configparser import ConfigParser, SectionProxy
+from multiprocessing import get_context
+from tempfile import TemporaryDirectory
+import os
+import re
+import resource
+import sys
+import time
+
+from vpy.model.ui.loader import Loader
+from vpy.uikits.tkinter import TkInterKit
+
+from .forms import write_form
+
+
+class ConfigParserLoader(Loader):
+    """The loader as it was before it had its own parser"""
+    def _parse_stream(
+        self, stream: Iterable[str]
+    ) -> Iterator[tuple[str, SectionProxy]]:
+        cfg = ConfigParser(
+            delimiters=(':',),
+            comment_prefixes=('#',),
+            default_section=".default",
+            interpolation=None
+        )
+        cfg.SECTRE = re.compile(r"\[\s*(?P<header>(:?\.?\w+))\s*\]")
+        cfg.read_file(stream)
+        return ((s, i) for s, i in cfg.items() if s != ".default")
+
+
+LOADERS = {
+    "configparser": ConfigParserLoader,
+    "streaming": Loader,
+}
+
+
+def _measure(loader_name: str, path: str) -> tuple[float, int]:
+    load = LOADERS[loader_name](get_class=TkInterKit().widget_class_factory)
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    with open(path) as f:
+        load(f)
+    elapsed = time.perf_counter() - start
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return elapsed, rss_after - rss_before
+
+
+def main(widgets: int = 50_000) -> None:
+    with TemporaryDirectory() as tmpdir:
+        path = os.path.join(tmpdir, "form.ini")
+        write_form(path, widgets)
+        size = os.path.getsize(path)
+        print(f"{widgets} widgets, {size / 2**20:.1f} MiB")
+        with get_context("spawn").Pool(1, maxtasksperchild=1) as pool:
+            for loader_name in LOADERS:
+                elapsed, rss = pool.apply(_measure, (loader_name, path))
+                print(
+                    f"{loader_name:>14}: {elapsed:.3f}s"
+                    f" ({widgets / elapsed:,.0f} widgets/s),"
+                    f" peak RSS +{rss / 1024:.1f} MiB"
+                )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,60 @@
+"""Measure how long it takes to get the UI code of a window.
+
+Compares generating, compiling and executing the code of a form on
+every window open with loading it through `UiModuleLoader`, from a
+cold cache, from its cache files in a fresh process, and from memory.
+Run with:
+
+    python -m benchmarks.bench_runtime [WIDGETS] [OPENS]
+"""
+from tempfile import TemporaryDirectory
+from pathlib import Path
+from types import ModuleType
+import sys
+import time
+
+from vpy.model.ui.loader import Loader
+from vpy.uikits.runtime import UiModuleLoader
+from vpy.uikits.tkinter import TkInterKit
+
+from .forms import generate_form
+
+
+def _compile_and_exec(model) -> None:
+    module = ModuleType("form")
+    code = compile(TkInterKit().compile_user_class_dec(model), "form", "exec")
+    exec(code, module.__dict__)
+
+
+def _per_open(fn, opens: int) -> float:
+    start = time.perf_counter()
+    for _ in range(opens):
+        fn()
+    return (time.perf_counter() - start) / opens * 1000
+
+
+def main(widgets: int = 200, opens: int = 100) -> None:
+    kit = TkInterKit()
+    model = Loader(get_class=kit.widget_class_factory)(generate_form(widgets))
+    with TemporaryDirectory() as tmpdir:
+        cache_dir = Path(tmpdir)
+
+        def cold() -> None:
+            for path in cache_dir.iterdir():
+                path.unlink()
+            UiModuleLoader(kit=TkInterKit(), cache_dir=cache_dir)(model)
+
+        def warm() -> None:
+            UiModuleLoader(kit=kit, cache_dir=cache_dir)(model)
+
+        load = UiModuleLoader(kit=kit, cache_dir=cache_dir)
+        load(model)
+        print(f"{widgets} widgets, ms per window open")
+        print(f"  compile and exec: {_per_open(lambda: _compile_and_exec(model), opens):.3f}")
+        print(f"        cold cache: {_per_open(cold, opens):.3f}")
+        print(f"   warm cache file: {_per_open(warm, opens):.3f}")
+        print(f"         in memory: {_per_open(lambda: load(model), opens):.3f}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
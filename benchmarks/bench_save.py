@@ -0,0 +1,50 @@
+"""Measure saving large forms as text and binary definitions.
+
+Saves a loaded form in both formats, then loads each file back and
+checks it gives the same tree.
+
+    python -m benchmarks.bench_save [WIDGETS]
+"""
+from pathlib import Path
+from tempfile import TemporaryDirectory
+import sys
+import time
+
+from vpy.model.ui.binary import BinaryLoader, save_binary
+from vpy.model.ui.loader import Loader
+from vpy.model.ui.writer import save_ini
+from vpy.uikits.tkinter import TkInterKit
+
+from .forms import generate_tree_form
+
+
+def main(widgets: int = 100_000) -> None:
+    get_class = TkInterKit().widget_class_factory
+    root = Loader(get_class=get_class)(
+        generate_tree_form(widgets, fanout=10, depth=8)
+    )
+    print(f"{widgets} widgets")
+    with TemporaryDirectory() as tmpdir:
+        for name, save, load in [
+            ("ini", save_ini, Loader(get_class=get_class).load_file),
+            ("binary", save_binary, BinaryLoader(get_class=get_class).load_file),
+        ]:
+            path = Path(tmpdir) / f"form.{name}"
+            start = time.perf_counter()
+            save(root, path)
+            save_time = time.perf_counter() - start
+            start = time.perf_counter()
+            loaded = load(path)
+            load_time = time.perf_counter() - start
+            assert loaded == root
+            size = path.stat().st_size
+            print(
+                f"{name:>6}: {size / 2**20:.1f} MiB,"
+                f" saved at {widgets / save_time / 1000:.0f}k widgets/s"
+                f" ({size / save_time / 2**20:.1f} MiB/s),"
+                f" loaded in {load_time * 1e3:.0f}ms"
+            )
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,71 @@
+"""Measure the cost of managing widgets in `WidgetSelector`, and clicks.
+
+Compares binding a bind tag of its own to every widget, as the selector
+used to, with the shared bind tag it uses now, and times a click on a
+managed widget once thousands are managed. Needs a display. Run with:
+
+    python -m benchmarks.bench_selector [WIDGETS] [CLICKS]
+"""
+from functools import partial
+import sys
+import time
+import tkinter as tk
+from tkinter import ttk
+
+from vpy.main import WidgetSelector
+
+
+def _place_buttons(canvas: tk.Canvas, widgets: int) -> list[tuple[tk.Widget, int]]:
+    placed = []
+    for i in range(widgets):
+        button = ttk.Button(canvas, text=f"b{i}")
+        placed.append((
+            button,
+            canvas.create_window(i % 100 * 80, i // 100 * 30, window=button, anchor="nw"),
+        ))
+    return placed
+
+
+def _manage_per_widget(selector: WidgetSelector, widget: tk.Widget, canvas_id: int) -> None:
+    bind_tag = f"{type(selector).__name__}:{canvas_id}"
+    widget.bindtags(bind_tag)
+    selector.canvas.bind_class(bind_tag, "<Button-1>", partial(print, canvas_id))
+    selector.canvas.bind_class(bind_tag, "<ButtonRelease-1>", print)
+
+
+def _time_ms(fn, placed) -> float:
+    start = time.perf_counter()
+    for widget, canvas_id in placed:
+        fn(widget, canvas_id)
+    return (time.perf_counter() - start) * 1000
+
+
+def main(widgets: int = 5000, clicks: int = 200) -> None:
+    root = tk.Tk()
+    try:
+        canvas = tk.Canvas(root)
+        canvas.grid()
+        root.update()
+
+        selector = WidgetSelector(canvas)
+        placed = _place_buttons(canvas, widgets)
+        per_widget = _time_ms(partial(_manage_per_widget, selector), placed)
+        shared = _time_ms(selector.manage_widget, placed)
+
+        widget, _ = placed[0]
+        start = time.perf_counter()
+        for _ in range(clicks):
+            widget.event_generate("<Button-1>", x=5, y=5)
+            widget.event_generate("<ButtonRelease-1>", x=5, y=5)
+        click = (time.perf_counter() - start) / clicks * 1000
+
+        print(f"{widgets} widgets, ms")
+        print(f"  manage, tag per widget: {per_widget:.1f}")
+        print(f"      manage, shared tag: {shared:.1f}")
+        print(f"       click on a widget: {click:.3f}")
+    finally:
+        root.destroy()
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
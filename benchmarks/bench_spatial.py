@@ -0,0 +1,64 @@
+"""Measure hit-testing and rectangle selection on a crowded canvas.
+
+Compares `SpatialIndex` queries with a linear scan over the bounding
+boxes of all widgets, and times moving a widget in the index as a drag
+does. Run with:
+
+    python -m benchmarks.bench_spatial [WIDGETS] [QUERIES]
+"""
+import random
+import sys
+import time
+
+from vpy.designer.spatial import SpatialIndex
+
+
+def _per_query(fn, queries) -> float:
+    start = time.perf_counter()
+    for query in queries:
+        fn(*query)
+    return (time.perf_counter() - start) / len(queries) * 1e6
+
+
+def main(widgets: int = 10000, queries: int = 1000) -> None:
+    rnd = random.Random(0)
+    # Roughly a grid of buttons, a hundred to a row
+    side = (widgets // 100 + 1) * 40
+    bboxes = {}
+    index = SpatialIndex()
+    for key in range(widgets):
+        x, y = rnd.uniform(0, 100 * 80), rnd.uniform(0, side)
+        bboxes[key] = (x, y, x + rnd.uniform(40, 120), y + 30)
+        index.insert(key, bboxes[key])
+
+    points = [
+        (rnd.uniform(0, 100 * 80), rnd.uniform(0, side)) for _ in range(queries)
+    ]
+    rects = [(x, y, x + 300, y + 200) for x, y in points]
+
+    def scan_point(x, y):
+        return [
+            key for key, (x0, y0, x1, y1) in bboxes.items()
+            if x0 <= x < x1 and y0 <= y < y1
+        ]
+
+    def scan_rect(rx0, ry0, rx1, ry1):
+        return [
+            key for key, (x0, y0, x1, y1) in bboxes.items()
+            if x0 < rx1 and rx0 < x1 and y0 < ry1 and ry0 < y1
+        ]
+
+    moves = [
+        (rnd.randrange(widgets), rnd.uniform(-5, 5), rnd.uniform(-5, 5))
+        for _ in range(queries)
+    ]
+    print(f"{widgets} widgets, us per query")
+    print(f"  point, linear scan: {_per_query(scan_point, points):.1f}")
+    print(f"        point, index: {_per_query(index.at_point, points):.1f}")
+    print(f"   rect, linear scan: {_per_query(scan_rect, rects):.1f}")
+    print(f"         rect, index: {_per_query(lambda *r: index.in_rect(r), rects):.1f}")
+    print(f"         move, index: {_per_query(index.move, moves):.1f}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,52 @@
+"""Compare whole-form queries on widget trees and on the columnar store.
+
+    python -m benchmarks.bench_store [WIDGETS]
+"""
+import sys
+import time
+
+from vpy.model.ui.loader import Loader
+from vpy.model.ui.base import Widget
+from vpy.uikits.tkinter import TkInterKit
+
+from .forms import generate_form
+
+
+def _walk(root: Widget):
+    stack = [root]
+    while stack:
+        widget = stack.pop()
+        yield widget
+        stack.extend(getattr(widget, "children", ()))
+
+
+def _timed(fn, *args) -> tuple[float, object]:
+    start = time.perf_counter()
+    result = fn(*args)
+    return time.perf_counter() - start, result
+
+
+def main(widgets: int = 100_000) -> None:
+    lines = list(generate_form(widgets))
+    load = Loader(get_class=TkInterKit().widget_class_factory)
+    tree_load, root = _timed(load, lines)
+    store_load, store = _timed(load.load_store, lines)
+    print(f"{widgets} widgets")
+    print(f"{'':>14}  {'tree':>8}  {'store':>8}")
+    print(f"{'load':>14}  {tree_load:>8.3f}  {store_load:>8.3f}")
+    tree_query, _ = _timed(
+        lambda: [w for w in _walk(root) if w.grid_row == 3]
+    )
+    store_query, _ = _timed(store.in_grid_row, 3)
+    print(f"{'grid row scan':>14}  {tree_query:>8.3f}  {store_query:>8.3f}")
+    tree_sticky, _ = _timed(
+        lambda: [w for w in _walk(root) if w.stick_west]
+    )
+    store_sticky, _ = _timed(store.stuck_to, "west")
+    print(f"{'sticky scan':>14}  {tree_sticky:>8.3f}  {store_sticky:>8.3f}")
+    collisions, _ = _timed(lambda: list(store.grid_collisions()))
+    print(f"{'collisions':>14}  {'':>8}  {collisions:>8.3f}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
@@ -0,0 +1,45 @@
+"""Measure validating a large form against loading it.
+
+The form gets a few duplicate names, cycles and overlapping widgets
+added at its end, all of which are reported in a single pass.
+
+    python -m benchmarks.bench_validate [WIDGETS]
+"""
+import sys
+import time
+
+from vpy.model.ui.loader import Loader
+from vpy.model.ui.validation import Validator
+from vpy.uikits.tkinter import TkInterKit
+
+from .forms import generate_form
+
+
+def main(widgets: int = 100_000) -> None:
+    get_class = TkInterKit().widget_class_factory
+    lines = list(generate_form(widgets))
+
+    start = time.perf_counter()
+    Loader(get_class=get_class)(lines)
+    load_time = time.perf_counter() - start
+
+    broken = lines + [
+        "[Button1]", "class: Button",
+        "[Loop1]", "class: Frame", "parent: Loop2",
+        "[Loop2]", "class: Frame", "parent: Loop1",
+        "[Overlap1]", "class: Button", "parent: Frame0",
+        "grid_row: 1", "grid_column: 0", "grid_columnspan: 3",
+    ]
+    start = time.perf_counter()
+    problems = Validator(get_class=get_class)(broken)
+    validate_time = time.perf_counter() - start
+
+    print(f"{widgets} widgets")
+    print(f"    load: {load_time * 1e3:.0f}ms")
+    print(f"validate: {validate_time * 1e3:.0f}ms, {len(problems)} problems")
+    for problem in problems:
+        print(f"  {problem.kind}: {problem.message}")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:]))
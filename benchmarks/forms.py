@@ -0,0 +1,95 @@
+"""Synthetic UI definition generators for the benchmarks."""
+from collections import deque
+from collections.abc import Iterator
+
+
+def generate_form(widgets: int, fanout: int = 10) -> Iterator[str]:
+    """Yield the lines of a UI definition with the given amount of widgets.
+
+    Widgets are laid out as a tree where every frame holds up to
+    `fanout` children, the last one of which is a frame as well.
+    """
+    yield "[Frame0]"
+    yield "class: Frame"
+    yield ""
+    parent = 0
+    for i in range(1, widgets):
+        is_frame = i % fanout == 0
+        yield f"[{'Frame' if is_frame else 'Button'}{i}]"
+        yield f"class: {'Frame' if is_frame else 'Button'}"
+        yield f"parent: Frame{parent}"
+        yield f"grid_row: {i % fanout}"
+        yield "grid_column: 0"
+        yield "stick_west: yes"
+        if not is_frame:
+            yield f"text: Button number {i}"
+        yield ""
+        if is_frame:
+            parent = i
+
+
+def write_form(path: str, widgets: int, fanout: int = 10) -> None:
+    with open(path, "w") as f:
+        for line in generate_form(widgets, fanout):
+            f.write(line)
+            f.write("\n")
+
+
+# Optional fields set on generated widgets, in the order field density
+# adds them, with their values by widget number and row in the parent
+FIELDS = [
+    ("grid_row", lambda i, row: row),
+    ("grid_column", lambda i, row: 0),
+    ("stick_west", lambda i, row: "yes"),
+    ("text", lambda i, row: f"Button number {i}"),
+    ("margin_x", lambda i, row: 2),
+    ("margin_y", lambda i, row: 2),
+    ("padding_x", lambda i, row: 1),
+    ("padding_y", lambda i, row: 1),
+    ("stick_east", lambda i, row: "no"),
+    ("stick_north", lambda i, row: "no"),
+    ("stick_south", lambda i, row: "no"),
+    ("grid_columnspan", lambda i, row: 1),
+    ("grid_rowspan", lambda i, row: 1),
+]
+
+
+def generate_tree_form(
+    widgets: int, *, fanout: int, depth: int, density: float = 0.3
+) -> Iterator[str]:
+    """Yield the lines of a UI definition shaped as a balanced tree.
+
+    Frames are filled breadth first with `fanout` children each, half of
+    which are frames as long as the tree is less than `depth` levels
+    deep. `density` is the fraction of the optional fields in `FIELDS`
+    every widget sets.
+    """
+    field_count = round(density * len(FIELDS))
+    yield "[Frame0]"
+    yield "class: Frame"
+    yield ""
+    # (name, level) of the frames that still have room for children
+    frames = deque([("Frame0", 1)])
+    child_count = 0
+    for i in range(1, widgets):
+        if not frames:
+            raise ValueError(
+                f"{widgets} widgets do not fit in {depth} levels"
+                f" of {fanout} children"
+            )
+        parent, level = frames[0]
+        is_frame = level < depth and child_count < max(1, fanout // 2)
+        cls = "Frame" if is_frame else "Button"
+        yield f"[{cls}{i}]"
+        yield f"class: {cls}"
+        yield f"parent: {parent}"
+        for name, value in FIELDS[:field_count]:
+            if name != "text" or not is_frame:
+                yield f"{name}: {value(i, child_count)}"
+        yield ""
+        if is_frame:
+            frames.append((f"Frame{i}", level + 1))
+        child_count += 1
+        if child_count == fanout:
+            frames.popleft()
+            child_count = 0
@@ -0,0 +1,158 @@
+"""Headless benchmark suite, compared against a stored baseline.
+
+Runs every case in `CASES`, a synthetic form of a given size and shape,
+through parsing, loading, tree building and tkinter code generation,
+and measures the memory the loaded model takes per widget. Times are
+per call, the best of several rounds. Results are written as JSON, and
+every metric that is worse than the baseline by more than the tolerance
+is reported and makes the run fail. Timings vary between machines and
+from run to run on shared ones, so the default tolerance only catches
+slowdowns of 2x or more; store a baseline on the machine the suite runs
+on. Run with:
+
+    python -m benchmarks.suite [--output FILE] [--baseline FILE]
+        [--tolerance FRACTION] [--repeat N] [--update-baseline]
+"""
+from argparse import ArgumentParser
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from timeit import Timer
+import json
+import platform
+import sys
+import tracemalloc
+
+from vpy.model.ui.loader import Loader
+from vpy.model.ui.parser import parse_sections
+from vpy.uikits.tkinter import TkInterKit
+
+from .forms import generate_tree_form
+
+
+BASELINE = Path(__file__).with_name("baseline.json")
+
+
+@dataclass(kw_only=True, frozen=True)
+class Case:
+    name: str
+    widgets: int
+    fanout: int
+    depth: int
+    density: float
+
+
+CASES = [
+    Case(name="small", widgets=200, fanout=10, depth=4, density=0.3),
+    Case(name="wide", widgets=5000, fanout=100, depth=3, density=0.3),
+    Case(name="deep", widgets=5000, fanout=4, depth=12, density=0.3),
+    Case(name="dense", widgets=5000, fanout=10, depth=5, density=1.0),
+]
+
+
+def _best_time(fn: Callable[[], object], repeat: int) -> float:
+    """Seconds per call, the best of `repeat` rounds of at least 0.2s"""
+    timer = Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number
+
+
+def _traced_bytes(fn: Callable[[], object]) -> int:
+    tracemalloc.start()
+    try:
+        result = fn()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return size
+
+
+def run_case(case: Case, repeat: int) -> dict[str, float]:
+    lines = list(generate_tree_form(
+        case.widgets, fanout=case.fanout, depth=case.depth, density=case.density
+    ))
+    get_class = TkInterKit().widget_class_factory
+    loader = Loader(get_class=get_class)
+    model = loader(lines)
+    _, namespace, children_map = loader._load_widgets(loader._parse_stream(lines))
+    return {
+        "parse_s": _best_time(lambda: list(parse_sections(lines)), repeat),
+        "load_s": _best_time(lambda: Loader(get_class=get_class)(lines), repeat),
+        "build_tree_s": _best_time(
+            lambda: loader._build_tree(namespace, children_map), repeat
+        ),
+        # A fresh kit every time, so no code is reused from the last run
+        "codegen_s": _best_time(
+            lambda: TkInterKit().compile_user_class_dec(model), repeat
+        ),
+        "bytes_per_widget":
+            _traced_bytes(lambda: Loader(get_class=get_class)(lines))
+            / case.widgets,
+    }
+
+
+def compare(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    tolerance: float,
+) -> list[str]:
+    """Describe every result worse than its baseline beyond the tolerance"""
+    regressions = []
+    for case_name, metrics in baseline.items():
+        for metric, expected in metrics.items():
+            actual = results.get(case_name, {}).get(metric)
+            if actual is None:
+                continue
+            if actual > expected * (1 + tolerance):
+                regressions.append(
+                    f"{case_name}.{metric}: {actual:.6g}"
+                    f" vs baseline {expected:.6g}"
+                    f" (+{(actual / expected - 1) * 100:.0f}%)"
+                )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = ArgumentParser(prog="python -m benchmarks.suite")
+    parser.add_argument("--output", type=Path, help="write results as JSON")
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument(
+        "--tolerance", type=float, default=1.0,
+        help="allowed slowdown as a fraction of the baseline",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--update-baseline", action="store_true",
+        help="store the results as the new baseline",
+    )
+    args = parser.parse_args(argv)
+
+    results = {}
+    for case in CASES:
+        results[case.name] = metrics = run_case(case, args.repeat)
+        print(f"{case.name:>6} ({case.widgets} widgets): " + ", ".join(
+            f"{metric}={value:.4g}" for metric, value in metrics.items()
+        ))
+    report = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2) + "\n")
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n")
+        return 0
+    if not args.baseline.exists():
+        print(f"No baseline at {args.baseline}, nothing to compare")
+        return 0
+    baseline = json.loads(args.baseline.read_text())["results"]
+    regressions = compare(results, baseline, args.tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
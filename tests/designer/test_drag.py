@@ -0,0 +1,79 @@
+import unittest
+from unittest.mock import Mock, patch, sentinel
+
+from vpy.designer.drag import DragCoalescer
+
+
+class TestDragCoalescer(unittest.TestCase):
+    def setUp(self):
+        self.widget = Mock()
+        self.widget.after.return_value = sentinel.after_id
+        self.widget.after_idle.return_value = sentinel.idle_id
+        self.handler = Mock()
+        self.coalescer = DragCoalescer(self.widget, frame_interval_ms=16)
+        patcher = patch("vpy.designer.drag.perf_counter", return_value=64.0)
+        self.perf_counter = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def run_scheduled(self, method):
+        callback = getattr(self.widget, method).call_args.args[-1]
+        getattr(self.widget, method).reset_mock()
+        callback()
+
+    def test_events_coalesced_into_one_frame(self):
+        for event in (sentinel.event1, sentinel.event2, sentinel.event3):
+            self.coalescer.push(self.handler, event)
+
+        self.widget.after_idle.assert_called_once()
+        self.handler.assert_not_called()
+
+        self.run_scheduled("after_idle")
+
+        self.handler.assert_called_once_with(sentinel.event3)
+        self.assertEqual(self.coalescer.stats.events, 3)
+        self.assertEqual(self.coalescer.stats.frames, 1)
+        self.assertEqual(self.coalescer.stats.coalesced, 2)
+
+    def test_one_frame_per_interval(self):
+        self.coalescer.push(self.handler, sentinel.event1)
+        self.run_scheduled("after_idle")
+
+        # 7.8125ms later
+        self.perf_counter.return_value = 64.0078125
+        self.coalescer.push(self.handler, sentinel.event2)
+        self.widget.after_idle.assert_not_called()
+        self.widget.after.assert_called_once()
+        self.assertEqual(self.widget.after.call_args.args[0], 9)
+
+        self.run_scheduled("after")
+        self.perf_counter.return_value = 64.03125
+        self.coalescer.push(self.handler, sentinel.event3)
+        self.widget.after_idle.assert_called_once()
+
+    def test_flush(self):
+        self.coalescer.flush()
+        self.handler.assert_not_called()
+
+        self.coalescer.push(self.handler, sentinel.event1)
+        self.coalescer.flush()
+
+        self.widget.after_cancel.assert_called_once_with(sentinel.idle_id)
+        self.handler.assert_called_once_with(sentinel.event1)
+
+        self.coalescer.flush()
+        self.handler.assert_called_once()
+
+    def test_frame_times(self):
+        self.perf_counter.side_effect = [100.0, 100.0, 100.004, 100.1, 100.1, 100.102]
+        self.coalescer.push(self.handler, sentinel.event1)
+        self.coalescer.flush()
+        self.coalescer.push(self.handler, sentinel.event2)
+        self.coalescer.flush()
+
+        self.assertAlmostEqual(self.coalescer.stats.frame_time, 0.006)
+        self.assertAlmostEqual(self.coalescer.stats.max_frame_time, 0.004)
+        self.assertAlmostEqual(self.coalescer.stats.mean_frame_time, 0.003)
+
+
+if __name__ == "__main__":
+    unittest.main()
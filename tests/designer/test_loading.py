@@ -0,0 +1,136 @@
+import unittest
+from itertools import count
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from textwrap import dedent
+from threading import Event
+from unittest.mock import Mock, patch, sentinel
+
+from vpy.designer.loading import AsyncFormLoader
+from vpy.model.ui.loader import Loader, LoaderError
+from vpy.model.ui.widgets import Button
+from vpy.model.ui.layout_widgets import Frame
+
+
+UI_DEF = dedent(
+    """\
+    [Frame1]
+    class: Frame
+
+    [Frame2]
+    class: Frame
+    parent: Frame1
+
+    [Button1]
+    class: Button
+    parent: Frame2
+
+    [Button2]
+    class: Button
+    parent: Frame1
+    """
+)
+
+
+class TestAsyncFormLoader(unittest.TestCase):
+    def setUp(self):
+        tmpdir = TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.path = Path(tmpdir.name) / "form.ini"
+        self.path.write_text(UI_DEF)
+        self.widget = Mock()
+        self.widget.after.return_value = sentinel.after_id
+        self.place = Mock()
+        self.on_progress = Mock()
+        self.on_done = Mock()
+        self.on_error = Mock()
+        self.loader = AsyncFormLoader(
+            self.widget,
+            Loader(get_class={"Button": Button, "Frame": Frame}.get),
+            self.place,
+            on_progress=self.on_progress,
+            on_done=self.on_done,
+            on_error=self.on_error,
+        )
+
+    def run_event_loop(self):
+        """Run scheduled callbacks until none are left"""
+        self.loader._thread.join()
+        while self.widget.after.call_count:
+            callback = self.widget.after.call_args.args[-1]
+            self.widget.after.reset_mock()
+            callback()
+
+    def test_load(self):
+        self.loader.start(self.path)
+        self.run_event_loop()
+
+        self.assertEqual(
+            [call.args[0].name for call in self.place.call_args_list],
+            ["Frame1", "Frame2", "Button1", "Button2"],
+        )
+        self.on_progress.assert_called_once_with(4, 4)
+        self.on_done.assert_called_once_with(self.loader.model)
+        self.on_error.assert_not_called()
+        self.assertFalse(self.loader.running)
+        self.assertEqual(self.loader.stats.batches, 1)
+        self.assertEqual(self.loader.stats.placed, 4)
+
+    def test_time_sliced(self):
+        # Every placed widget takes 5ms
+        clock = (i * 0.005 for i in count())
+        with patch("vpy.designer.loading.perf_counter", lambda: next(clock)):
+            self.loader.start(self.path)
+            self.run_event_loop()
+
+        self.assertEqual(
+            [call.args for call in self.on_progress.call_args_list],
+            [(2, 4), (4, 4)],
+        )
+        self.assertEqual(self.loader.stats.batches, 2)
+        self.on_done.assert_called_once()
+
+    def test_error(self):
+        self.path.write_text("[Frame1]\nclass: Nope\n")
+        self.loader.start(self.path)
+        self.run_event_loop()
+
+        self.on_error.assert_called_once()
+        self.assertIsInstance(self.on_error.call_args.args[0], LoaderError)
+        self.place.assert_not_called()
+        self.on_done.assert_not_called()
+
+    def test_cancel_while_loading(self):
+        reading = Event()
+        resume = Event()
+
+        def slow_load(lines):
+            for line in lines:
+                reading.set()
+                resume.wait()
+            return Frame(name="Frame1")
+
+        self.loader.load = slow_load
+        self.loader.start(self.path)
+        reading.wait()
+        self.loader.cancel()
+        resume.set()
+        self.loader._thread.join()
+
+        self.widget.after_cancel.assert_called_once_with(sentinel.after_id)
+        self.assertTrue(self.loader._results.empty())
+        self.on_error.assert_not_called()
+
+    def test_cancel_while_placing(self):
+        self.on_progress.side_effect = lambda placed, total: self.loader.cancel()
+        clock = (i * 0.005 for i in count())
+        with patch("vpy.designer.loading.perf_counter", lambda: next(clock)):
+            self.loader.start(self.path)
+            self.run_event_loop()
+
+        self.assertEqual(self.place.call_count, 2)
+        self.on_done.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
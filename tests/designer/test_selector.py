@@ -0,0 +1,123 @@
+import unittest
+from unittest.mock import MagicMock, Mock, patch
+
+from vpy.main import WidgetSelector
+
+
+class TestWidgetSelector(unittest.TestCase):
+    def setUp(self):
+        # No display is needed, as the canvas, the control point widgets
+        # and the coalescer are mocked
+        for name in ("Canvas", "DragCoalescer"):
+            patcher = patch(f"vpy.main.{name}")
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.canvas = Mock()
+        self.canvas.bbox.return_value = (10, 20, 50, 40)
+        self.canvas.canvasx.side_effect = self.canvas.canvasy.side_effect = \
+            lambda coord: coord
+        self.selector = WidgetSelector(self.canvas)
+        self.drag = self.selector.drag
+        self.handlers = {
+            call.args[1]: call.args[2]
+            for call in self.canvas.bind_class.call_args_list
+            if call.args[0] == self.selector.bind_tag
+        }
+        self.canvas_handlers = {
+            call.args[0]: call.args[1]
+            for call in self.canvas.bind.call_args_list
+        }
+        self.widget = self.mk_widget(".canvas.button1")
+        self.selector.manage_widget(self.widget, 7)
+
+    @staticmethod
+    def mk_widget(path):
+        widget = MagicMock()
+        widget.__str__.return_value = path
+        widget.winfo_x.return_value = 10
+        widget.winfo_y.return_value = 20
+        widget.winfo_width.return_value = 40
+        widget.winfo_height.return_value = 20
+        return widget
+
+    def dispatch(self, sequence, widget, x=0, y=0):
+        event = Mock(widget=widget, x=x, y=y)
+        self.handlers[sequence](event)
+        return event
+
+    def test_unmanaged_widget_ignored(self):
+        other = self.mk_widget(".canvas.button2")
+        self.dispatch("<Button-1>", other)
+        self.dispatch("<Motion>", other)
+
+        self.assertIsNone(self.selector.widget)
+        self.assertFalse(self.selector.dragging)
+        self.drag.push.assert_not_called()
+
+    def test_motion_pushed_only_while_dragging(self):
+        self.dispatch("<Motion>", self.widget, 5, 5)
+        self.drag.push.assert_not_called()
+
+        self.dispatch("<Button-1>", self.widget, 1, 2)
+        self.assertIs(self.selector.widget, self.widget)
+        self.assertEqual(self.selector.canvas_id, 7)
+        self.assertEqual(self.selector.drag_origin, (1, 2))
+        self.assertTrue(self.selector.dragging)
+
+        event = self.dispatch("<Motion>", self.widget, 5, 5)
+        self.drag.push.assert_called_once_with(
+            self.selector._drag_position, event
+        )
+
+    def test_release_flushes_and_ends_drag(self):
+        self.dispatch("<ButtonRelease-1>", self.widget)
+        self.drag.flush.assert_not_called()
+
+        self.dispatch("<Button-1>", self.widget)
+        self.dispatch("<Motion>", self.widget, 5, 5)
+        self.dispatch("<ButtonRelease-1>", self.widget, 5, 5)
+
+        self.drag.flush.assert_called_once_with()
+        self.assertFalse(self.selector.dragging)
+        self.drag.push.reset_mock()
+        self.dispatch("<Motion>", self.widget, 6, 6)
+        self.drag.push.assert_not_called()
+
+    def rubber_band(self, x0, y0, x1, y1):
+        self.canvas_handlers["<Button-1>"](Mock(x=x0, y=y0))
+        self.canvas_handlers["<ButtonRelease-1>"](Mock(x=x1, y=y1))
+
+    def test_rubber_band_selects_one_widget(self):
+        self.rubber_band(0, 0, 60, 50)
+
+        self.assertEqual(self.selector.selection, [7])
+        self.assertIs(self.selector.widget, self.widget)
+        self.assertEqual(self.selector.canvas_id, 7)
+        # The control points are placed around the widget
+        self.assertEqual(
+            [call.args[:2] for call in self.canvas.create_window.call_args_list],
+            [(10, 20), (30, 20), (50, 20), (50, 30), (50, 40), (30, 40),
+             (10, 40), (10, 30)],
+        )
+
+    def test_empty_rubber_band_hides_control_points(self):
+        self.dispatch("<Button-1>", self.widget)
+        self.dispatch("<ButtonRelease-1>", self.widget)
+        self.rubber_band(100, 100, 120, 120)
+
+        self.assertEqual(self.selector.selection, [])
+        self.assertIsNone(self.selector.widget)
+        self.assertIsNone(self.selector.canvas_id)
+        self.canvas.itemconfigure.assert_called_with(
+            self.selector.ctrl_pts_tag, state="hidden"
+        )
+
+        # They are shown again once a widget is selected
+        self.dispatch("<Button-1>", self.widget)
+        self.canvas.itemconfigure.assert_called_with(
+            self.selector.ctrl_pt_handles[-1], state="normal"
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+import random
+import unittest
+
+from vpy.designer.spatial import SpatialIndex
+
+
+class TestSpatialIndex(unittest.TestCase):
+    def setUp(self):
+        self.index = SpatialIndex(cell_size=50)
+        self.index.insert("a", (10, 10, 60, 40))
+        self.index.insert("b", (40, 20, 140, 120))
+        self.index.insert("c", (300, 300, 320, 310))
+
+    def test_at_point(self):
+        for point, expected in [
+            ((10, 10), ["a"]),
+            ((50, 30), ["a", "b"]),
+            ((60, 30), ["b"]),
+            ((310, 305), ["c"]),
+            ((200, 200), []),
+            ((-10, -10), []),
+        ]:
+            with self.subTest(point=point):
+                self.assertEqual(self.index.at_point(*point), expected)
+
+    def test_in_rect(self):
+        for rect, enclosed, expected in [
+            ((0, 0, 200, 200), False, ["a", "b"]),
+            ((200, 200, 0, 0), False, ["a", "b"]),
+            ((0, 0, 200, 200), True, ["a", "b"]),
+            ((0, 0, 100, 100), False, ["a", "b"]),
+            ((0, 0, 100, 100), True, ["a"]),
+            ((0, 0, 1000, 1000), True, ["a", "b", "c"]),
+            ((150, 150, 250, 250), False, []),
+        ]:
+            with self.subTest(rect=rect, enclosed=enclosed):
+                self.assertEqual(
+                    self.index.in_rect(rect, enclosed=enclosed), expected
+                )
+
+    def test_move_resize_remove(self):
+        self.index.move("c", -290, -290)
+        self.assertEqual(self.index.bbox("c"), (10, 10, 30, 20))
+        self.assertEqual(self.index.at_point(15, 15), ["a", "c"])
+        self.assertEqual(self.index.at_point(310, 305), [])
+
+        self.index.resize("b", 400, 10)
+        self.assertEqual(self.index.at_point(400, 25), ["b"])
+        self.assertEqual(self.index.at_point(100, 100), [])
+
+        self.index.remove("a")
+        self.assertNotIn("a", self.index)
+        self.assertEqual(len(self.index), 2)
+        self.assertEqual(self.index.at_point(15, 15), ["c"])
+
+    def test_snap(self):
+        for bbox, expected in [
+            # Left edge 3 right of the right edge of "a"
+            ((63, 200, 83, 210), (0, 0)),
+            # ... and top edge 5 above the bottom edge of "a"
+            ((63, 35, 83, 45), (-3, 5)),
+            # Bottom edge 2 above the top edge of "c"
+            ((302, 288, 322, 298), (-2, 2)),
+            ((500, 500, 520, 520), (0, 0)),
+        ]:
+            with self.subTest(bbox=bbox):
+                self.assertEqual(self.index.snap(bbox, 5), expected)
+
+    def test_snap_exclude(self):
+        self.assertEqual(self.index.snap((12, 11, 62, 41), 5), (-2, -1))
+        self.assertEqual(
+            self.index.snap((12, 11, 62, 41), 5, exclude="a"), (0, 0)
+        )
+
+    def test_matches_linear_scan(self):
+        rnd = random.Random(42)
+        index = SpatialIndex(cell_size=32)
+        bboxes = {}
+        for key in range(300):
+            x, y = rnd.uniform(-500, 500), rnd.uniform(-500, 500)
+            bboxes[key] = (x, y, x + rnd.uniform(1, 200), y + rnd.uniform(1, 80))
+            index.insert(key, bboxes[key])
+        for key in range(0, 300, 3):
+            dx, dy = rnd.uniform(-100, 100), rnd.uniform(-100, 100)
+            index.move(key, dx, dy)
+            x0, y0, x1, y1 = bboxes[key]
+            bboxes[key] = (x0 + dx, y0 + dy, x1 + dx, y1 + dy)
+
+        for _ in range(50):
+            x, y = rnd.uniform(-500, 500), rnd.uniform(-500, 500)
+            self.assertEqual(index.at_point(x, y), [
+                key for key, (x0, y0, x1, y1) in bboxes.items()
+                if x0 <= x < x1 and y0 <= y < y1
+            ])
+            rect = (x, y, x + rnd.uniform(0, 300), y + rnd.uniform(0, 300))
+            self.assertEqual(index.in_rect(rect), [
+                key for key, (x0, y0, x1, y1) in bboxes.items()
+                if x0 < rect[2] and rect[0] < x1 and y0 < rect[3] and rect[1] < y1
+            ])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,118 @@
+import unittest
+from itertools import count
+from unittest.mock import Mock, call
+
+from vpy.designer.spatial import SpatialIndex
+from vpy.designer.virtual import VirtualCanvas
+
+
+class TestVirtualCanvas(unittest.TestCase):
+    def setUp(self):
+        self.canvas = Mock()
+        ids = count(1)
+        for method in ("create_rectangle", "create_text", "create_window"):
+            getattr(self.canvas, method).side_effect = lambda *a, **kw: next(ids)
+        self.scroll = [0, 0]
+        self.canvas.canvasx.side_effect = lambda x: x + self.scroll[0]
+        self.canvas.canvasy.side_effect = lambda y: y + self.scroll[1]
+        self.canvas.winfo_width.return_value = 200
+        self.canvas.winfo_height.return_value = 100
+        self.widget_class = Mock(__name__="Button")
+        self.widget_class.side_effect = lambda *a, **kw: Mock()
+        self.selector = Mock(index=SpatialIndex(), listeners=[], canvas_id=None)
+        self.virtual = VirtualCanvas(self.canvas, self.selector, margin=0)
+        # Items 50x20 in a 10x10 grid, 100 apart
+        self.keys = {
+            (col, row): self.virtual.add(
+                self.widget_class,
+                (col * 100, row * 100, col * 100 + 50, row * 100 + 20),
+                text=f"{col},{row}",
+            )
+            for row in range(10) for col in range(10)
+        }
+
+    def window_ids(self):
+        return sorted(
+            self.virtual._items[self.keys[pos]].window[1]
+            for pos in self.realized()
+        )
+
+    def realized(self):
+        return sorted(
+            pos for pos, key in self.keys.items()
+            if self.virtual.widget(key) is not None
+        )
+
+    def test_only_visible_realized(self):
+        self.virtual.refresh()
+
+        self.assertEqual(self.realized(), [(0, 0), (1, 0)])
+        self.assertEqual(self.widget_class.call_count, 2)
+        self.widget_class.assert_any_call(self.canvas, text="0,0")
+        self.assertEqual(
+            self.selector.manage_widget.call_count, 2
+        )
+        self.assertEqual(len(self.selector.index), 2)
+
+    def test_scroll_recycles_widgets(self):
+        self.virtual.refresh()
+        self.scroll[:] = [500, 300]
+        self.virtual.yview("moveto", 0.3)
+        self.canvas.after_idle.assert_called()
+        self.virtual.refresh()
+
+        self.assertEqual(self.realized(), [(5, 3), (6, 3)])
+        self.assertEqual(self.widget_class.call_count, 2)
+        self.assertEqual(self.virtual.stats.recycled, 2)
+        self.assertEqual(self.virtual.stats.realized, 4)
+        window_id = self.virtual._items[self.keys[5, 3]].window[1]
+        self.canvas.coords.assert_any_call(window_id, 500, 300)
+        self.canvas.itemconfigure.assert_any_call(
+            window_id, width=50, height=20, state="normal"
+        )
+        self.assertEqual(
+            sorted(self.selector.index.in_rect((0, 0, 1000, 1000))),
+            self.window_ids(),
+        )
+
+    def test_selected_widget_kept(self):
+        self.virtual.refresh()
+        self.selector.canvas_id = \
+            self.virtual._items[self.keys[0, 0]].window[1]
+        self.scroll[:] = [500, 0]
+        self.virtual.refresh()
+
+        self.assertEqual(self.realized(), [(0, 0), (5, 0), (6, 0)])
+        self.assertEqual(self.widget_class.call_count, 3)
+
+    def test_follows_selector(self):
+        self.virtual.refresh()
+        key = self.keys[1, 0]
+        window_id = self.virtual._items[key].window[1]
+        self.selector.listeners[0](window_id, (110, 10, 200, 30))
+
+        self.assertEqual(self.virtual.bbox(key), (110, 10, 200, 30))
+        self.assertEqual(self.virtual.index.at_point(190, 20), [key])
+        self.canvas.coords.assert_has_calls([
+            call(key, 110, 10, 200, 30),
+            call(key + 1, 155, 20),
+        ])
+
+    def test_stale_options_reset(self):
+        widget = Mock()
+        widget.configure.side_effect = \
+            lambda *a, **kw: ("width", "width", "Width", 0, 5) if a else None
+        widget_class = Mock(return_value=widget, __name__="Button")
+        virtual = VirtualCanvas(self.canvas, margin=0)
+        virtual.add(widget_class, (0, 0, 10, 10), text="a", width=5)
+        virtual.refresh()
+        self.scroll[:] = [1000, 0]
+        virtual.add(widget_class, (1000, 0, 1010, 10), text="b")
+        virtual.refresh()
+
+        widget_class.assert_called_once()
+        widget.configure.assert_has_calls([call({"width": 0}), call(text="b")])
+
+
+if __name__ == "__main__":
+    unittest.main()
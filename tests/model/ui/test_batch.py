@@ -0,0 +1,87 @@
+import unittest
+from tempfile import TemporaryDirectory
+from textwrap import dedent
+from pathlib import Path
+
+from vpy.model.ui.batch import load_many, resolve_kit
+from vpy.model.ui.loader import Loader, LoaderError
+from vpy.uikits.tkinter import TkInterKit
+
+
+KIT = "vpy.uikits.tkinter:TkInterKit"
+
+
+class TestLoadMany(unittest.TestCase):
+    def setUp(self):
+        tmpdir = TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.tmpdir = Path(tmpdir.name)
+
+    def write(self, name: str, text: str) -> Path:
+        path = self.tmpdir / name
+        path.write_text(dedent(text))
+        return path
+
+    def test_load_many(self):
+        good = [
+            self.write(
+                f"form{i}.ini",
+                f"""\
+                [Frame1]
+                class: Frame
+                [Button{i}]
+                class: Button
+                parent: Frame1
+                text: Button {i}
+                """
+            )
+            for i in range(4)
+        ]
+        bad = self.write(
+            "bad.ini",
+            """\
+            [Widget1]
+            class: NoSuchClass
+            """
+        )
+        missing = self.tmpdir / "missing.ini"
+        unsupported = self.write(
+            "unsupported.ini",
+            """\
+            [Frame1]
+            class: Frame
+            children: Button1
+            """
+        )
+        paths = [good[0], bad, good[1], missing, good[2], unsupported, good[3]]
+
+        results = load_many(paths, KIT, max_workers=2)
+
+        self.assertEqual([r.path for r in results], paths)
+        load = Loader(get_class=TkInterKit().widget_class_factory)
+        for path, result in zip(paths, results):
+            with self.subTest(path.name):
+                if path in good:
+                    self.assertIsNone(result.error)
+                    with open(path) as f:
+                        self.assertEqual(result.widget, load(f))
+                else:
+                    self.assertIsNone(result.widget)
+                    self.assertIsInstance(result.error, LoaderError)
+        self.assertEqual(
+            str(results[1].error), "Invalid widget class: 'NoSuchClass'"
+        )
+        self.assertRegex(str(results[3].error), "^Cannot read .*missing.ini")
+        self.assertRegex(
+            str(results[5].error), "^Unsupported Widget field type"
+        )
+
+    def test_resolve_kit(self):
+        self.assertIsInstance(resolve_kit(KIT), TkInterKit)
+        self.assertIsInstance(resolve_kit("tkinter"), TkInterKit)
+        with self.assertRaisesRegex(ValueError, "Unknown UI kit"):
+            resolve_kit("TkInterKit")
+
+
+if __name__ == "__main__":
+    unittest.main()
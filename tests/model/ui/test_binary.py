@@ -0,0 +1,91 @@
+import unittest
+from io import BytesIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from vpy.model.ui.binary import MAGIC, BinaryLoader, save_binary, write_binary
+from vpy.model.ui.layout_widgets import Frame
+from vpy.model.ui.loader import LoaderError
+from vpy.model.ui.widgets import Button
+from vpy.uikits.tkinter import TkInterKit
+
+
+class TestBinary(unittest.TestCase):
+    def setUp(self):
+        self.load = BinaryLoader(get_class=TkInterKit().widget_class_factory)
+        self.root = Frame(name="Frame1", children=[
+            Button(name="Button1", grid_row=0, grid_column=-300, text="One"),
+            Frame(name="Frame2", grid_row=1, stick_east=True, children=[
+                Button(name="Button2", text=" Two\r\n\n"),
+                Button(name="Button3", text="One", stick_west=True),
+            ]),
+            Frame(name="Frame3", padding_x=1000),
+        ])
+
+    def dump(self, root):
+        out = BytesIO()
+        write_binary(root, out)
+        return out.getvalue()
+
+    def test_round_trip(self):
+        data = self.dump(self.root)
+        self.assertTrue(data.startswith(MAGIC))
+        self.assertEqual(self.load(data), self.root)
+
+        tmpdir = TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        path = Path(tmpdir.name) / "form.vpyb"
+        save_binary(self.root, path)
+        self.assertEqual(path.read_bytes(), data)
+        self.assertEqual(self.load.load_file(path), self.root)
+
+    def test_strings_written_once(self):
+        data = self.dump(self.root)
+        for string, count in [
+            # Length prefixed, to tell them from the widget names
+            (b"\x06Button", 1),
+            (b"\x05Frame", 1),
+            (b"grid_row", 1),
+            (b"One", 1),
+        ]:
+            with self.subTest(string):
+                self.assertEqual(data.count(string), count)
+
+    def test_invalid_data_detected(self):
+        data = self.dump(self.root)
+        header = len(MAGIC)
+        for name, invalid_data, err_re in [
+            ("No magic", data[header:], "^Not a binary UI definition$"),
+            ("Empty", MAGIC, "^Root widget not found!$"),
+            ("Truncated", data[:-2], "^Truncated binary UI definition$"),
+            (
+                "Unknown class",
+                data.replace(b"Frame", b"Frumo"),
+                "^Invalid widget class: 'Frumo'$",
+            ),
+            (
+                "Unknown field",
+                data.replace(b"grid_row", b"grid_rew"),
+                "^Invalid field for Button: 'grid_rew'$",
+            ),
+            (
+                "Bad string reference",
+                MAGIC + bytes([9]),
+                "^Invalid string reference: 9$",
+            ),
+            (
+                "Two roots",
+                data + self.dump(Frame(name="Frame1"))[header:],
+                "^Attempt to set 'Frame1' as root",
+            ),
+        ]:
+            with self.subTest(name):
+                with self.assertRaisesRegex(LoaderError, err_re):
+                    self.load(invalid_data)
+
+        with self.assertRaisesRegex(ValueError, "^Cannot write Button1.text"):
+            self.dump(Button(name="Button1", text=1.5))
+
+
+if __name__ == "__main__":
+    unittest.main()
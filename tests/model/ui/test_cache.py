@@ -0,0 +1,116 @@
+import unittest
+from unittest.mock import patch
+from tempfile import TemporaryDirectory
+from textwrap import dedent
+from pathlib import Path
+
+from vpy.model.ui.widgets import Button
+from vpy.model.ui.layout_widgets import Frame
+from vpy.model.ui.cache import CachingLoader, CACHE_DIR_NAME
+from vpy.model.ui.loader import LoaderError
+from vpy.uikits.tkinter import TkInterKit
+
+
+class TestCachingLoader(unittest.TestCase):
+    def setUp(self):
+        tmpdir = TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.tmpdir = Path(tmpdir.name)
+        self.path = self.tmpdir / "form.ini"
+        self.path.write_text(dedent(
+            """\
+            [Frame1]
+            class: Frame
+            [Button1]
+            class: Button
+            parent: Frame1
+            grid_row: 1
+            stick_north: yes
+            text: Big, red button!
+            [Frame2]
+            class: Frame
+            parent: Frame1
+            [Button2]
+            class: Button
+            parent: Frame2
+            """
+        ))
+        self.expected = Frame(
+            name="Frame1",
+            children=[
+                Button(
+                    name="Button1", grid_row=1, stick_north=True,
+                    text="Big, red button!",
+                ),
+                Frame(name="Frame2", children=[Button(name="Button2")]),
+            ],
+        )
+        self.load = CachingLoader(get_class=TkInterKit().widget_class_factory)
+
+    def load_without_parsing(self):
+        with patch("vpy.model.ui.loader.parse_sections") as parse_sections:
+            out = self.load(self.path)
+        parse_sections.assert_not_called()
+        return out
+
+    def test_warm_load_skips_parsing(self):
+        cold = self.load(self.path)
+        self.assertTrue(
+            (self.tmpdir / CACHE_DIR_NAME / "form.ini.vpyc").exists()
+        )
+        warm = self.load_without_parsing()
+
+        self.assertEqual(cold, self.expected)
+        self.assertEqual(warm, self.expected)
+        self.assertIsNot(warm, cold)
+
+    def test_custom_cache_dir(self):
+        self.load.cache_dir = self.tmpdir / "cache"
+        self.load(self.path)
+
+        self.assertEqual(len(list(self.load.cache_dir.iterdir())), 1)
+        self.assertEqual(self.load_without_parsing(), self.expected)
+
+    def test_undecodable_definition(self):
+        self.path.write_bytes(b"[Frame1]\nclass: \xff\n")
+        with self.assertRaisesRegex(LoaderError, "^Cannot decode .*form.ini"):
+            self.load(self.path)
+
+    def test_stale_entries_rebuilt(self):
+        self.load(self.path)
+        cache_path = self.load.cache_path(self.path)
+        cases = [
+            (
+                "Changed definition",
+                lambda: self.path.write_text(
+                    self.path.read_text().replace("Big", "Small")
+                ),
+                "Small, red button!",
+            ),
+            (
+                "Corrupt cache",
+                lambda: cache_path.write_bytes(cache_path.read_bytes()[:-1]),
+                "Small, red button!",
+            ),
+            (
+                "Changed widget class",
+                lambda: setattr(
+                    self.load, "get_class",
+                    {"Frame": Frame, "Button": type("Button", (Button,), {})}.get
+                ),
+                "Small, red button!",
+            ),
+        ]
+        for st_name, invalidate, exp_text in cases:
+            with self.subTest(st_name):
+                invalidate()
+                out = self.load(self.path)
+                self.assertEqual(out.children[0].text, exp_text)
+                self.assertIs(
+                    type(out.children[0]), self.load.get_class("Button")
+                )
+                self.assertEqual(self.load_without_parsing(), out)
+
+
+if __name__ == "__main__":
+    unittest.main()
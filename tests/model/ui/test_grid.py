@@ -0,0 +1,46 @@
+import random
+import unittest
+
+from vpy.model.ui.grid import collisions
+
+
+def overlap(a, b):
+    _, row_a, rowspan_a, column_a, columnspan_a = a
+    _, row_b, rowspan_b, column_b, columnspan_b = b
+    return (
+        row_a < row_b + rowspan_b and row_b < row_a + rowspan_a
+        and column_a < column_b + columnspan_b
+        and column_b < column_a + columnspan_a
+    )
+
+
+class TestCollisions(unittest.TestCase):
+    def test_against_cells(self):
+        rnd = random.Random(0)
+        for trial in range(50):
+            with self.subTest(trial=trial):
+                cells = [
+                    (key, rnd.randrange(8), rnd.randint(1, 4),
+                     rnd.randrange(8), rnd.randint(1, 4))
+                    for key in range(rnd.randint(0, 12))
+                ]
+                expected = []
+                for cell in sorted(cells, key=lambda cell: (cell[1], cell[0])):
+                    above = [
+                        other[0] for other in cells
+                        if (other[1], other[0]) < (cell[1], cell[0])
+                        and overlap(cell, other)
+                    ]
+                    if above:
+                        expected.append((min(above), cell[0]))
+                self.assertEqual(list(collisions(cells)), expected)
+
+    def test_large_spans(self):
+        # As many rows as widgets, but no cells are gone through
+        cells = [(key, 0, 10**9, key, 1) for key in range(1000)]
+        cells.append((1000, 10**8, 1, 0, 1000))
+        self.assertEqual(list(collisions(cells)), [(0, 1000)])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,202 @@
+import unittest
+from textwrap import dedent
+
+from vpy.model.ui.history import (
+    History, Node, insert_child, node_at, path_to, remove_child, set_fields,
+    snapshot, sync,
+)
+from vpy.model.ui.layout_widgets import Frame
+from vpy.model.ui.loader import Loader
+from vpy.model.ui.widgets import Button
+from vpy.uikits.tkinter import TkInterKit
+
+
+CONFIG = dedent(
+    """\
+    [Frame1]
+    class: Frame
+    [Button1]
+    class: Button
+    parent: Frame1
+    grid_row: 0
+    text: One
+    [Frame2]
+    class: Frame
+    parent: Frame1
+    grid_row: 1
+    [Button2]
+    class: Button
+    parent: Frame2
+    stick_east: yes
+    [Button3]
+    class: Button
+    parent: Frame2
+    grid_column: 1
+    """
+).splitlines()
+
+
+class TestSnapshots(unittest.TestCase):
+    def setUp(self):
+        self.load = Loader(get_class=TkInterKit().widget_class_factory)
+        self.root = self.load(CONFIG)
+        self.v1 = snapshot(self.root)
+
+    def test_round_trip(self):
+        self.assertEqual(self.v1.to_widget(), self.root)
+        button1 = node_at(self.v1, (0,))
+        self.assertEqual(
+            button1,
+            Node(
+                cls=Button, name="Button1",
+                values=(("grid_row", 0), ("text", "One")),
+            ),
+        )
+        self.assertEqual(button1.get("text"), "One")
+        self.assertEqual(button1.get("margin_x"), 0)
+
+    def test_path_to(self):
+        for name, expected in [
+            ("Frame1", ()),
+            ("Button1", (0,)),
+            ("Button3", (1, 1)),
+            ("NoSuchWidget", None),
+        ]:
+            with self.subTest(name):
+                self.assertEqual(path_to(self.v1, name), expected)
+
+    def test_set_fields_shares_unchanged_subtrees(self):
+        v2 = set_fields(self.v1, (1, 0), text="Two", stick_east=False)
+
+        self.assertEqual(node_at(v2, (1, 0)).values, (("text", "Two"),))
+        # Only the nodes on the path to the edited widget are copied
+        self.assertIsNot(v2, self.v1)
+        self.assertIsNot(node_at(v2, (1,)), node_at(self.v1, (1,)))
+        self.assertIs(node_at(v2, (0,)), node_at(self.v1, (0,)))
+        self.assertIs(node_at(v2, (1, 1)), node_at(self.v1, (1, 1)))
+        # The old version is left as it was
+        self.assertEqual(self.v1.to_widget(), self.root)
+
+        self.assertIs(set_fields(v2, (1, 0), text="Two"), v2)
+        with self.assertRaisesRegex(TypeError, "^Button has no field 'txt'$"):
+            set_fields(v2, (1, 0), txt="Two")
+
+    def test_insert_and_remove(self):
+        button4 = snapshot(Button(name="Button4"))
+        v2 = insert_child(self.v1, (1,), 1, button4)
+        self.assertEqual(
+            [node.name for node in node_at(v2, (1,)).children],
+            ["Button2", "Button4", "Button3"],
+        )
+        self.assertIs(node_at(v2, (0,)), node_at(self.v1, (0,)))
+
+        v3 = remove_child(v2, (1, 0))
+        self.assertEqual(
+            [node.name for node in node_at(v3, (1,)).children],
+            ["Button4", "Button3"],
+        )
+        with self.assertRaisesRegex(ValueError, "^'Button1' is not a container$"):
+            insert_child(self.v1, (0,), 0, button4)
+        with self.assertRaisesRegex(ValueError, "^Cannot remove the root widget$"):
+            remove_child(self.v1, ())
+
+    def test_sync(self):
+        button1, frame2 = self.root.children
+        button2, button3 = frame2.children
+        v2 = set_fields(self.v1, (1, 0), text="Two")
+        v3 = insert_child(v2, (1,), 0, snapshot(Button(name="Button4")))
+        v4 = remove_child(v3, (0,))
+
+        changed = sync(self.root, self.v1, v4)
+
+        self.assertEqual(self.root, v4.to_widget())
+        # Widgets are patched in place rather than rebuilt
+        self.assertEqual(self.root.children, [frame2])
+        self.assertIs(self.root.children[0], frame2)
+        self.assertIs(frame2.children[1], button2)
+        self.assertIs(frame2.children[2], button3)
+        self.assertEqual(button2.text, "Two")
+        self.assertEqual(
+            [widget.name for widget in changed],
+            ["Frame1", "Button4", "Frame2", "Button2"],
+        )
+
+        changed = sync(self.root, v4, self.v1)
+
+        self.assertEqual(self.root, self.load(CONFIG))
+        # Removed widgets are built again from the snapshot
+        self.assertEqual(self.root.children[0], button1)
+        self.assertIs(self.root.children[1], frame2)
+        self.assertEqual(button2.text, "Click me!")
+        self.assertEqual(sync(self.root, self.v1, self.v1), [])
+
+        with self.assertRaisesRegex(ValueError, "^Cannot turn the root widget"):
+            sync(self.root, self.v1, snapshot(Button(name="Frame1")))
+
+
+class TestHistory(unittest.TestCase):
+    def setUp(self):
+        self.v1 = snapshot(Frame(name="Frame1", children=[
+            Button(name="Button1"), Button(name="Button2"),
+        ]))
+
+    def edits(self, history, count):
+        for i in range(count):
+            history.commit(set_fields(history.current, (0,), text=str(i)))
+
+    def test_undo_redo(self):
+        history = History(self.v1)
+        self.assertFalse(history.can_undo)
+        self.assertIsNone(history.undo())
+
+        v2 = set_fields(self.v1, (0,), text="Two")
+        v3 = set_fields(v2, (1,), text="Three")
+        history.commit(v2)
+        history.commit(v3)
+        # Committing the current version is not an edit
+        history.commit(v3)
+        self.assertEqual(len(history), 3)
+
+        self.assertIs(history.undo(), v2)
+        self.assertIs(history.undo(), self.v1)
+        self.assertIsNone(history.undo())
+        self.assertIs(history.redo(), v2)
+        self.assertTrue(history.can_redo)
+
+        # A new edit drops the versions that could be redone
+        v4 = set_fields(v2, (0,), text="Four")
+        history.commit(v4)
+        self.assertFalse(history.can_redo)
+        self.assertEqual(len(history), 3)
+        self.assertIs(history.undo(), v2)
+
+    def test_bounded_versions(self):
+        history = History(self.v1, max_versions=5)
+        self.edits(history, 10)
+        self.assertEqual(len(history), 5)
+        self.assertEqual(node_at(history.current, (0,)).get("text"), "9")
+        while history.can_undo:
+            history.undo()
+        self.assertEqual(node_at(history.current, (0,)).get("text"), "5")
+
+    def test_bounded_memory(self):
+        history = History(self.v1)
+        self.edits(history, 10)
+        per_edit = history.bytes // 10
+        self.assertGreater(per_edit, 0)
+
+        history = History(self.v1, max_bytes=3 * per_edit)
+        self.edits(history, 10)
+        self.assertEqual(len(history), 4)
+        self.assertLessEqual(history.bytes, 3 * per_edit)
+
+        # The current version is kept however large it is
+        history = History(self.v1, max_bytes=0)
+        self.edits(history, 2)
+        self.assertEqual(len(history), 1)
+        self.assertEqual(history.bytes, 0)
+        self.assertEqual(node_at(history.current, (0,)).get("text"), "1")
+
+
+if __name__ == "__main__":
+    unittest.main()
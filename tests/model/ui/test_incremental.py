@@ -0,0 +1,185 @@
+import unittest
+from unittest.mock import patch
+
+from vpy.model.ui.widgets import Button
+from vpy.model.ui.layout_widgets import Frame
+from vpy.model.ui.incremental import IncrementalLoader
+from vpy.model.ui.loader import Loader, LoaderError
+from vpy.model.ui.parser import parse_sections
+from vpy.uikits.tkinter import TkInterKit
+
+
+BASE_CONFIG = """\
+[Frame1]
+class: Frame
+[Frame2]
+class: Frame
+parent: Frame1
+[Button1]
+class: Button
+parent: Frame1
+text: One
+[Button2]
+class: Button
+parent: Frame2
+text: Two
+"""
+
+
+class TestIncrementalLoader(unittest.TestCase):
+    def setUp(self):
+        get_class = TkInterKit().widget_class_factory
+        self.load = IncrementalLoader(get_class=get_class)
+        self.full_load = Loader(get_class=get_class)
+        self.changes = self.load(BASE_CONFIG.splitlines())
+        self.widgets = self.by_name(self.load.root)
+
+    @classmethod
+    def by_name(cls, widget) -> dict:
+        out = {widget.name: widget}
+        for child in getattr(widget, "children", []):
+            out.update(cls.by_name(child))
+        return out
+
+    def reload(self, config: str):
+        changes = self.load(config.splitlines())
+        self.assertEqual(self.load.root, self.full_load(config.splitlines()))
+        return changes
+
+    def test_initial_load(self):
+        self.assertEqual(self.changes.root, self.load.root)
+        self.assertEqual(
+            sorted(w.name for w in self.changes.added),
+            ["Button1", "Button2", "Frame1", "Frame2"]
+        )
+        self.assertEqual(self.load.root, self.full_load(BASE_CONFIG.splitlines()))
+
+    def test_initial_load_without_widgets(self):
+        load = IncrementalLoader(get_class=TkInterKit().widget_class_factory)
+        for name, config in [("Empty", []), ("Comments", ["# Nothing", ""])]:
+            with self.subTest(name):
+                with self.assertRaisesRegex(
+                    LoaderError, "^Root widget not found!$"
+                ):
+                    load(config)
+        self.assertIsNone(load.root)
+
+    def test_no_changes(self):
+        changes = self.reload(BASE_CONFIG)
+        self.assertFalse(changes)
+        self.assertEqual(self.widgets, self.by_name(self.load.root))
+
+    def test_changed_field(self):
+        changes = self.reload(
+            BASE_CONFIG.replace("text: One", "text: Uno\ngrid_row: 2")
+        )
+        self.assertEqual(
+            changes.changed,
+            {"Button1": {"text": ("One", "Uno"), "grid_row": (None, 2)}}
+        )
+        self.assertFalse(changes.added or changes.removed or changes.relinked)
+        self.assertIs(self.by_name(self.load.root)["Button1"], self.widgets["Button1"])
+
+    def test_added_and_removed(self):
+        config = BASE_CONFIG.replace(
+            "[Button2]\nclass: Button\nparent: Frame2\ntext: Two\n",
+            "[Button3]\nclass: Button\nparent: Frame1\n",
+        )
+        changes = self.reload(config)
+        self.assertEqual(changes.added, [Button(name="Button3")])
+        self.assertEqual(changes.removed, [self.widgets["Button2"]])
+        self.assertEqual(
+            sorted(w.name for w in changes.relinked), ["Frame1", "Frame2"]
+        )
+        self.assertEqual(changes.reparented, [])
+
+    def test_reparented(self):
+        changes = self.reload(
+            BASE_CONFIG.replace("parent: Frame2", "parent: Frame1")
+        )
+        self.assertEqual(changes.reparented, [self.widgets["Button2"]])
+        self.assertEqual(self.widgets["Frame2"].children, [])
+        self.assertIs(self.widgets["Frame1"].children[2], self.widgets["Button2"])
+
+    def test_class_changed(self):
+        changes = self.reload(
+            BASE_CONFIG.replace("[Frame2]\nclass: Frame", "[Frame2]\nclass: Button")
+            .replace("parent: Frame2", "parent: Frame1")
+        )
+        self.assertEqual(changes.removed, [self.widgets["Frame2"]])
+        self.assertEqual(changes.added, [Button(name="Frame2")])
+        self.assertEqual(changes.reparented, [self.widgets["Button2"]])
+
+    def test_class_changed_in_place(self):
+        changes = self.reload(
+            BASE_CONFIG.replace("[Button1]\nclass: Button", "[Button1]\nclass: Frame")
+        )
+        self.assertEqual(changes.removed, [self.widgets["Button1"]])
+        self.assertEqual(changes.added, [Frame(name="Button1")])
+        self.assertEqual(changes.relinked, [self.widgets["Frame1"]])
+        self.assertEqual(changes.reparented, [])
+        self.assertIs(self.widgets["Frame1"].children[1], changes.added[0])
+
+    def test_only_changed_chunks_parsed(self):
+        with patch(
+            "vpy.model.ui.incremental.parse_sections",
+            wraps=parse_sections
+        ) as parse:
+            self.reload(BASE_CONFIG.replace("text: One", "text: Uno"))
+        parse.assert_called_once()
+        self.assertEqual(
+            parse.call_args[0][0],
+            ["[Button1]", "class: Button", "parent: Frame1", "text: Uno"]
+        )
+
+    def test_reordered(self):
+        sections = BASE_CONFIG.split("\n[")
+        changes = self.reload(
+            "\n[".join([sections[0], sections[3], sections[2], sections[1]])
+        )
+        self.assertEqual(changes.relinked, [self.widgets["Frame1"]])
+        self.assertFalse(changes.added or changes.removed or changes.changed)
+        self.assertEqual(
+            self.widgets["Frame1"].children,
+            [self.widgets["Button1"], self.widgets["Frame2"]]
+        )
+
+    def test_changed_defaults(self):
+        changes = self.reload("[.default]\ngrid_row: 3\n" + BASE_CONFIG)
+        self.assertEqual(
+            changes.changed,
+            {name: {"grid_row": (None, 3)} for name in self.widgets}
+        )
+
+    def test_invalid_reload_leaves_tree_untouched(self):
+        invalid_configs = [
+            (
+                "Missing parent",
+                BASE_CONFIG.replace("text: One", "text: Uno")
+                .replace("parent: Frame2", "parent: Frame3"),
+                "^Could not find 'Frame3' the parent of 'Button2'$",
+            ),
+            (
+                "Duplicate section",
+                BASE_CONFIG.replace("text: One", "text: Uno")
+                .replace("[Button2]", "[Button1]"),
+                "^Line 10: section 'Button1' already exists$",
+            ),
+            (
+                "Syntax error",
+                BASE_CONFIG.replace("text: One", "text: Uno")
+                .replace("text: Two", "text Two"),
+                "^Line 13: cannot parse 'text Two'$",
+            ),
+        ]
+        for st_name, invalid_config, err_re in invalid_configs:
+            with self.subTest(st_name):
+                with self.assertRaisesRegex(LoaderError, err_re):
+                    self.load(invalid_config.splitlines())
+                self.assertEqual(self.widgets["Button1"].text, "One")
+        changes = self.reload(BASE_CONFIG)
+        self.assertFalse(changes)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,144 @@
+import unittest
+
+from vpy.model.ui.widgets import Button
+from vpy.model.ui.layout_widgets import Frame
+from vpy.model.ui.layout import GridLayout, natural_size
+
+
+def measure(widget):
+    # Buttons are as wide as their text, in 10px characters
+    return len(widget.text) * 10, 20
+
+
+class TestGridLayout(unittest.TestCase):
+    def setUp(self):
+        self.a = Button(name="A", text="aaaa", grid_row=0, grid_column=0)
+        self.b = Button(name="B", text="bb", grid_row=0, grid_column=1)
+        self.c = Button(
+            name="C", text="cccccccccc", grid_row=1, grid_column=0,
+            grid_columnspan=2,
+        )
+        self.inner = Frame(
+            name="Inner", grid_row=2, grid_column=1, children=[self.a, self.b]
+        )
+        self.d = Button(
+            name="D", text="d", grid_row=2, grid_column=0, margin_x=5,
+            padding_y=2,
+        )
+        self.root = Frame(name="Root", children=[self.c, self.d, self.inner])
+        self.layout = GridLayout(self.root, measure)
+
+    def rects(self):
+        return {widget.name: rect for widget, rect in self.layout.rects()}
+
+    def test_container_layout(self):
+        inner = self.layout.layout(self.inner)
+        self.assertEqual(inner.column_widths, [40, 20])
+        self.assertEqual(inner.row_heights, [20])
+        self.assertEqual(inner.size, (60, 20))
+
+        root = self.layout.layout(self.root)
+        # C spans both columns and needs 100px, of which 20 are missing
+        self.assertEqual(root.column_widths, [30, 70])
+        self.assertEqual(root.row_heights, [0, 20, 24])
+
+    def test_rects(self):
+        expected = {
+            "Root": (0, 0, 100, 44),
+            "C": (0, 0, 100, 20),
+            # Centered in the cells without sticky sides
+            "D": (10, 20, 20, 44),
+            "Inner": (35, 22, 95, 42),
+            "A": (35, 22, 75, 42),
+            "B": (75, 22, 95, 42),
+        }
+        self.assertEqual(self.rects(), expected)
+        for widget in (self.root, self.c, self.d, self.inner, self.a, self.b):
+            with self.subTest(widget=widget.name):
+                self.assertEqual(self.layout.rect(widget), expected[widget.name])
+
+    def test_sticky(self):
+        for sides, expected in [
+            ({}, (10, 20, 20, 44)),
+            ({"stick_west": True}, (5, 20, 15, 44)),
+            ({"stick_east": True}, (15, 20, 25, 44)),
+            ({"stick_west": True, "stick_east": True}, (5, 20, 25, 44)),
+        ]:
+            with self.subTest(sides=sides):
+                d = Button(
+                    name="D", text="d", grid_row=2, grid_column=0,
+                    margin_x=5, padding_y=2, **sides
+                )
+                root = Frame(name="Root", children=[self.c, d, self.inner])
+                self.assertEqual(GridLayout(root, measure).rect(d), expected)
+
+    def test_automatic_rows(self):
+        buttons = [Button(name=f"B{i}", text="b") for i in range(3)]
+        buttons[1].grid_rowspan = 2
+        layout = GridLayout(Frame(name="Root", children=buttons), measure)
+
+        self.assertEqual(
+            [layout.rect(button)[1] for button in buttons], [0, 20, 40]
+        )
+
+    def test_negative_positions(self):
+        for name, row, column, message in [
+            ("Row", -2, 0, r"\(-2, 0\)"),
+            ("Column", 1, -1, r"\(1, -1\)"),
+        ]:
+            with self.subTest(name):
+                self.a.grid_row, self.a.grid_column = row, column
+                layout = GridLayout(self.root, measure)
+                with self.assertRaisesRegex(
+                    ValueError, f"^Grid position {message} of 'A' out of range$"
+                ):
+                    layout.rect(self.a)
+
+    def test_invalidate(self):
+        self.rects()
+        self.assertEqual(self.layout.stats.misses, 2)
+
+        self.a.text = "aaaaaaaa"
+        self.layout.invalidate(self.a)
+        self.assertEqual(self.layout.rect(self.b), (100, 22, 120, 42))
+        self.assertEqual(self.layout.stats.misses, 4)
+
+        # Nothing under the root changed, so the inner frame is kept
+        self.d.margin_x = 0
+        self.layout.invalidate(self.d)
+        self.assertEqual(self.layout.rect(self.d), (0, 20, 10, 44))
+        self.assertEqual(self.layout.stats.misses, 5)
+
+    def test_widget_at(self):
+        for point, expected in [
+            ((40, 30), self.a),
+            ((80, 30), self.b),
+            ((97, 30), self.root),
+            ((50, 10), self.c),
+            ((200, 10), None),
+        ]:
+            with self.subTest(point=point):
+                self.assertIs(self.layout.widget_at(*point), expected)
+
+    def test_deep_tree(self):
+        root = frame = Frame(name="F0")
+        for i in range(1, 5000):
+            child = Frame(name=f"F{i}")
+            frame.children = [child]
+            frame = child
+        frame.children = [Button(name="B", text="b")]
+
+        layout = GridLayout(root, measure)
+        self.assertEqual(layout.rect(frame.children[0]), (0, 0, 10, 20))
+        self.assertEqual(layout.size(root), (10, 20))
+
+    def test_natural_size(self):
+        self.assertEqual(
+            natural_size(Button(name="B", text="x" * 20)), (148, 25)
+        )
+        self.assertEqual(natural_size(Button(name="B", text="x")), (85, 25))
+        self.assertEqual(natural_size(Frame(name="F")), (0, 0))
+
+
+if __name__ == "__main__":
+    unittest.main()
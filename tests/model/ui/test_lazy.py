@@ -0,0 +1,286 @@
+import re
+import unittest
+from unittest.mock import create_autospec
+from tempfile import TemporaryDirectory
+from textwrap import dedent
+from pathlib import Path
+
+from vpy.model.ui.widgets import Button
+from vpy.model.ui.layout_widgets import Frame
+from vpy.model.ui.lazy import LazyLoader
+from vpy.model.ui.loader import Loader, LoaderError
+from vpy.uikits.tkinter import TkInterKit
+
+
+class TestLazyLoader(unittest.TestCase):
+    def setUp(self):
+        tmpdir = TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.path = Path(tmpdir.name) / "form.ini"
+        self.path.write_text(dedent(
+            """\
+            # Preamble
+            [.default]
+            class: Button
+            [Frame1]
+            class: Frame
+            [Button1]
+            parent: Frame1
+            grid_row: 1
+            text: Big, red button!
+            [Frame2]
+            class: Frame
+            parent: Frame1
+            [Button2]
+            Parent : Frame2
+            text: multi
+              line
+            """
+        ))
+        self.button_cls = create_autospec(Button, wraps=Button)
+        self.button_cls.side_effect = Button
+        self.frame_cls = create_autospec(Frame, wraps=Frame)
+        self.frame_cls.side_effect = Frame
+        self.load = LazyLoader(
+            get_class={"Button": self.button_cls, "Frame": self.frame_cls}.get
+        )
+
+    def test_same_tree_as_loader(self):
+        root = self.load(self.path)
+        expected = Loader(get_class=TkInterKit().widget_class_factory)\
+            .load_file(self.path)
+
+        self.assertEqual(root.widget, expected)
+        self.assertIs(root.widget, root.widget)
+
+    def test_same_syntax_as_loader(self):
+        get_class = TkInterKit().widget_class_factory
+        for st_name, config in [
+            (
+                "Indented options",
+                """\
+                [Frame1]
+                class: Frame
+                [Button1]
+                  class: Button
+                  parent: Frame1
+                  text: Indented
+                    more
+                """,
+            ),
+            (
+                "Header in a value",
+                """\
+                [Frame1]
+                class: Frame
+                [Button1]
+                class: Button
+                text: Not
+                  [Frame2]
+                parent: Frame1
+                """,
+            ),
+            (
+                "Indented header",
+                """\
+                [.default]
+                class: Frame
+                [Frame1]
+                  [Frame2]
+                  parent: Frame1
+                """,
+            ),
+            (
+                "Option starting with a bracket",
+                """\
+                [Frame1]
+                class: Frame
+                [x: 1
+                """,
+            ),
+        ]:
+            with self.subTest(st_name):
+                self.path.write_text(dedent(config))
+                try:
+                    expected = Loader(get_class=get_class).load_file(self.path)
+                except LoaderError as e:
+                    with self.assertRaisesRegex(
+                        LoaderError, f"^{re.escape(str(e))}$"
+                    ):
+                        LazyLoader(get_class=get_class)(self.path).widget
+                else:
+                    self.assertEqual(
+                        LazyLoader(get_class=get_class)(self.path).widget,
+                        expected,
+                    )
+
+    def test_widgets_built_on_access(self):
+        root = self.load(self.path)
+        frame2 = root.find("Frame2")
+        button2 = root.find("Button2")
+
+        self.assertEqual(root.name, "Frame1")
+        self.assertEqual(
+            [child.name for child in root.children], ["Button1", "Frame2"]
+        )
+        self.assertEqual(button2.parent, frame2)
+        self.assertIs(frame2.widget_class, self.frame_cls)
+        self.button_cls.assert_not_called()
+        self.frame_cls.assert_not_called()
+
+        self.assertEqual(button2.text, "multi\nline")
+        self.button_cls.assert_called_once_with(name="Button2", text="multi\nline")
+        self.frame_cls.assert_not_called()
+
+        self.assertEqual(
+            frame2.widget,
+            Frame(name="Frame2", children=[Button(name="Button2", text="multi\nline")]),
+        )
+        self.assertIs(frame2.widget.children[0], button2.widget)
+        self.assertEqual(self.button_cls.call_count, 1)
+        self.assertEqual(self.frame_cls.call_count, 1)
+
+    def test_find(self):
+        root = self.load(self.path)
+        frame2 = root.find("Frame2")
+
+        self.assertEqual(root.find("Button1").parent, root)
+        self.assertEqual(frame2.find("Button2").name, "Button2")
+        self.assertIsNone(frame2.find("Button1"))
+        self.assertIsNone(root.find("Nothing"))
+        self.assertFalse(hasattr(root.find("Button1"), "children"))
+
+    def test_invalid_config_detected(self):
+        invalid_configs = [
+            (
+                "No root",
+                """\
+                [Widget1]
+                class: Button
+                parent: Widget2
+                [Widget2]
+                class: Button
+                parent: Widget1
+                """,
+                "^Root widget not found!$",
+            ),
+            (
+                "Duplicate root",
+                """\
+                [Widget1]
+                class: Frame
+                [Widget2]
+                class: Frame
+                """,
+                "^Attempt to set 'Widget2' as root while 'Widget1' is"
+                " already set as such$",
+            ),
+            (
+                "Duplicate section",
+                """\
+                [Widget1]
+                class: Frame
+                [Widget1]
+                """,
+                "^Line 3: section 'Widget1' already exists$",
+            ),
+            (
+                "Bad header",
+                """\
+                [Widget1]
+                class: Frame
+                [Widget 2]
+                """,
+                "^Line 3: cannot parse '\\[Widget 2\\]'$",
+            ),
+            (
+                "No section header",
+                """\
+                class: Frame
+                """,
+                "^Line 1: no section header before 'class: Frame'$",
+            ),
+            (
+                "Late defaults",
+                """\
+                [Widget1]
+                class: Frame
+                [.default]
+                """,
+                "^Line 3: '.default' must precede all other sections$",
+            ),
+        ]
+        for st_name, invalid_config, err_re in invalid_configs:
+            for strict in (True, False):
+                with self.subTest(st_name, strict=strict):
+                    self.path.write_text(dedent(invalid_config))
+                    self.load.strict = strict
+                    with self.assertRaisesRegex(LoaderError, err_re):
+                        self.load(self.path)
+
+    def test_strictness(self):
+        invalid_configs = [
+            (
+                "Missing parent",
+                """\
+                [Frame1]
+                class: Frame
+                [Button1]
+                class: Button
+                parent: Frame2
+                """,
+                "^Could not find 'Frame2' the parent of 'Button1'$",
+                "Button1",
+            ),
+            (
+                "Non-container parent",
+                """\
+                [Frame1]
+                class: Frame
+                [Button1]
+                class: Button
+                parent: Frame1
+                [Button2]
+                class: Button
+                parent: Button1
+                """,
+                "^'Button1' set as parent of 'Button2', but its not a"
+                " container$",
+                "Button2",
+            ),
+        ]
+        for st_name, invalid_config, err_re, invalid_name in invalid_configs:
+            with self.subTest(st_name):
+                self.path.write_text(dedent(invalid_config))
+                self.load.strict = True
+                with self.assertRaisesRegex(LoaderError, err_re):
+                    self.load(self.path)
+
+                self.load.strict = False
+                root = self.load(self.path)
+                self.assertEqual(root.name, "Frame1")
+                with self.assertRaisesRegex(LoaderError, err_re):
+                    root.find(invalid_name)
+
+    def test_errors_in_sections_reported_when_built(self):
+        self.path.write_text(dedent(
+            """\
+            [Frame1]
+            class: Frame
+            [Button1]
+            class: Button
+            parent: Frame1
+            grid_row: one
+            grid_column
+            """
+        ))
+        root = self.load(self.path)
+        self.assertEqual(root.children[0].name, "Button1")
+        with self.assertRaisesRegex(
+            LoaderError, "^Line 7: cannot parse 'grid_column'$"
+        ):
+            root.children[0].text
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,7 +1,9 @@
 import unittest
-from unittest.mock import create_autospec
+from unittest.mock import create_autospec, patch
 from textwrap import dedent
 from itertools import permutations
+from pathlib import Path
+from tempfile import TemporaryDirectory
 
 from vpy.interfaces.uikit import WidgetClassFactory
 from vpy.model.ui.widgets import Button
@@ -199,6 +201,90 @@ class TestLoader(unittest.TestCase):
                 out = self.load(config)
                 self.assertEqual(expected, out)
 
+    def test_coercion_plan_built_once_per_class(self):
+        config = dedent(
+            """\
+            [LayWidget1]
+            class: LayWgtCls
+            [Widget1]
+            class: WgtCls
+            parent: LayWidget1
+            grid_column: 1
+            [Widget2]
+            class: WgtCls
+            parent: LayWidget1
+            grid_column: 2
+            """
+        ).splitlines()
+        with patch.object(
+            Loader, "_mk_coercion_plan", wraps=Loader._mk_coercion_plan
+        ) as mk_plan:
+            self.load(config)
+            self.load(config)
+
+        self.assertEqual(
+            mk_plan.call_args_list,
+            [((self.lay_wgt_cls,),), ((self.wgt_cls,),)]
+        )
+        self.wgt_cls.assert_any_call(name="Widget1", grid_column=1)
+        self.wgt_cls.assert_any_call(name="Widget2", grid_column=2)
+        self.assertEqual(
+            self.cls_factory.call_args_list,
+            [(("LayWgtCls",),), (("WgtCls",),)]
+        )
+
+    def test_class_registered_after_failed_lookup(self):
+        config = dedent(
+            """\
+            [Widget1]
+            class: NewCls
+            """
+        ).splitlines()
+        with self.assertRaisesRegex(
+            LoaderError, "^Invalid widget class: 'NewCls'$"
+        ):
+            self.load(config)
+
+        self.cls_factory.side_effect = {"NewCls": self.wgt_cls}.get
+        self.assertIs(self.load(config), self.widget1)
+
+    def test_unsupported_field_type(self):
+        config = dedent(
+            """\
+            [LayWidget1]
+            class: LayWgtCls
+            children: Widget1
+            """
+        ).splitlines()
+        with self.assertRaisesRegex(TypeError, "^Unsupported Widget field type"):
+            self.load(config)
+
+    def test_load_file(self):
+        tmpdir = TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        path = Path(tmpdir.name) / "form.ini"
+        path.write_text(dedent(
+            """\
+            [LayWidget1]
+            class: LayWgtCls
+            [Widget1]
+            class: WgtCls
+            parent: LayWidget1
+            grid_row: 1
+            """
+        ))
+        expected = Frame(name="LayWidget1", children=[self.widget1])
+
+        out = self.load.load_file(path)
+
+        self.assertEqual(expected, out)
+        self.wgt_cls.assert_called_once_with(name="Widget1", grid_row=1)
+
+        path.write_text("[Widget1]\nclass WgtCls\n")
+        with self.assertRaisesRegex(
+            LoaderError, "^Line 2: cannot parse 'class WgtCls'$"
+        ):
+            self.load.load_file(path)
 
     def test_invalid_config_detected(self):
         invalid_configs = [
@@ -277,6 +363,14 @@ class TestLoader(unittest.TestCase):
                 """,
                 "'Widget2' set as parent of 'Widget1', but its not a container"
             ),
+            (
+                "Syntax error",
+                """\
+                [Widget1]
+                class WgtCls
+                """,
+                "^Line 2: cannot parse 'class WgtCls'$"
+            ),
         ]
         for st_name, invalid_config, err_re in invalid_configs:
             with self.subTest(st_name):
@@ -0,0 +1,226 @@
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from textwrap import dedent
+
+from vpy.model.ui.parser import (
+    ParseError, parse_file_sections, parse_sections, split_chunks
+)
+
+
+class TestParseSections(unittest.TestCase):
+    def parse(self, text: str, **kwargs) -> list:
+        return list(parse_sections(dedent(text).splitlines(), **kwargs))
+
+    def test_sections_and_options(self):
+        out = self.parse(
+            """\
+            # A comment
+            [Widget1]
+            class: WgtCls
+            Grid_Row : 1
+            text: Big: red button!
+
+            [ Widget2 ]
+            class: WgtCls
+            text:
+            """
+        )
+        self.assertEqual(
+            out,
+            [
+                (
+                    "Widget1",
+                    {"class": "WgtCls", "grid_row": "1", "text": "Big: red button!"},
+                ),
+                ("Widget2", {"class": "WgtCls", "text": ""}),
+            ],
+        )
+
+    def test_continuation_lines(self):
+        out = self.parse(
+            """\
+            [Widget1]
+            text: first
+              second
+            # not part of the value
+
+              third
+
+            class: WgtCls
+            """
+        )
+        self.assertEqual(
+            out, [("Widget1", {"text": "first\nsecond\n\nthird", "class": "WgtCls"})]
+        )
+
+    def test_defaults(self):
+        out = self.parse(
+            """\
+            [.default]
+            class: WgtCls
+            parent: Root
+            [Root]
+            parent:
+            [Widget1]
+            class: Other
+            """
+        )
+        self.assertEqual(
+            out,
+            [
+                ("Root", {"class": "WgtCls", "parent": ""}),
+                ("Widget1", {"class": "Other", "parent": "Root"}),
+            ],
+        )
+
+    def test_sections_are_streamed(self):
+        def lines():
+            yield "[Widget1]"
+            yield "class: WgtCls"
+            yield "[Widget2]"
+            raise AssertionError("Read past the first section")
+
+        sections = parse_sections(lines())
+        self.assertEqual(next(sections), ("Widget1", {"class": "WgtCls"}))
+
+    def test_not_strict(self):
+        out = self.parse(
+            """\
+            [Widget1]
+            text: a
+            text: b
+            [Widget1]
+            """,
+            strict=False,
+        )
+        self.assertEqual(out, [("Widget1", {"text": "b"}), ("Widget1", {})])
+
+    def test_invalid_input_detected(self):
+        invalid_inputs = [
+            (
+                "No section header",
+                """\
+                class: WgtCls
+                """,
+                "^Line 1: no section header before 'class: WgtCls'$"
+            ),
+            (
+                "Bad section header",
+                """\
+                [Widget1]
+                [Widget 2]
+                """,
+                "^Line 2: cannot parse '\\[Widget 2\\]'$"
+            ),
+            (
+                "No delimiter",
+                """\
+                [Widget1]
+                class WgtCls
+                """,
+                "^Line 2: cannot parse 'class WgtCls'$"
+            ),
+            (
+                "Duplicate section",
+                """\
+                [Widget1]
+                [Widget1]
+                """,
+                "^Line 2: section 'Widget1' already exists$"
+            ),
+            (
+                "Duplicate option",
+                """\
+                [Widget1]
+                text: a
+                Text: b
+                """,
+                "^Line 3: option 'text' in section 'Widget1' already exists$"
+            ),
+            (
+                "Late defaults",
+                """\
+                [Widget1]
+                [.default]
+                """,
+                "^Line 2: '.default' must precede all other sections$"
+            ),
+        ]
+        for st_name, invalid_input, err_re in invalid_inputs:
+            with self.subTest(st_name):
+                with self.assertRaisesRegex(ParseError, err_re):
+                    self.parse(invalid_input)
+
+
+class TestParseFileSections(unittest.TestCase):
+    def setUp(self):
+        tmpdir = TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.path = Path(tmpdir.name) / "form.ini"
+
+    def test_same_as_parsing_text(self):
+        text = dedent(
+            """\
+            # Ünïcode comment
+            [.default]
+            class: WgtCls
+            [Widget1]
+            Text: Große: rote Taste!
+              zweite Zeile
+
+              dritte Zeile
+            [Widget2]\r
+            grid_row: 2\r
+            """
+        )
+        self.path.write_bytes(text.encode())
+        self.assertEqual(
+            list(parse_file_sections(self.path)),
+            list(parse_sections(text.splitlines())),
+        )
+
+    def test_empty_file(self):
+        self.path.write_bytes(b"")
+        self.assertEqual(list(parse_file_sections(self.path)), [])
+
+    def test_encoding(self):
+        self.path.write_bytes("[Widget1]\ntext: Grüße\n".encode("latin-1"))
+        self.assertEqual(
+            list(parse_file_sections(self.path, encoding="latin-1")),
+            [("Widget1", {"text": "Grüße"})],
+        )
+        with self.assertRaisesRegex(ParseError, "^Line 2: 'utf-8' codec"):
+            list(parse_file_sections(self.path))
+
+    def test_errors(self):
+        self.path.write_bytes(b"[Widget1]\n# \xff\nclass WgtCls\n")
+        with self.assertRaisesRegex(
+            ParseError, "^Line 3: cannot parse 'class WgtCls'$"
+        ):
+            list(parse_file_sections(self.path))
+
+
+class TestSplitChunks(unittest.TestCase):
+    def test_split_chunks(self):
+        text = dedent(
+            """\
+            # Preamble
+            [Widget1]
+            text: a
+               [not a header]
+            [Widget2]
+            """
+        )
+        expected = [
+            "# Preamble",
+            "[Widget1]\ntext: a\n   [not a header]",
+            "[Widget2]\n",
+        ]
+        self.assertEqual(split_chunks(text.splitlines(keepends=True)), expected)
+        expected[-1] = "[Widget2]"
+        self.assertEqual(split_chunks(text.splitlines()), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,106 @@
+import unittest
+from unittest.mock import Mock
+from textwrap import dedent
+from pathlib import Path
+from tempfile import TemporaryDirectory
+
+from vpy.model.ui.widgets import Button
+from vpy.model.ui.layout_widgets import Frame
+from vpy.model.ui.loader import Loader
+from vpy.model.ui.profiling import PHASES, LoadProfile, ProfileCollector
+
+
+UI_DEF = dedent(
+    """\
+    [Frame1]
+    class: Frame
+
+    [Button1]
+    class: Button
+    parent: Frame1
+    grid_row: 1
+    text: One
+
+    [Button2]
+    class: Button
+    parent: Frame1
+    grid_row: 2
+    stick_west: yes
+    """
+)
+
+
+class TestLoaderProfiling(unittest.TestCase):
+    def setUp(self):
+        self.observer = Mock()
+        self.load = Loader(
+            get_class={"Button": Button, "Frame": Frame}.get,
+            observer=self.observer,
+        )
+
+    def check_profile(self, profile):
+        self.assertEqual(profile.widgets, 3)
+        self.assertEqual(profile.widget_classes, {"Frame": 1, "Button": 2})
+        self.assertEqual(profile.coercions, {
+            "Button.grid_row": 2, "Button.text": 1, "Button.stick_west": 1,
+        })
+        self.assertEqual(tuple(profile.phases), PHASES)
+        for phase, seconds in profile.phases.items():
+            with self.subTest(phase=phase):
+                self.assertGreaterEqual(seconds, 0.0)
+        self.assertLessEqual(sum(profile.phases.values()), profile.total_time)
+
+    def test_load(self):
+        root = self.load(UI_DEF.splitlines(True))
+
+        self.assertEqual([w.name for w in root.children], ["Button1", "Button2"])
+        self.observer.load_profiled.assert_called_once()
+        self.check_profile(self.observer.load_profiled.call_args.args[0])
+
+    def test_load_file(self):
+        with TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "form.ini"
+            path.write_text(UI_DEF)
+            self.load.load_file(path)
+
+        self.check_profile(self.observer.load_profiled.call_args.args[0])
+
+    def test_no_observer(self):
+        load = Loader(get_class={"Button": Button, "Frame": Frame}.get)
+        root = load(UI_DEF.splitlines(True))
+
+        self.assertEqual(len(root.children), 2)
+
+
+class TestProfileCollector(unittest.TestCase):
+    def test_collect(self):
+        collector = ProfileCollector()
+        load = Loader(
+            get_class={"Button": Button, "Frame": Frame}.get,
+            observer=collector,
+        )
+        load(UI_DEF.splitlines(True))
+        load(UI_DEF.splitlines(True))
+
+        self.assertEqual(collector.loads, 2)
+        self.assertEqual(collector.total.widgets, 6)
+        self.assertEqual(collector.total.widget_classes, {"Frame": 2, "Button": 4})
+        self.assertEqual(collector.total.coercions["Button.grid_row"], 4)
+        report = collector.report()
+        self.assertIn("2 loads, 6 widgets", report)
+        self.assertRegex(report, r"Button +4")
+        self.assertRegex(report, r"Button\.grid_row +4")
+
+    def test_sums_phases(self):
+        collector = ProfileCollector()
+        for seconds in (0.25, 0.5):
+            profile = LoadProfile(total_time=seconds)
+            profile.phases["parse"] = seconds
+            collector.load_profiled(profile)
+
+        self.assertEqual(collector.total.phases["parse"], 0.75)
+        self.assertEqual(collector.total.total_time, 0.75)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,175 @@
+import unittest
+from textwrap import dedent
+
+from vpy.model.ui.loader import Loader, LoaderError
+from vpy.model.ui.store import WidgetStore
+from vpy.uikits.tkinter import TkInterKit
+
+
+CONFIG = dedent(
+    """\
+    [Frame1]
+    class: Frame
+    [Button1]
+    class: Button
+    parent: Frame1
+    grid_row: 0
+    grid_column: 0
+    grid_columnspan: 2
+    stick_east: yes
+    stick_west: yes
+    [Button2]
+    class: Button
+    parent: Frame1
+    grid_row: 0
+    grid_column: 1
+    text: Two
+    [Frame2]
+    class: Frame
+    parent: Frame1
+    grid_row: 1
+    grid_column: 0
+    stick_east: yes
+    [Button3]
+    class: Button
+    parent: Frame2
+    grid_row: 0
+    grid_column: 1
+    """
+).splitlines()
+
+
+class TestWidgetStore(unittest.TestCase):
+    def setUp(self):
+        self.load = Loader(get_class=TkInterKit().widget_class_factory)
+        self.store = self.load.load_store(CONFIG)
+        self.ids = self.store.ids
+
+    def names(self, ids: list[int]) -> list[str]:
+        return [self.store.names[wgt_id] for wgt_id in ids]
+
+    def test_object_views(self):
+        tree = self.load(CONFIG)
+        self.assertEqual(self.store.to_widget(self.ids["Frame1"]), tree)
+        self.assertEqual(
+            self.store.to_widget(self.ids["Button2"]), tree.children[1]
+        )
+        self.assertEqual(
+            WidgetStore.from_tree(tree).to_widget(0), tree
+        )
+
+    def test_sparse_extras(self):
+        self.assertEqual(self.store.extras, {self.ids["Button2"]: {"text": "Two"}})
+
+    def test_queries(self):
+        self.assertEqual(
+            self.names(self.store.in_grid_row(0)),
+            ["Button1", "Button2", "Button3"]
+        )
+        self.assertEqual(
+            self.names(self.store.in_grid_row(0, self.ids["Frame1"])),
+            ["Button1", "Button2"]
+        )
+        self.assertEqual(
+            self.names(self.store.in_grid_column(None)), ["Frame1"]
+        )
+        self.assertEqual(self.names(self.store.stuck_to("east")), ["Button1", "Frame2"])
+        self.assertEqual(self.names(self.store.stuck_to("east", "west")), ["Button1"])
+        self.assertEqual(
+            self.names(self.store.children_of(self.ids["Frame1"])),
+            ["Button1", "Button2", "Frame2"]
+        )
+        self.assertEqual(self.names(self.store.roots()), ["Frame1"])
+
+    def test_grid_collisions(self):
+        self.assertEqual(
+            [tuple(self.names(pair)) for pair in self.store.grid_collisions()],
+            [("Button1", "Button2")]
+        )
+
+    def test_negative_positions(self):
+        config = dedent(
+            """\
+            [Frame1]
+            class: Frame
+            [Button1]
+            class: Button
+            parent: Frame1
+            grid_row: -1
+            grid_column: 0
+            [Button2]
+            class: Button
+            parent: Frame1
+            grid_row: 0
+            grid_column: 0
+            grid_rowspan: 2
+            [Button3]
+            class: Button
+            parent: Frame1
+            grid_row: -2
+            grid_column: 0
+            grid_rowspan: 2
+            """
+        ).splitlines()
+        store = self.load.load_store(config)
+        self.assertEqual(store.to_widget(0), self.load(config))
+        self.assertEqual(store.where("grid_row", -1), [store.ids["Button1"]])
+        self.assertEqual(store.where("grid_row", None), [store.ids["Frame1"]])
+        self.assertEqual(
+            [tuple(store.names[i] for i in pair) for pair in store.grid_collisions()],
+            [("Button3", "Button1")]
+        )
+
+    def test_reparent(self):
+        self.store.set_parent(self.ids["Button2"], self.ids["Frame2"])
+        self.assertEqual(
+            self.names(self.store.children_of(self.ids["Frame2"])),
+            ["Button3", "Button2"]
+        )
+        self.assertEqual(
+            [tuple(self.names(pair)) for pair in self.store.grid_collisions()],
+            [("Button2", "Button3")]
+        )
+
+    def test_invalid_config_detected(self):
+        invalid_configs = [
+            (
+                "Missing parent",
+                """\
+                [Widget1]
+                class: Button
+                parent: NoSuchWgt
+                [Widget2]
+                class: Frame
+                """,
+                "Could not find 'NoSuchWgt' the parent of 'Widget1'"
+            ),
+            (
+                "Parent is not a container",
+                """\
+                [Widget1]
+                class: Button
+                parent: Widget2
+                [Widget2]
+                class: Button
+                """,
+                "'Widget2' set as parent of 'Widget1', but its not a container"
+            ),
+            (
+                "Value out of range",
+                """\
+                [Widget1]
+                class: Button
+                grid_row: 99999999999
+                """,
+                "Value out of range in Widget1"
+            ),
+        ]
+        for st_name, invalid_config, err_re in invalid_configs:
+            with self.subTest(st_name):
+                with self.assertRaisesRegex(LoaderError, err_re):
+                    self.load.load_store(dedent(invalid_config).splitlines())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,327 @@
+import unittest
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from textwrap import dedent
+
+from vpy.model.ui.validation import (
+    DUPLICATE_NAME, DUPLICATE_OPTION, GRID_COLLISION, GRID_RANGE,
+    INVALID_CLASS, INVALID_VALUE, MISSING_PARENT, NOT_A_CONTAINER,
+    PARENT_CYCLE, ROOT, SYNTAX, UNREADABLE, Problem, Validator,
+    validate_project,
+)
+from vpy.uikits.tkinter import TkInterKit
+
+
+KIT = "vpy.uikits.tkinter:TkInterKit"
+
+VALID = dedent(
+    """\
+    [Frame1]
+    class: Frame
+    [Button1]
+    class: Button
+    parent: Frame1
+    grid_row: 0
+    grid_column: 0
+    grid_columnspan: 2
+    [Button2]
+    class: Button
+    parent: Frame1
+    grid_row: 1
+    grid_column: 1
+    [Frame2]
+    class: Frame
+    parent: Frame1
+    grid_row: 1
+    grid_column: 0
+    [Button3]
+    class: Button
+    parent: Frame2
+    grid_row: 0
+    grid_column: 0
+    """
+)
+
+
+class TestValidator(unittest.TestCase):
+    def setUp(self):
+        self.validate = Validator(get_class=TkInterKit().widget_class_factory)
+
+    def kinds(self, config):
+        return [
+            (problem.kind, problem.widgets)
+            for problem in self.validate(dedent(config).splitlines())
+        ]
+
+    def test_valid(self):
+        self.assertEqual(self.validate(VALID.splitlines()), [])
+
+    def test_all_problems_reported(self):
+        problems = self.validate(dedent(
+            """\
+            [Frame1]
+            class: Frame
+            [Button1]
+            class: Button
+            parent: Frame1
+            grid_row: A
+            grid_column: B
+            [Button1]
+            class: Button
+            [Widget1]
+            class: NoSuchClass
+            parent: Frame1
+            [Button2]
+            class: Button
+            parent: NoSuchWgt
+            [Button3]
+            class: Button
+            parent: Button2
+            [Frame2]
+            class: Frame
+            """
+        ).splitlines())
+        self.assertEqual(problems, [
+            Problem(
+                kind=INVALID_VALUE,
+                message="Invalid int value for Button1.grid_row",
+                widgets=("Button1",),
+            ),
+            Problem(
+                kind=INVALID_VALUE,
+                message="Invalid int value for Button1.grid_column",
+                widgets=("Button1",),
+            ),
+            Problem(
+                kind=DUPLICATE_NAME,
+                message="Widget 'Button1' is defined more than once",
+                widgets=("Button1",),
+            ),
+            Problem(
+                kind=INVALID_CLASS,
+                message="Invalid widget class: 'NoSuchClass'",
+                widgets=("Widget1",),
+            ),
+            Problem(
+                kind=MISSING_PARENT,
+                message="Could not find 'NoSuchWgt' the parent of 'Button2'",
+                widgets=("Button2",),
+            ),
+            Problem(
+                kind=NOT_A_CONTAINER,
+                message="'Button2' set as parent of 'Button3', but its not"
+                " a container",
+                widgets=("Button3", "Button2"),
+            ),
+            Problem(
+                kind=ROOT,
+                message="Attempt to set 'Frame2' as root while 'Frame1' is"
+                " already set as such",
+                widgets=("Frame2", "Frame1"),
+            ),
+        ])
+
+    def test_repeated_options(self):
+        problems = self.validate(dedent(
+            """\
+            [Frame1]
+            class: Frame
+            [Button1]
+            class: Button
+            parent: Frame1
+            text: a
+            text: b
+            [Button1]
+            class: Button
+            parent: Frame1
+            """
+        ).splitlines())
+        self.assertEqual(problems, [
+            Problem(
+                kind=DUPLICATE_OPTION,
+                message="Line 7: option 'text' in section 'Button1' already"
+                " exists",
+                widgets=("Button1",),
+            ),
+            Problem(
+                kind=DUPLICATE_NAME,
+                message="Widget 'Button1' is defined more than once",
+                widgets=("Button1",),
+            ),
+        ])
+
+    def test_parent_cycles(self):
+        problems = self.validate(dedent(
+            """\
+            [Frame1]
+            class: Frame
+            parent: Frame3
+            [Frame2]
+            class: Frame
+            parent: Frame1
+            [Frame3]
+            class: Frame
+            parent: Frame2
+            [Frame4]
+            class: Frame
+            parent: Frame4
+            [Button1]
+            class: Button
+            parent: Frame1
+            """
+        ).splitlines())
+        self.assertEqual(problems, [
+            Problem(kind=ROOT, message="Root widget not found!"),
+            Problem(
+                kind=PARENT_CYCLE,
+                message="Parent links form a cycle:"
+                " Frame1 -> Frame3 -> Frame2 -> Frame1",
+                widgets=("Frame1", "Frame3", "Frame2"),
+            ),
+            Problem(
+                kind=PARENT_CYCLE,
+                message="Parent links form a cycle: Frame4 -> Frame4",
+                widgets=("Frame4",),
+            ),
+        ])
+
+    def test_grid_collisions(self):
+        for name, geometry, expected in [
+            ("Apart", ["0 0 1 1", "0 1 1 1", "1 0 1 2"], []),
+            (
+                "Same cell",
+                ["0 0 1 1", "0 0 1 1"],
+                [("Button1", "Button0")],
+            ),
+            (
+                "Column span",
+                ["0 0 1 3", "0 2 1 1", "0 1 1 1"],
+                [("Button1", "Button0"), ("Button2", "Button0")],
+            ),
+            (
+                "Row span",
+                ["0 0 3 1", "2 0 1 1"],
+                [("Button1", "Button0")],
+            ),
+            (
+                "Reported once",
+                ["0 0 2 2", "0 1 2 1"],
+                [("Button1", "Button0")],
+            ),
+            (
+                "Other containers",
+                ["0 0 1 1", "0 0 1 1 Frame2"],
+                [],
+            ),
+        ]:
+            with self.subTest(name):
+                sections = ["[Frame1]\nclass: Frame"]
+                sections.append("[Frame2]\nclass: Frame\nparent: Frame1")
+                for i, cell in enumerate(geometry):
+                    row, column, rowspan, columnspan, *parent = cell.split()
+                    sections.append(
+                        f"[Button{i}]\nclass: Button\n"
+                        f"parent: {parent[0] if parent else 'Frame1'}\n"
+                        f"grid_row: {row}\ngrid_column: {column}\n"
+                        f"grid_rowspan: {rowspan}\n"
+                        f"grid_columnspan: {columnspan}"
+                    )
+                problems = self.validate("\n".join(sections).splitlines())
+                self.assertEqual(
+                    [(p.kind, p.widgets) for p in problems],
+                    [(GRID_COLLISION, widgets) for widgets in expected],
+                )
+        problem, = self.validate(dedent(
+            """\
+            [Frame1]
+            class: Frame
+            [Button1]
+            class: Button
+            parent: Frame1
+            grid_row: 0
+            grid_column: 0
+            [Button2]
+            class: Button
+            parent: Frame1
+            grid_row: 0
+            grid_column: 0
+            """
+        ).splitlines())
+        self.assertEqual(
+            problem.message,
+            "'Button2' shares grid cells with 'Button1' in 'Frame1'",
+        )
+
+    def test_grid_ranges(self):
+        for name, options, message in [
+            ("Negative row", "grid_row: -1", "Grid row -1 of 'Button1'"),
+            (
+                "Beyond the limit",
+                "grid_column: 9999\ngrid_columnspan: 2",
+                "Grid column 9999 spanning 2 of 'Button1'",
+            ),
+            ("Zero span", "grid_rowspan: 0", "Grid rowspan 0 of 'Button1'"),
+            (
+                "Both",
+                "grid_row: -2\ngrid_columnspan: -1",
+                "Grid row -2 and columnspan -1 of 'Button1'",
+            ),
+        ]:
+            with self.subTest(name):
+                problems = self.validate(
+                    ["[Frame1]", "class: Frame", "[Button1]", "class: Button",
+                     "parent: Frame1", *options.splitlines()]
+                )
+                self.assertEqual(problems, [Problem(
+                    kind=GRID_RANGE,
+                    message=f"{message} out of range",
+                    widgets=("Button1",),
+                )])
+
+    def test_syntax_error(self):
+        self.assertEqual(
+            self.kinds(
+                """\
+                [Frame1]
+                class Frame
+                """
+            ),
+            [(SYNTAX, ())],
+        )
+
+
+class TestValidateProject(unittest.TestCase):
+    def setUp(self):
+        tmpdir = TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.tmpdir = Path(tmpdir.name)
+
+    def test_validate_project(self):
+        (self.tmpdir / "forms").mkdir()
+        (self.tmpdir / "forms" / "good.ini").write_text(VALID)
+        (self.tmpdir / "bad.ini").write_text("[Frame1]\nclass: Frame\n" * 2)
+        (self.tmpdir / "binary.ini").write_bytes(b"[Frame1]\nclass: \xff\n")
+        (self.tmpdir / "notes.txt").write_text("Not a form")
+
+        results = validate_project(self.tmpdir, KIT, max_workers=2)
+
+        self.assertEqual(
+            [(r.path.relative_to(self.tmpdir), [p.kind for p in r.problems])
+             for r in results],
+            [
+                (Path("bad.ini"), [DUPLICATE_NAME]),
+                (Path("binary.ini"), [SYNTAX]),
+                (Path("forms/good.ini"), []),
+            ],
+        )
+        self.assertEqual(validate_project(self.tmpdir / "forms", KIT,
+                                          pattern="*.txt"), [])
+
+    def test_unreadable(self):
+        validate = Validator(get_class=TkInterKit().widget_class_factory)
+        problem, = validate.validate_file(self.tmpdir / "missing.ini")
+        self.assertEqual(problem.kind, UNREADABLE)
+
+
+if __name__ == "__main__":
+    unittest.main()
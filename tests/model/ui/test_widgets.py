@@ -0,0 +1,27 @@
+import unittest
+
+from vpy.model.ui.widgets import Button
+from vpy.model.ui.layout_widgets import Frame
+
+
+class TestWidgetClasses(unittest.TestCase):
+    def test_widgets_are_slotted(self):
+        for cls in (Button, Frame):
+            with self.subTest(cls.__name__):
+                widget = cls(name="Widget1")
+                self.assertFalse(hasattr(widget, "__dict__"))
+                with self.assertRaises(AttributeError):
+                    widget.no_such_field = 1
+
+    def test_widgets_compare_by_value(self):
+        self.assertEqual(
+            Frame(name="Frame1", children=[Button(name="Button1", text="A")]),
+            Frame(name="Frame1", children=[Button(name="Button1", text="A")]),
+        )
+        self.assertNotEqual(
+            Button(name="Button1", text="A"), Button(name="Button1", text="B")
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
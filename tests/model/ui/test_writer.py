@@ -0,0 +1,118 @@
+import unittest
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from textwrap import dedent
+
+from vpy.model.ui.layout_widgets import Frame
+from vpy.model.ui.loader import Loader
+from vpy.model.ui.widgets import Button
+from vpy.model.ui.writer import ini_lines, save_ini, write_ini
+from vpy.uikits.tkinter import TkInterKit
+
+
+class TestWriter(unittest.TestCase):
+    def setUp(self):
+        self.load = Loader(get_class=TkInterKit().widget_class_factory)
+        self.root = Frame(name="Frame1", children=[
+            Button(name="Button1", grid_row=0, grid_column=-1, text="One"),
+            Frame(name="Frame2", grid_row=1, stick_east=True, children=[
+                Button(name="Button2", text="Two\n\nlines"),
+                Button(name="Button3", stick_west=True, stick_north=False),
+            ]),
+            Frame(name="Frame3"),
+        ])
+
+    def test_ini_lines(self):
+        expected = dedent(
+            """\
+            [Frame1]
+            class: Frame
+
+            [Button1]
+            class: Button
+            parent: Frame1
+            grid_column: -1
+            grid_row: 0
+            text: One
+
+            [Frame2]
+            class: Frame
+            parent: Frame1
+            grid_row: 1
+            stick_east: yes
+
+            [Button2]
+            class: Button
+            parent: Frame2
+            text: Two
+
+                lines
+
+            [Button3]
+            class: Button
+            parent: Frame2
+            stick_west: yes
+
+            [Frame3]
+            class: Frame
+            parent: Frame1"""
+        ).splitlines()
+        self.assertEqual(list(ini_lines(self.root)), expected)
+
+    def test_round_trip(self):
+        out = StringIO()
+        write_ini(self.root, out)
+        self.assertEqual(self.load(out.getvalue().splitlines()), self.root)
+
+        tmpdir = TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        path = Path(tmpdir.name) / "form.ini"
+        save_ini(self.root, path)
+        self.assertEqual(self.load.load_file(path), self.root)
+        self.assertEqual(path.read_text(), out.getvalue())
+
+    def test_class_names(self):
+        lines = ini_lines(Button(name="Button1"), lambda cls: "kit.Button")
+        self.assertEqual(list(lines), ["[Button1]", "class: kit.Button"])
+
+    def test_values_that_do_not_read_back(self):
+        for name, widget, err_re in [
+            (
+                "Widget name",
+                Button(name="Button 1"),
+                "^Cannot write widget name 'Button 1'$",
+            ),
+            (
+                "Surrounding spaces",
+                Button(name="Button1", text=" One"),
+                "^Cannot write Button1.text: ' One'$",
+            ),
+            (
+                "Comment line",
+                Button(name="Button1", text="One\n# Two"),
+                "^Cannot write Button1.text",
+            ),
+            (
+                "Trailing blank line",
+                Button(name="Button1", text="One\n"),
+                "^Cannot write Button1.text",
+            ),
+            (
+                "Carriage return",
+                Button(name="Button1", text="One\rTwo"),
+                "^Cannot write Button1.text",
+            ),
+            (
+                "Unset value without a None default",
+                Button(name="Button1", text=None),
+                "^Cannot write Button1.text: None$",
+            ),
+        ]:
+            with self.subTest(name):
+                with self.assertRaisesRegex(ValueError, err_re):
+                    list(ini_lines(widget))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+import subprocess
+import sys
+import unittest
+
+
+class TestImports(unittest.TestCase):
+    def test_headless_modules(self):
+        for module in [
+            "vpy.model.ui.loader",
+            "vpy.model.ui.cache",
+            "vpy.model.ui.batch",
+            "vpy.uikits.registry",
+            "vpy.uikits.tkinter",
+            "vpy.uikits.runtime",
+        ]:
+            with self.subTest(module=module):
+                result = subprocess.run(
+                    [
+                        sys.executable, "-c",
+                        f"import sys, {module}; print(*sorted(sys.modules))",
+                    ],
+                    capture_output=True, text=True, check=True,
+                )
+                imported = set(result.stdout.split())
+                for heavy in (
+                    "tkinter", "multiprocessing", "importlib.metadata",
+                    "vpy.uikits.tkinter.codegen",
+                ):
+                    self.assertNotIn(heavy, imported)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import unittest
+from importlib import import_module
+from importlib.metadata import EntryPoint
+from unittest.mock import patch
+
+from vpy.model.ui.widgets import Button
+from vpy.model.ui.layout_widgets import Frame
+from vpy.uikits.registry import Registry, import_object
+from vpy.uikits.tkinter import TkInterKit
+
+
+class TestRegistry(unittest.TestCase):
+    def setUp(self):
+        patcher = patch(
+            "importlib.metadata.entry_points",
+            side_effect=lambda group: {
+                "vpy.uikits": [EntryPoint(
+                    name="other", value="vpy.uikits.tkinter:TkInterKit",
+                    group="vpy.uikits",
+                )],
+                "vpy.widgets": [EntryPoint(
+                    name="Panel", value="vpy.model.ui.layout_widgets:Frame",
+                    group="vpy.widgets",
+                )],
+            }[group],
+        )
+        self.entry_points = patcher.start()
+        self.addCleanup(patcher.stop)
+        patcher = patch(
+            "vpy.uikits.registry.import_module", wraps=import_module
+        )
+        self.import_module = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.registry = Registry()
+
+    def test_import_object(self):
+        self.assertIs(import_object("vpy.uikits.tkinter:TkInterKit"), TkInterKit)
+        self.assertIs(
+            import_object("vpy.uikits.tkinter:TkInterKit.WIDGET_CLASSES"),
+            TkInterKit.WIDGET_CLASSES,
+        )
+        with self.assertRaisesRegex(ValueError, "Not a 'module:attribute'"):
+            import_object("vpy.uikits.tkinter")
+
+    def test_kits(self):
+        self.entry_points.assert_not_called()
+        self.assertEqual(self.registry.kit_names(), ["tkinter", "other"])
+        self.import_module.assert_not_called()
+
+        kit = self.registry.kit("tkinter")
+        self.assertIsInstance(kit, TkInterKit)
+        self.assertIs(self.registry.kit("tkinter"), kit)
+        self.import_module.assert_called_once_with("vpy.uikits.tkinter")
+        self.assertIsNot(self.registry.kit("other"), kit)
+        with self.assertRaisesRegex(ValueError, "Unknown UI kit: 'nope'"):
+            self.registry.kit("nope")
+        self.assertEqual(self.entry_points.call_count, 2)
+
+    def test_widget_classes(self):
+        for class_name, expected in [
+            ("Button", Button),
+            ("Panel", Frame),
+            ("Frame", Frame),
+            ("Nope", None),
+        ]:
+            with self.subTest(class_name=class_name):
+                self.assertIs(
+                    self.registry.widget_class_factory(class_name), expected
+                )
+        self.import_module.reset_mock()
+        with patch.object(TkInterKit, "widget_class_factory") as factory:
+            for class_name in ("Button", "Panel", "Frame", "Nope"):
+                self.registry.widget_class_factory(class_name)
+        factory.assert_not_called()
+        self.import_module.assert_not_called()
+
+    def test_register(self):
+        registry = Registry(discover=False)
+        self.assertIsNone(registry.widget_class_factory("Panel"))
+        registry.register_widget("Panel", "vpy.model.ui.layout_widgets:Frame")
+        self.assertIs(registry.widget_class_factory("Panel"), Frame)
+        self.assertEqual(registry.kit_names(), ["tkinter"])
+        self.entry_points.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
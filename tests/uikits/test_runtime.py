@@ -0,0 +1,98 @@
+import unittest
+from unittest.mock import patch
+from tempfile import TemporaryDirectory
+from pathlib import Path
+
+from vpy.model.ui.widgets import Button
+from vpy.model.ui.layout_widgets import Frame
+from vpy.uikits.runtime import UiModuleLoader
+from vpy.uikits.tkinter import TkInterKit
+
+
+class TestUiModuleLoader(unittest.TestCase):
+    def setUp(self):
+        tmpdir = TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.cache_dir = Path(tmpdir.name)
+        self.model = Frame(
+            name="Frame1",
+            children=[Button(name="Button1", grid_row=1, text="Big")],
+        )
+        self.load = UiModuleLoader(kit=TkInterKit(), cache_dir=self.cache_dir)
+
+    def load_without_compiling(self, load: UiModuleLoader):
+        with patch.object(
+            TkInterKit, "compile_user_class_dec"
+        ) as compile_user_class_dec, patch(
+            "vpy.uikits.runtime.compile"
+        ) as compile_:
+            module = load(self.model)
+        compile_user_class_dec.assert_not_called()
+        compile_.assert_not_called()
+        return module
+
+    def test_warm_load_skips_compiling(self):
+        cold = self.load(self.model)
+        self.assertEqual(len(list(self.cache_dir.iterdir())), 1)
+        self.assertTrue(callable(cold.decorate_class))
+
+        self.assertIs(self.load_without_compiling(self.load), cold)
+
+        load = UiModuleLoader(kit=TkInterKit(), cache_dir=self.cache_dir)
+        warm = self.load_without_compiling(load)
+        self.assertIsNot(warm, cold)
+        self.assertEqual(
+            warm.decorate_class.__code__.co_code,
+            cold.decorate_class.__code__.co_code,
+        )
+
+    def test_cache_keys(self):
+        key = self.load.cache_key(self.model)
+        self.assertEqual(
+            key,
+            self.load.cache_key(Frame(
+                name="Frame1",
+                children=[Button(name="Button1", grid_row=1, text="Big")],
+            ))
+        )
+        changes = [
+            ("Changed field", lambda: setattr(
+                self.model.children[0], "text", "Small"
+            )),
+            ("Added widget", lambda: self.model.children.append(
+                Button(name="Button2")
+            )),
+            ("Changed structure", lambda: self.model.children.insert(
+                0, Frame(name="Frame2", children=[self.model.children.pop()])
+            )),
+            ("Kit version", lambda: setattr(
+                self.load.kit, "CODEGEN_VERSION", "changed"
+            )),
+        ]
+        keys = {key}
+        for st_name, change in changes:
+            with self.subTest(st_name):
+                change()
+                key = self.load.cache_key(self.model)
+                self.assertNotIn(key, keys)
+                keys.add(key)
+
+    def test_corrupt_cache_rebuilt(self):
+        self.load(self.model)
+        cache_path, = self.cache_dir.iterdir()
+        blob = cache_path.read_bytes()
+        corruptions = [
+            ("Truncated", blob[:-1]),
+            ("Bad magic", b"X" + blob[1:]),
+            ("Flipped bit", blob[:-1] + bytes([blob[-1] ^ 1])),
+        ]
+        for st_name, corrupt_blob in corruptions:
+            with self.subTest(st_name):
+                cache_path.write_bytes(corrupt_blob)
+                load = UiModuleLoader(kit=TkInterKit(), cache_dir=self.cache_dir)
+                self.assertTrue(callable(load.decorator(self.model)))
+                self.assertEqual(cache_path.read_bytes(), blob)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -28,6 +28,7 @@ class TestTkInterCompiler(unittest.TestCase):
     def mk_cls_w_mocked_init() -> type:
         class ClsWMockedInit:
             __init__ = Mock(return_value=None)
+            grid = Mock()
 
         return ClsWMockedInit
 
@@ -39,6 +40,7 @@ class TestTkInterCompiler(unittest.TestCase):
             "__builtins__": {
                 "__import__": mock_import,
                 "super": super,
+                "hasattr": hasattr,
             }
         }
         exec(result_code, mock_globals)
@@ -110,6 +112,201 @@ class TestTkInterCompiler(unittest.TestCase):
 
         ttk.Frame.__init__.assert_called_once()
 
+    def test_compile_builds_and_grids_children(self) -> None:
+        model = self.frame_cls(
+            name="Frame1",
+            children=[
+                self.button_cls(
+                    name="Button1", grid_row=1, grid_column=2,
+                    stick_north=True, stick_west=True, margin_x=3, padding_y=4,
+                    text="Big, 'red' button!",
+                ),
+                self.frame_cls(
+                    name="Frame2", children=[self.button_cls(name="def")]
+                ),
+            ],
+        )
+
+        tk, ttk, decorator = self.compile_and_exec_model(model)
+        user_class = self.create_and_decorate_user_class(tk, ttk, decorator)
+        user_frame = user_class(None, padding=5)
+
+        ttk.Frame.__init__.assert_has_calls(
+            [call(None, padding=5), call(user_frame)]
+        )
+        self.assertIsInstance(user_frame.Frame2, ttk.Frame)
+        self.assertIs(user_frame.Button1, ttk.Button.return_value)
+        self.assertEqual(
+            ttk.Button.call_args_list,
+            [
+                call(user_frame, text="Big, 'red' button!"),
+                call(user_frame.Frame2),
+            ]
+        )
+        self.assertEqual(
+            ttk.Button.return_value.grid.call_args_list,
+            [
+                call(row=1, column=2, padx=3, ipady=4, sticky="nw"),
+                call(),
+            ]
+        )
+        ttk.Frame.grid.assert_called_once_with()
+        self.assertEqual(
+            user_class.__init__.__qualname__,
+            f"{user_class.__qualname__}.__init__"
+        )
+
+    def test_reserved_names_not_set_as_attributes(self) -> None:
+        model = self.frame_cls(
+            name="Frame1",
+            children=[
+                self.button_cls(name=name)
+                for name in ["tk", "master", "_w", "grid", "Button1"]
+            ],
+        )
+
+        tk, ttk, decorator = self.compile_and_exec_model(model)
+        user_class = self.create_and_decorate_user_class(tk, ttk, decorator)
+        user_frame = user_class()
+
+        self.assertEqual(ttk.Button.call_count, 5)
+        self.assertIs(user_frame.Button1, ttk.Button.return_value)
+        self.assertIs(user_frame.grid, ttk.Frame.grid)
+        for name in ["tk", "master", "_w"]:
+            with self.subTest(name):
+                self.assertNotIn(name, vars(user_frame))
+
+    def test_variable_names_unique(self) -> None:
+        # Each pair of names could make the same variable
+        model = self.frame_cls(
+            name="Frame1",
+            children=[
+                self.frame_cls(name=name, children=[
+                    self.frame_cls(name=other),
+                    self.button_cls(name=f"Button{i}"),
+                ])
+                for i, (name, other) in enumerate(
+                    [(".a", "2e61"), ("\ufb01", "fi")]
+                )
+            ],
+        )
+
+        tk, ttk, decorator = self.compile_and_exec_model(model)
+        user_class = self.create_and_decorate_user_class(tk, ttk, decorator)
+        frames = []
+        ttk.Frame.__init__ = \
+            lambda frame, *args, **kwargs: frames.append(frame)
+        user_frame = user_class()
+
+        self.assertIs(frames[0], user_frame)
+        self.assertEqual(
+            [call.args[0] for call in ttk.Button.call_args_list],
+            [frames[1], frames[3]],
+        )
+        self.assertIs(user_frame.fi, frames[4])
+
+    def test_compile_module(self) -> None:
+        models = {
+            "decorate_frame1": self.frame_cls(name="Frame1"),
+            "decorate_frame2": self.frame_cls(
+                name="Frame2", children=[self.button_cls(name="Button1")]
+            ),
+        }
+        result_code = self.uikit.compile_module(models)
+
+        mock_import = Mock()
+        mock_globals = {
+            "__builtins__": {"__import__": mock_import, "super": super}
+        }
+        exec(result_code, mock_globals)
+
+        self.assert_imports(mock_import, mock_globals)
+        for function in models:
+            with self.subTest(function):
+                self.assertEqual(
+                    result_code.count(f"def {function}(cls: _CT) -> _CT:"), 1
+                )
+                self.assertTrue(callable(mock_globals.get(function)))
+
+    def test_unchanged_subtrees_reused(self) -> None:
+        model = self.frame_cls(
+            name="Frame1",
+            children=[
+                self.frame_cls(
+                    name="Frame2",
+                    children=[
+                        self.button_cls(name="Button1"),
+                        self.button_cls(name="Button2"),
+                    ],
+                ),
+                self.frame_cls(
+                    name="Frame3", children=[self.button_cls(name="Button3")]
+                ),
+            ],
+        )
+        self.uikit.compile_user_class_dec(model)
+        self.assertEqual(
+            (self.uikit.codegen_stats.hits, self.uikit.codegen_stats.misses),
+            (0, 5)
+        )
+
+        self.uikit.compile_user_class_dec(model)
+        self.assertEqual(
+            (self.uikit.codegen_stats.hits, self.uikit.codegen_stats.misses),
+            (5, 5)
+        )
+
+        model.children[0].children[1].text = "Changed"
+        model.children[1].children.append(self.button_cls(name="Button4"))
+        code = self.uikit.compile_user_class_dec(model)
+        # Button2, Frame2, the new Button4 and Frame3 are generated again
+        self.assertEqual(
+            (self.uikit.codegen_stats.hits, self.uikit.codegen_stats.misses),
+            (7, 9)
+        )
+        self.assertEqual(code, TkInterKit().compile_user_class_dec(model))
+
+    def test_changed_widgets_hint(self) -> None:
+        button1 = self.button_cls(name="Button1")
+        frame3 = self.frame_cls(
+            name="Frame3", children=[self.button_cls(name="Button3")]
+        )
+        model = self.frame_cls(
+            name="Frame1",
+            children=[
+                self.frame_cls(
+                    name="Frame2",
+                    children=[button1, self.button_cls(name="Button2")],
+                ),
+                frame3,
+            ],
+        )
+        self.uikit.compile_user_class_dec(model)
+        stats = self.uikit.codegen_stats
+        stats.hits = stats.misses = 0
+
+        button1.text = "Changed"
+        frame3.children.append(self.button_cls(name="Button4"))
+        code = self.uikit.compile_user_class_dec(
+            model, changed=[button1, frame3]
+        )
+
+        # Button2 and Button3 are reused without being looked at
+        self.assertEqual((stats.hits, stats.misses), (2, 4))
+        self.assertEqual(code, TkInterKit().compile_user_class_dec(model))
+
+        frame3.name = "Frame4"
+        code = self.uikit.compile_user_class_dec(model, changed=[frame3])
+        self.assertEqual(code, TkInterKit().compile_user_class_dec(model))
+
+    def test_unsupported_widget_class(self) -> None:
+        class Label(Widget):
+            pass
+
+        model = self.frame_cls(name="Frame1", children=[Label(name="Label1")])
+        with self.assertRaisesRegex(TypeError, "^Unsupported widget class"):
+            self.uikit.compile_user_class_dec(model)
+
 
 if __name__ == "__main__":
     unittest.main()
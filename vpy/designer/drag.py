@@ -0,0 +1,84 @@
+"""Coalescing of drag events in the form designer.
+
+Pointer motion events can arrive much faster than the screen is
+redrawn. `DragCoalescer` keeps only the latest event of a drag and
+applies it at most once per frame, from an idle or timer callback of
+the Tk event loop, so a burst of motion events costs a single update.
+"""
+from dataclasses import dataclass
+from collections.abc import Callable
+from math import ceil
+from time import perf_counter
+import tkinter as tk
+
+
+# Matches a 60Hz display
+FRAME_INTERVAL_MS = 16
+
+DragHandler = Callable[[tk.Event], None]
+
+
+@dataclass(kw_only=True)
+class DragStats:
+    events: int = 0
+    frames: int = 0
+    # Seconds spent applying events
+    frame_time: float = 0.0
+    max_frame_time: float = 0.0
+
+    @property
+    def coalesced(self) -> int:
+        """Events that were dropped in favour of a later one"""
+        return self.events - self.frames
+
+    @property
+    def mean_frame_time(self) -> float:
+        return self.frame_time / self.frames if self.frames else 0.0
+
+
+class DragCoalescer:
+    """Apply the latest pushed drag event at most once per frame"""
+
+    def __init__(
+        self, widget: tk.Misc, frame_interval_ms: int = FRAME_INTERVAL_MS
+    ) -> None:
+        self.widget = widget
+        self.frame_interval_ms = frame_interval_ms
+        self.stats = DragStats()
+        self._pending: tuple[DragHandler, tk.Event] | None = None
+        self._after_id: str | None = None
+        self._last_frame = float("-inf")
+
+    def push(self, handler: DragHandler, event: tk.Event) -> None:
+        """Queue `event` for `handler`, replacing any event not applied yet"""
+        self.stats.events += 1
+        self._pending = (handler, event)
+        if self._after_id is not None:
+            return
+        elapsed_ms = (perf_counter() - self._last_frame) * 1000
+        if elapsed_ms >= self.frame_interval_ms:
+            self._after_id = self.widget.after_idle(self._run)
+        else:
+            self._after_id = self.widget.after(
+                ceil(self.frame_interval_ms - elapsed_ms), self._run
+            )
+
+    def flush(self) -> None:
+        """Apply the pending event now, such as when a drag ends"""
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+        if self._pending is None:
+            return
+        handler, event = self._pending
+        self._pending = None
+        start = perf_counter()
+        handler(event)
+        self._last_frame = end = perf_counter()
+        self.stats.frames += 1
+        self.stats.frame_time += end - start
+        self.stats.max_frame_time = max(self.stats.max_frame_time, end - start)
+
+    def _run(self) -> None:
+        self._after_id = None
+        self.flush()
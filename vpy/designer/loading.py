@@ -0,0 +1,170 @@
+"""Loading forms into the designer without blocking the Tk event loop.
+
+`AsyncFormLoader` parses and builds the model of a form in a worker
+thread, then hands its widgets to a placement callback on the Tk thread
+in time-sliced batches scheduled with `after()`, so the designer keeps
+redrawing and handling input while a large form opens. Tk may only be
+called from the thread running its event loop, so the worker never
+touches it; the Tk thread polls for the worker's result instead.
+"""
+from dataclasses import dataclass
+from collections.abc import Callable, Iterable, Iterator
+from queue import Empty, SimpleQueue
+from threading import Event, Thread
+from time import perf_counter
+import os
+import tkinter as tk
+
+from vpy.designer.drag import FRAME_INTERVAL_MS
+from vpy.model.ui.base import Widget
+
+
+# Leaves the rest of a frame for Tk to handle events and redraw
+SLICE_MS = FRAME_INTERVAL_MS // 2
+POLL_INTERVAL_MS = FRAME_INTERVAL_MS
+
+
+class LoadCancelled(Exception):
+    pass
+
+
+@dataclass(kw_only=True)
+class LoadStats:
+    batches: int = 0
+    placed: int = 0
+    # Seconds spent placing widgets
+    place_time: float = 0.0
+    max_batch_time: float = 0.0
+
+
+class AsyncFormLoader:
+    """Load a form in the background and place its widgets in batches
+
+    `load` turns the lines of a form into a model, such as a `Loader`,
+    and is called in the worker thread. `place` is called on the Tk
+    thread for every widget of the model, parents before their children.
+    `on_progress` gets the number of widgets placed so far and the total
+    after every batch, `on_done` gets the model once all are placed, and
+    `on_error` gets the exception if loading failed.
+    """
+
+    def __init__(
+        self,
+        widget: tk.Misc,
+        load: Callable[[Iterable[str]], Widget],
+        place: Callable[[Widget], None],
+        *,
+        on_progress: Callable[[int, int], None] | None = None,
+        on_done: Callable[[Widget], None] | None = None,
+        on_error: Callable[[Exception], None] | None = None,
+        slice_ms: int = SLICE_MS,
+    ) -> None:
+        self.widget = widget
+        self.load = load
+        self.place = place
+        self.on_progress = on_progress
+        self.on_done = on_done
+        self.on_error = on_error
+        self.slice_ms = slice_ms
+        self.stats = LoadStats()
+        self.model: Widget | None = None
+        self._results: SimpleQueue[
+            tuple[Widget | None, list[Widget], Exception | None]
+        ] = SimpleQueue()
+        self._cancelled = Event()
+        self._thread: Thread | None = None
+        self._after_id: str | None = None
+        self._pending: list[Widget] = []
+        self._next = 0
+
+    @property
+    def running(self) -> bool:
+        return self._after_id is not None
+
+    def start(self, path: str | os.PathLike, encoding: str = "utf-8") -> None:
+        self._thread = Thread(
+            target=self._work, args=(path, encoding), daemon=True
+        )
+        self._thread.start()
+        self._after_id = self.widget.after(POLL_INTERVAL_MS, self._poll)
+
+    def cancel(self) -> None:
+        """Stop loading, the worker stops at the next line it reads"""
+        self._cancelled.set()
+        if self._after_id is not None:
+            self.widget.after_cancel(self._after_id)
+            self._after_id = None
+
+    def _work(self, path: str | os.PathLike, encoding: str) -> None:
+        try:
+            with open(path, encoding=encoding) as f:
+                model = self.load(_until_cancelled(f, self._cancelled))
+            # Ordered here, to keep it off the Tk thread as well
+            result = (model, _preorder(model), None)
+        except LoadCancelled:
+            return
+        except Exception as e:
+            result = (None, [], e)
+        self._results.put(result)
+
+    def _poll(self) -> None:
+        self._after_id = None
+        try:
+            model, widgets, error = self._results.get_nowait()
+        except Empty:
+            self._after_id = self.widget.after(POLL_INTERVAL_MS, self._poll)
+            return
+        if error is not None:
+            if self.on_error is not None:
+                self.on_error(error)
+            return
+        self.model = model
+        self._pending = widgets
+        self._next = 0
+        self._place_batch()
+
+    def _place_batch(self) -> None:
+        self._after_id = None
+        pending, placed = self._pending, self._next
+        start = perf_counter()
+        deadline = start + self.slice_ms / 1000
+        while placed < len(pending):
+            self.place(pending[placed])
+            placed += 1
+            if perf_counter() >= deadline:
+                break
+        end = perf_counter()
+        self.stats.batches += 1
+        self.stats.placed += placed - self._next
+        self.stats.place_time += end - start
+        self.stats.max_batch_time = max(self.stats.max_batch_time, end - start)
+        self._next = placed
+        if self.on_progress is not None:
+            self.on_progress(placed, len(pending))
+        if self._cancelled.is_set():
+            return
+        if placed < len(pending):
+            # A timer rather than an idle callback, so pending events are
+            # handled before the next batch
+            self._after_id = self.widget.after(0, self._place_batch)
+        else:
+            self._pending = []
+            if self.on_done is not None:
+                self.on_done(self.model)
+
+
+def _until_cancelled(lines: Iterable[str], cancelled: Event) -> Iterator[str]:
+    for line in lines:
+        if cancelled.is_set():
+            raise LoadCancelled()
+        yield line
+
+
+def _preorder(model: Widget) -> list[Widget]:
+    widgets = []
+    stack = [model]
+    while stack:
+        widget = stack.pop()
+        widgets.append(widget)
+        stack.extend(reversed(getattr(widget, "children", ())))
+    return widgets
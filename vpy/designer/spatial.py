@@ -0,0 +1,186 @@
+"""Spatial index of the items on a design canvas.
+
+`SpatialIndex` buckets the bounding boxes of canvas items into a
+uniform grid of cells, so hit-tests, rectangle selection and snapping
+only look at the items in the cells a query touches, instead of at
+every item on the canvas. Items are moved and resized in place as they
+are dragged.
+"""
+from collections.abc import Hashable, Iterator
+from itertools import count
+from math import floor
+
+
+# (x0, y0, x1, y1), x1 and y1 are excluded
+BBox = tuple[float, float, float, float]
+Cell = tuple[int, int]
+
+CELL_SIZE = 64
+
+
+class SpatialIndex:
+    """Grid buckets over the bounding boxes of canvas items
+
+    Query results are listed in the order items were added, which is
+    also the order they are stacked on a canvas, bottom first.
+    """
+
+    def __init__(self, cell_size: float = CELL_SIZE) -> None:
+        self.cell_size = cell_size
+        self._bboxes: dict[Hashable, BBox] = {}
+        self._cells: dict[Cell, set[Hashable]] = {}
+        self._order: dict[Hashable, int] = {}
+        self._serials = count()
+
+    def __len__(self) -> int:
+        return len(self._bboxes)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._bboxes
+
+    def bbox(self, key: Hashable) -> BBox:
+        return self._bboxes[key]
+
+    def insert(self, key: Hashable, bbox: BBox) -> None:
+        """Add an item, or set the bounding box of an existing one"""
+        old_bbox = self._bboxes.get(key)
+        if old_bbox is not None:
+            old_cells = set(self._cells_of(old_bbox))
+            new_cells = set(self._cells_of(bbox))
+            self._remove_from_cells(key, old_cells - new_cells)
+            self._add_to_cells(key, new_cells - old_cells)
+        else:
+            self._order[key] = next(self._serials)
+            self._add_to_cells(key, self._cells_of(bbox))
+        self._bboxes[key] = bbox
+
+    def move(self, key: Hashable, dx: float, dy: float) -> None:
+        x0, y0, x1, y1 = self._bboxes[key]
+        self.insert(key, (x0 + dx, y0 + dy, x1 + dx, y1 + dy))
+
+    def resize(self, key: Hashable, width: float, height: float) -> None:
+        """Resize an item, keeping its top left corner in place"""
+        x0, y0, _, _ = self._bboxes[key]
+        self.insert(key, (x0, y0, x0 + width, y0 + height))
+
+    def remove(self, key: Hashable) -> None:
+        bbox = self._bboxes.pop(key)
+        del self._order[key]
+        self._remove_from_cells(key, self._cells_of(bbox))
+
+    def at_point(self, x: float, y: float) -> list[Hashable]:
+        """Items whose bounding boxes hold the point"""
+        cell = (floor(x / self.cell_size), floor(y / self.cell_size))
+        return self._ordered(
+            key for key in self._cells.get(cell, ())
+            if _holds_point(self._bboxes[key], x, y)
+        )
+
+    def in_rect(self, rect: BBox, *, enclosed: bool = False) -> list[Hashable]:
+        """Items whose bounding boxes overlap the rectangle
+
+        If `enclosed` is set, only items whose bounding boxes are
+        entirely inside the rectangle are listed.
+        """
+        rect = _normalized(rect)
+        test = _encloses if enclosed else _overlaps
+        return self._ordered(
+            key for key in self._candidates(rect)
+            if test(rect, self._bboxes[key])
+        )
+
+    def snap(
+        self,
+        bbox: BBox,
+        distance: float,
+        exclude: Hashable | None = None,
+    ) -> tuple[float, float]:
+        """The smallest offsets that align an edge of `bbox` with an edge
+        of a nearby item
+
+        Offsets are looked for separately along each axis, and are 0 when
+        no edge is within `distance`.
+        """
+        x0, y0, x1, y1 = bbox
+        search = (x0 - distance, y0 - distance, x1 + distance, y1 + distance)
+        best_dx = best_dy = None
+        for key in self._candidates(search):
+            other = self._bboxes[key]
+            if key == exclude or not _overlaps(search, other):
+                continue
+            ox0, oy0, ox1, oy1 = other
+            for offset in (ox0 - x0, ox1 - x0, ox0 - x1, ox1 - x1):
+                if abs(offset) <= distance and (
+                    best_dx is None or abs(offset) < abs(best_dx)
+                ):
+                    best_dx = offset
+            for offset in (oy0 - y0, oy1 - y0, oy0 - y1, oy1 - y1):
+                if abs(offset) <= distance and (
+                    best_dy is None or abs(offset) < abs(best_dy)
+                ):
+                    best_dy = offset
+        return best_dx or 0, best_dy or 0
+
+    def _candidates(self, rect: BBox) -> set[Hashable]:
+        cells = self._cell_range(rect)
+        cols, rows = cells
+        if len(cols) * len(rows) > len(self._cells):
+            # Cheaper to go over the occupied cells than the covered ones
+            return {
+                key
+                for (col, row), keys in self._cells.items()
+                if col in cols and row in rows
+                for key in keys
+            }
+        candidates = set()
+        for col in cols:
+            for row in rows:
+                candidates.update(self._cells.get((col, row), ()))
+        return candidates
+
+    def _ordered(self, keys: Iterator[Hashable]) -> list[Hashable]:
+        return sorted(keys, key=self._order.__getitem__)
+
+    def _cell_range(self, bbox: BBox) -> tuple[range, range]:
+        x0, y0, x1, y1 = bbox
+        size = self.cell_size
+        return (
+            range(floor(x0 / size), floor(x1 / size) + 1),
+            range(floor(y0 / size), floor(y1 / size) + 1),
+        )
+
+    def _cells_of(self, bbox: BBox) -> Iterator[Cell]:
+        cols, rows = self._cell_range(bbox)
+        return ((col, row) for col in cols for row in rows)
+
+    def _add_to_cells(self, key: Hashable, cells: Iterator[Cell]) -> None:
+        for cell in cells:
+            self._cells.setdefault(cell, set()).add(key)
+
+    def _remove_from_cells(self, key: Hashable, cells: Iterator[Cell]) -> None:
+        for cell in cells:
+            keys = self._cells[cell]
+            keys.discard(key)
+            if not keys:
+                del self._cells[cell]
+
+
+def _normalized(rect: BBox) -> BBox:
+    x0, y0, x1, y1 = rect
+    return min(x0, x1), min(y0, y1), max(x0, x1), max(y0, y1)
+
+
+def _holds_point(bbox: BBox, x: float, y: float) -> bool:
+    x0, y0, x1, y1 = bbox
+    return x0 <= x < x1 and y0 <= y < y1
+
+
+def _overlaps(a: BBox, b: BBox) -> bool:
+    return a[0] < b[2] and b[0] < a[2] and a[1] < b[3] and b[1] < a[3]
+
+
+def _encloses(outer: BBox, inner: BBox) -> bool:
+    return (
+        outer[0] <= inner[0] and outer[1] <= inner[1]
+        and inner[2] <= outer[2] and inner[3] <= outer[3]
+    )
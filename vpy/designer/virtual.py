@@ -0,0 +1,202 @@
+"""Virtualized design surface.
+
+A Tk canvas slows down with every embedded window it holds, so a form
+with thousands of widgets cannot have a real widget for each of them.
+`VirtualCanvas` draws every item as a lightweight rectangle with a
+label, and only gives the items in and around the visible part of the
+canvas a real widget. Widgets of items scrolled out of view are hidden
+and kept in a pool per widget class, to be reused for the next items
+scrolled into view, so the work done on scrolling depends on the number
+of visible items rather than on the size of the form.
+"""
+from dataclasses import dataclass
+from collections.abc import Mapping
+from time import perf_counter
+from typing import Any
+import tkinter as tk
+
+from vpy.designer.spatial import CELL_SIZE, BBox, SpatialIndex
+
+
+@dataclass(kw_only=True)
+class VirtualStats:
+    refreshes: int = 0
+    # Widgets created, and the times items were given one or lost it
+    created: int = 0
+    realized: int = 0
+    recycled: int = 0
+    # Seconds spent updating realized items
+    refresh_time: float = 0.0
+    max_refresh_time: float = 0.0
+
+
+@dataclass(kw_only=True, eq=False)
+class _Item:
+    widget_class: type[tk.Widget]
+    options: Mapping[str, Any]
+    bbox: BBox
+    rect_id: int
+    text_id: int
+    # The realized widget and its canvas window item
+    window: tuple[tk.Widget, int] | None = None
+
+
+class VirtualCanvas:
+    """Design items on a canvas, with widgets only for the visible ones
+
+    Items are identified by the canvas id of their placeholder rectangle.
+    If a `WidgetSelector` is given, realized widgets are managed by it,
+    and items follow the widgets it moves or resizes.
+    """
+
+    def __init__(self, canvas: tk.Canvas, selector=None, margin: float = CELL_SIZE) -> None:
+        self.canvas = canvas
+        self.selector = selector
+        # Items within this distance of the viewport are realized as well
+        self.margin = margin
+        self.index = SpatialIndex()
+        self.stats = VirtualStats()
+        self._items: dict[int, _Item] = {}
+        self._realized: dict[int, _Item] = {}
+        self._window_items: dict[int, _Item] = {}
+        self._pools: dict[type, list[tuple[tk.Widget, int, Mapping[str, Any]]]] = {}
+        self._after_id: str | None = None
+        canvas.bind("<Configure>", self.schedule_refresh, "+")
+        if selector is not None:
+            selector.listeners.append(self._window_changed)
+
+    def add(self, widget_class: type[tk.Widget], bbox: BBox, **options: Any) -> int:
+        """Place an item, to be realized as `widget_class(canvas, **options)`"""
+        x0, y0, x1, y1 = bbox
+        rect_id = self.canvas.create_rectangle(
+            x0, y0, x1, y1, outline="gray", fill="#eeeeee"
+        )
+        text_id = self.canvas.create_text(
+            (x0 + x1) / 2, (y0 + y1) / 2,
+            text=options.get("text", widget_class.__name__),
+        )
+        self._items[rect_id] = _Item(
+            widget_class=widget_class, options=options, bbox=bbox,
+            rect_id=rect_id, text_id=text_id,
+        )
+        self.index.insert(rect_id, bbox)
+        self.schedule_refresh()
+        return rect_id
+
+    def remove(self, key: int) -> None:
+        if key in self._realized:
+            self._recycle(key)
+        item = self._items.pop(key)
+        self.index.remove(key)
+        self.canvas.delete(item.rect_id, item.text_id)
+
+    def bbox(self, key: int) -> BBox:
+        return self._items[key].bbox
+
+    def widget(self, key: int) -> tk.Widget | None:
+        """The widget of an item, if it is realized"""
+        window = self._items[key].window
+        return window[0] if window else None
+
+    def xview(self, *args):
+        """Scroll horizontally, for use as a scrollbar command"""
+        result = self.canvas.xview(*args)
+        if args:
+            self.schedule_refresh()
+        return result
+
+    def yview(self, *args):
+        """Scroll vertically, for use as a scrollbar command"""
+        result = self.canvas.yview(*args)
+        if args:
+            self.schedule_refresh()
+        return result
+
+    def viewport(self) -> BBox:
+        """The visible part of the canvas, grown by the margin"""
+        canvas, margin = self.canvas, self.margin
+        return (
+            canvas.canvasx(0) - margin,
+            canvas.canvasy(0) - margin,
+            canvas.canvasx(canvas.winfo_width()) + margin,
+            canvas.canvasy(canvas.winfo_height()) + margin,
+        )
+
+    def schedule_refresh(self, event: tk.Event | None = None) -> None:
+        """Refresh once the event loop is idle, however many times called"""
+        if self._after_id is None:
+            self._after_id = self.canvas.after_idle(self.refresh)
+
+    def refresh(self) -> None:
+        """Realize the items in the viewport, and recycle the others"""
+        if self._after_id is not None:
+            self.canvas.after_cancel(self._after_id)
+            self._after_id = None
+        start = perf_counter()
+        visible = self.index.in_rect(self.viewport())
+        visible_keys = set(visible)
+        # The selected widget is kept, as the selector still refers to it
+        selected = getattr(self.selector, "canvas_id", None)
+        for key in [
+            key for key, item in self._realized.items()
+            if key not in visible_keys and item.window[1] != selected
+        ]:
+            self._recycle(key)
+        for key in visible:
+            if key not in self._realized:
+                self._realize(key)
+        end = perf_counter()
+        self.stats.refreshes += 1
+        self.stats.refresh_time += end - start
+        self.stats.max_refresh_time = max(self.stats.max_refresh_time, end - start)
+
+    def _realize(self, key: int) -> None:
+        item = self._items[key]
+        x0, y0, x1, y1 = item.bbox
+        pool = self._pools.get(item.widget_class)
+        if pool:
+            widget, window_id, old_options = pool.pop()
+            # Options of the previous item this one does not set
+            for name in old_options.keys() - item.options.keys():
+                widget.configure({name: widget.configure(name)[3]})
+            widget.configure(**item.options)
+            self.canvas.coords(window_id, x0, y0)
+            self.canvas.itemconfigure(
+                window_id, width=x1 - x0, height=y1 - y0, state="normal"
+            )
+        else:
+            widget = item.widget_class(self.canvas, **item.options)
+            window_id = self.canvas.create_window(
+                x0, y0, window=widget, anchor="nw", width=x1 - x0, height=y1 - y0
+            )
+            self.stats.created += 1
+            if self.selector is not None:
+                self.selector.manage_widget(widget, window_id)
+        if self.selector is not None:
+            self.selector.index.insert(window_id, item.bbox)
+        item.window = (widget, window_id)
+        self._realized[key] = item
+        self._window_items[window_id] = item
+        self.stats.realized += 1
+
+    def _recycle(self, key: int) -> None:
+        item = self._realized.pop(key)
+        widget, window_id = item.window
+        item.window = None
+        del self._window_items[window_id]
+        self.canvas.itemconfigure(window_id, state="hidden")
+        if self.selector is not None:
+            self.selector.index.remove(window_id)
+        self._pools.setdefault(item.widget_class, []).append(
+            (widget, window_id, item.options)
+        )
+        self.stats.recycled += 1
+
+    def _window_changed(self, window_id: int, bbox: BBox) -> None:
+        item = self._window_items.get(window_id)
+        if item is None:
+            return
+        x0, y0, x1, y1 = item.bbox = bbox
+        self.index.insert(item.rect_id, bbox)
+        self.canvas.coords(item.rect_id, x0, y0, x1, y1)
+        self.canvas.coords(item.text_id, (x0 + x1) / 2, (y0 + y1) / 2)
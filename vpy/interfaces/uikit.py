@@ -11,6 +11,9 @@ class WidgetClassFactory(Protocol):
 
 
 class UiKit(metaclass=ABCMeta):
+    # Must change whenever the code generated for a model changes
+    CODEGEN_VERSION: str
+
     @abstractmethod
     def widget_class_factory(self, class_name: str) -> type[Widget]|None:
         pass
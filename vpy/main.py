@@ -3,10 +3,21 @@ from tkinter.ttk import *
 from itertools import count
 from functools import partial
 
+from vpy.designer.drag import DragCoalescer
+from vpy.designer.spatial import SpatialIndex
+
 
 class WidgetSelector:
-    def __init__(self, canvas):
+    def __init__(self, canvas, snap_distance=0):
         self.canvas = canvas
+        # Bounding boxes of managed widgets, by canvas item id
+        self.index = SpatialIndex()
+        self.snap_distance = snap_distance
+        self.selection = []
+        self.rubber_band = None
+        # Called with the canvas id and bounding box of a managed widget
+        # after it is moved or resized
+        self.listeners = []
         self.ctrl_pt_widgets = [
             Canvas(canvas, background="blue", borderwidth=0, width=7, height=7, relief=FLAT)
             for _ in range(8)
@@ -14,6 +25,40 @@ class WidgetSelector:
         self.ctrl_pt_handles = [None] * len(self.ctrl_pt_widgets)
         self.widget = None
         self.canvas_id = None
+        # Control points are moved together through canvas tags: all of
+        # them, the ones on the east and south edges, and the ones in the
+        # middle of the horizontal and vertical edges
+        tag_prefix = f"{type(self).__name__}:{id(self)}"
+        self.ctrl_pts_tag, self.east_tag, self.south_tag, \
+            self.h_middle_tag, self.v_middle_tag, self.selection_tag = (
+                f"{tag_prefix}:{name}"
+                for name in (
+                    "ctrl_pts", "east", "south", "h_middle", "v_middle",
+                    "selection",
+                )
+            )
+        self.ctrl_pt_tags = [
+            (self.ctrl_pts_tag, *tags) for tags in [
+                (), (self.h_middle_tag,), (self.east_tag,),
+                (self.east_tag, self.v_middle_tag),
+                (self.east_tag, self.south_tag),
+                (self.h_middle_tag, self.south_tag), (self.south_tag,),
+                (self.v_middle_tag,),
+            ]
+        ]
+        self.ctrl_pts_size = (0, 0)
+        self.drag = DragCoalescer(canvas)
+
+        # All managed widgets share one bind tag, and are told apart by
+        # their canvas ids
+        self.bind_tag = f"{tag_prefix}:widgets"
+        self.canvas_ids = {}
+        self.managed_widgets = {}
+        self.dragging = False
+        self.drag_origin = (0, 0)
+        canvas.bind_class(self.bind_tag, "<Button-1>", self._select_widget)
+        canvas.bind_class(self.bind_tag, "<ButtonRelease-1>", self._end_drag_position)
+        canvas.bind_class(self.bind_tag, "<Motion>", self._drag_motion)
 
         for w_cpt in self.ctrl_pt_widgets[2:5]:
             w_cpt.configure(cursor="sb_h_double_arrow")
@@ -26,59 +71,108 @@ class WidgetSelector:
             v_cpt.bind("<ButtonRelease-1>", self._end_drag_height, '+')
 
         self.ctrl_pt_widgets[4].configure(cursor="sizing")
+
+        canvas.bind("<Button-1>", self._begin_rubber_band, "+")
+        canvas.bind(
+            "<B1-Motion>", partial(self.drag.push, self._drag_rubber_band), "+"
+        )
+        canvas.bind("<ButtonRelease-1>", self._end_rubber_band, "+")
         
-    def _select_widget(self, canvas_id, event):
-        self.widget = event.widget
-        self.canvas_id = canvas_id
-        self._markers_to_widget(self.widget)
+    def _select_widget(self, event):
+        canvas_id = self.canvas_ids.get(str(event.widget))
+        if canvas_id is None:
+            return
+        self._set_selection([canvas_id])
         # print(f"widget selected: {w}")
         self._begin_drag_position(event)
 
+    @property
+    def drag_stats(self):
+        return self.drag.stats
+
     def _markers_to_widget(self, w):
         x0, x2 = w.winfo_x(), w.winfo_x() + w.winfo_width()
-        x1 = (x0 + x2) // 2
+        x1 = (x0 + x2) / 2
         y0, y2 = w.winfo_y(), w.winfo_y() + w.winfo_height()
-        y1 = (y0 + y2) // 2
+        y1 = (y0 + y2) / 2
         x_coords = [x0, x1, x2, x2, x2, x1, x0, x0]
         y_coords = [y0, y0, y0, y1, y2, y2, y2, y1]
-        for i, widget, handle, x, y in zip(
-            count(), self.ctrl_pt_widgets, self.ctrl_pt_handles, x_coords, y_coords
+        for i, widget, handle, tags, x, y in zip(
+            count(), self.ctrl_pt_widgets, self.ctrl_pt_handles,
+            self.ctrl_pt_tags, x_coords, y_coords
         ):
             # print(f"{i=}, {handle=}, {widget=}, {x=}, {y=}")
             if handle is None:
-                self.ctrl_pt_handles[i] = self.canvas.create_window(x, y, window=widget)
+                self.ctrl_pt_handles[i] = self.canvas.create_window(
+                    x, y, window=widget, tags=tags
+                )
             else:
                 self.canvas.coords(handle, x, y)
+                self.canvas.itemconfigure(handle, state="normal")
             # Seems there is a bug in widget.lift() and the tk docs!
             self.canvas.tk.call("raise", widget)
+        self.ctrl_pts_size = (x2 - x0, y2 - y0)
+
+    def _resize_markers(self, width, height):
+        """Move the control points to match a new size of the widget
+
+        Unlike `_markers_to_widget`, this does not have to wait for the
+        canvas to lay out the widget again.
+        """
+        old_width, old_height = self.ctrl_pts_size
+        if width != old_width:
+            self.canvas.move(self.east_tag, width - old_width, 0)
+            self.canvas.move(self.h_middle_tag, (width - old_width) / 2, 0)
+        if height != old_height:
+            self.canvas.move(self.south_tag, 0, height - old_height)
+            self.canvas.move(self.v_middle_tag, 0, (height - old_height) / 2)
+        self.ctrl_pts_size = (width, height)
 
     def _begin_drag_position(self, event):
         if not self.canvas_id:
             return
-        bind_tag = f"{type(self).__name__}:{self.canvas_id}"
-        self.canvas.bind_class(bind_tag, "<Motion>", partial(self._drag_position, event.x, event.y))
+        self.dragging = True
+        self.drag_origin = (event.x, event.y)
+
+    def _drag_motion(self, event):
+        if self.dragging:
+            self.drag.push(self._drag_position, event)
 
     def _end_drag_position(self, event):
-        if not self.canvas_id:
+        if not self.dragging:
             return
-        bind_tag = f"{type(self).__name__}:{self.canvas_id}"
-        self.canvas.unbind_class(bind_tag, "<Motion>")
+        self.drag.flush()
+        self.dragging = False
 
-    def _drag_position(self, initial_x, initial_y, event):
+    def _drag_position(self, event):
+        # Coalesced events are all relative to where the widget was
+        # before any of them, so the latest one holds the whole move
         if not self.widget:
             return
         p = self.widget.master
         if hasattr(p, "move"):
-            p.move(self.canvas_id, event.x - initial_x, event.y - initial_y)
-            self.canvas.update_idletasks()
-            self._markers_to_widget(self.widget)
+            initial_x, initial_y = self.drag_origin
+            dx, dy = event.x - initial_x, event.y - initial_y
+            if self.snap_distance:
+                x0, y0, x1, y1 = self.index.bbox(self.canvas_id)
+                snap_x, snap_y = self.index.snap(
+                    (x0 + dx, y0 + dy, x1 + dx, y1 + dy),
+                    self.snap_distance,
+                    exclude=self.canvas_id,
+                )
+                dx, dy = dx + snap_x, dy + snap_y
+            p.move(self.canvas_id, dx, dy)
+            self.canvas.move(self.ctrl_pts_tag, dx, dy)
+            self.index.move(self.canvas_id, dx, dy)
+            self._item_changed(self.canvas_id)
 
     def _begin_drag_width(self, event):
         # print("Begin width drag")
-        event.widget.bind("<Motion>", self._drag_width, "+")
+        event.widget.bind("<Motion>", partial(self.drag.push, self._drag_width), "+")
 
     def _end_drag_width(self, event):
         # print("End width drag")
+        self.drag.flush()
         event.widget.unbind("<Motion>")
         
     def _drag_width(self, event):
@@ -92,15 +186,18 @@ class WidgetSelector:
         p = self.widget.master
         if hasattr(p, "itemconfigure"):
             p.itemconfigure(self.canvas_id, width=new_width)
-            self.canvas.update_idletasks()
-            self._markers_to_widget(self.widget)
+            self._resize_markers(new_width, self.ctrl_pts_size[1])
+            _, y0, _, y1 = self.index.bbox(self.canvas_id)
+            self.index.resize(self.canvas_id, new_width, y1 - y0)
+            self._item_changed(self.canvas_id)
 
     def _begin_drag_height(self, event):
         # print("Begin height drag")
-        event.widget.bind("<Motion>", self._drag_height, "+")
+        event.widget.bind("<Motion>", partial(self.drag.push, self._drag_height), "+")
 
     def _end_drag_height(self, event):
         # print("End height drag")
+        self.drag.flush()
         event.widget.unbind("<Motion>")
         
     def _drag_height(self, event):
@@ -114,14 +211,74 @@ class WidgetSelector:
         p = self.widget.master
         if hasattr(p, "itemconfigure"):
             p.itemconfigure(self.canvas_id, height=new_height)
-            self.canvas.update_idletasks()
-            self._markers_to_widget(self.widget)
+            self._resize_markers(self.ctrl_pts_size[0], new_height)
+            x0, _, x1, _ = self.index.bbox(self.canvas_id)
+            self.index.resize(self.canvas_id, x1 - x0, new_height)
+            self._item_changed(self.canvas_id)
 
     def manage_widget(self, widget, canvas_id):
-        bind_tag = f"{type(self).__name__}:{canvas_id}"
-        widget.bindtags(bind_tag)
-        self.canvas.bind_class(bind_tag, "<Button-1>", partial(self._select_widget, canvas_id))
-        self.canvas.bind_class(bind_tag, "<ButtonRelease-1>", self._end_drag_position)
+        widget.bindtags(self.bind_tag)
+        self.canvas_ids[str(widget)] = canvas_id
+        self.managed_widgets[canvas_id] = widget
+        self.index.insert(canvas_id, self.canvas.bbox(canvas_id))
+
+    def _item_changed(self, canvas_id):
+        bbox = self.index.bbox(canvas_id)
+        for listener in self.listeners:
+            listener(canvas_id, bbox)
+
+    def widgets_at(self, x, y):
+        """Canvas ids of the managed widgets under a canvas point, topmost last"""
+        return self.index.at_point(x, y)
+
+    def _set_selection(self, canvas_ids):
+        self.selection = canvas_ids
+        self.canvas.delete(self.selection_tag)
+        if len(canvas_ids) == 1:
+            # A single widget is shown by its control points, and can be
+            # moved and resized
+            self.canvas_id = canvas_ids[0]
+            self.widget = self.managed_widgets[self.canvas_id]
+            self._markers_to_widget(self.widget)
+            return
+        self.widget = self.canvas_id = None
+        self.canvas.itemconfigure(self.ctrl_pts_tag, state="hidden")
+        for canvas_id in canvas_ids:
+            self.canvas.create_rectangle(
+                *self.index.bbox(canvas_id),
+                outline="blue", dash=(2, 2), tags=self.selection_tag,
+            )
+
+    def _begin_rubber_band(self, event):
+        x, y = self.canvas.canvasx(event.x), self.canvas.canvasy(event.y)
+        self.rubber_band = (
+            x, y,
+            self.canvas.create_rectangle(
+                x, y, x, y, outline="gray", dash=(4, 2),
+                tags=self.selection_tag,
+            ),
+        )
+
+    def _drag_rubber_band(self, event):
+        if self.rubber_band is None:
+            return
+        x0, y0, rect_id = self.rubber_band
+        self.canvas.coords(
+            rect_id, x0, y0,
+            self.canvas.canvasx(event.x), self.canvas.canvasy(event.y),
+        )
+
+    def _end_rubber_band(self, event):
+        if self.rubber_band is None:
+            return
+        self.drag.flush()
+        x0, y0, rect_id = self.rubber_band
+        self.rubber_band = None
+        self.canvas.delete(rect_id)
+        self._set_selection(self.index.in_rect(
+            (x0, y0, self.canvas.canvasx(event.x), self.canvas.canvasy(event.y)),
+            enclosed=True,
+        ))
 
 
 def main():
@@ -3,12 +3,16 @@ instances of these floating around but only subclasses thereof,
 but Python does not seem to allow something to be both a
 dataclass and a Protocol at the same time, while ABCs do not
 prevent instanciation where there are no abstract methods.
+
+Forms can hold a great many widgets, so all widget classes are slotted
+dataclasses that carry no per-instance `__dict__`. Subclasses should
+be declared with `slots=True` as well to keep it that way.
 """
 from dataclasses import dataclass, field
 from abc import ABCMeta
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Widget(metaclass=ABCMeta):
     name: str
     
@@ -28,6 +32,6 @@ class Widget(metaclass=ABCMeta):
     padding_y: int = 0
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class WidgetContainer(Widget, metaclass=ABCMeta):
     children: list[Widget] = field(default_factory=list)
@@ -0,0 +1,143 @@
+"""Loading many UI definition files in parallel.
+
+Files are loaded in a pool of worker processes. Workers send every
+widget tree back as a marshalled list of flat records, along with the
+names of the widget classes it uses, which is much cheaper to transfer
+than pickled widget objects. Trees are only built from the records
+when a result's `widget` is first accessed. The UI kit is named by an
+import path or a registry name rather than passed as an object, so
+workers can import it by themselves.
+"""
+from dataclasses import dataclass, field
+from collections.abc import Callable, Iterable
+from functools import partial
+from pathlib import Path
+from typing import TypeVar
+import marshal
+import os
+
+from vpy.interfaces.uikit import UiKit, WidgetClassFactory
+from vpy.model.ui.base import Widget
+from vpy.model.ui.cache import decode_tree, encode_tree, recording_factory
+from vpy.model.ui.loader import Loader, LoaderError
+from vpy.uikits.registry import default_registry, import_object
+
+
+T = TypeVar("T")
+
+
+@dataclass(kw_only=True)
+class LoadResult:
+    path: Path
+    error: LoaderError | None = None
+    payload: bytes | None = field(default=None, repr=False)
+    get_class: WidgetClassFactory | None = field(default=None, repr=False)
+    _widget: Widget | None = field(default=None, init=False, repr=False)
+
+    @property
+    def widget(self) -> Widget | None:
+        if self._widget is None and self.payload is not None:
+            class_names, records = marshal.loads(self.payload)
+            classes = [self.get_class(name) for name in class_names]
+            self._widget = decode_tree(classes, records)
+        return self._widget
+
+
+def resolve_kit(kit: str) -> UiKit:
+    """Instantiate a `UiKit` given as a `module:class` import path, or get
+    the one registered under a name, such as `tkinter`"""
+    if ":" not in kit:
+        return default_registry.kit(kit)
+    return import_object(kit)()
+
+
+def load_many(
+    paths: Iterable[str | os.PathLike],
+    kit: str,
+    *,
+    max_workers: int | None = None,
+) -> list[LoadResult]:
+    """Load UI definition files in parallel using the named UI kit
+
+    Returns a result for every path, in order. Files that fail to load
+    get a `LoaderError` in their result, without affecting other files.
+    """
+    paths = [Path(path) for path in paths]
+    if not paths:
+        return []
+    get_class = resolve_kit(kit).widget_class_factory
+    return [
+        LoadResult(
+            path=path,
+            error=None if error is None else LoaderError(error),
+            payload=payload,
+            get_class=get_class,
+        )
+        for path, (payload, error) in zip(paths, map_files(
+            paths, kit, _file_loader, max_workers=max_workers
+        ))
+    ]
+
+
+def map_files(
+    paths: list[Path],
+    kit: str,
+    make_worker: Callable[[str], Callable[[Path], T]],
+    *,
+    max_workers: int | None = None,
+) -> list[T]:
+    """Process files in a pool of worker processes, results in order
+
+    Every process calls `make_worker` once with the UI kit name, and the
+    function it returns with each of its paths. `make_worker` must be a
+    module level function, so it can be sent to the workers.
+    """
+    if not paths:
+        return []
+    max_workers = min(max_workers or os.cpu_count() or 1, len(paths))
+    chunksize = max(1, len(paths) // (max_workers * 4))
+    # Imported here, as it pulls in multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+    with ProcessPoolExecutor(max_workers) as executor:
+        return list(executor.map(
+            _run_worker, paths, [kit] * len(paths),
+            [make_worker] * len(paths), chunksize=chunksize,
+        ))
+
+
+# Worker functions of worker processes by maker and UI kit name
+_workers: dict[tuple[Callable, str], Callable] = {}
+
+
+def _run_worker(path: Path, kit: str, make_worker: Callable) -> object:
+    worker = _workers.get((make_worker, kit))
+    if worker is None:
+        worker = _workers[make_worker, kit] = make_worker(kit)
+    return worker(path)
+
+
+def _file_loader(
+    kit: str
+) -> Callable[[Path], tuple[bytes | None, str | None]]:
+    return partial(_load_file, resolve_kit(kit).widget_class_factory)
+
+
+def _load_file(
+    get_class: WidgetClassFactory, path: Path
+) -> tuple[bytes | None, str | None]:
+    resolved = {}
+    try:
+        with open(path, encoding="utf-8") as f:
+            widget = Loader(get_class=recording_factory(get_class, resolved))(f)
+    except LoaderError as e:
+        return None, str(e)
+    except (OSError, UnicodeDecodeError) as e:
+        return None, f"Cannot read {path}: {e}"
+    except (TypeError, ValueError) as e:
+        # Raised for options the widget classes cannot take, such as
+        # `children`, which must not abort the other files
+        return None, str(e)
+    class_indexes = {cls: i for i, cls in enumerate(resolved)}
+    return marshal.dumps(
+        (list(resolved.values()), encode_tree(class_indexes, widget))
+    ), None
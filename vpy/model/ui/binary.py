@@ -0,0 +1,235 @@
+"""Compact binary UI definitions.
+
+A binary definition starts with `MAGIC` and holds one record per widget,
+with parents before their children:
+
+    class name, widget name, parent, field count, (field name, value)...
+
+Integers are written as unsigned LEB128 varints, and field values are
+tagged with their type. Strings are written once, the first time they
+are used, and referred to by their index in a string table afterwards,
+so the class and field names that repeat in every record take a byte or
+two. As the table is built while writing, records can be streamed to a
+file as they are encoded. Fields left at their defaults are omitted.
+
+`write_binary` and `save_binary` write definitions, `BinaryLoader` reads
+them back into widget trees.
+"""
+from dataclasses import dataclass, field
+from collections.abc import Callable
+from typing import BinaryIO
+import os
+
+from vpy.interfaces.uikit import WidgetClassFactory
+from vpy.model.ui.base import Widget
+from vpy.model.ui.loader import LoaderError
+from vpy.model.ui.writer import ClassNamer, class_name, write_plan
+
+
+MAGIC = b"VPYB\x01"
+
+# String references, 0 is followed by a new string
+NEW_STRING = 0
+# Value tags
+NONE, FALSE, TRUE, INT, STR = range(5)
+# The parent of the root widget, others refer to their parent's record
+# index plus one
+NO_PARENT = 0
+
+
+def write_binary(
+    root: Widget, file: BinaryIO, get_name: ClassNamer = class_name
+) -> None:
+    """Write the tree under `root` as a binary definition, in pre-order
+
+    `get_name` gives the name to write as the class of a widget, which
+    must be one the UI kit resolves back to its class.
+    """
+    strings: dict[str, int] = {}
+    class_names: dict[type[Widget], str] = {}
+
+    def put_string(out: bytearray, string: str) -> None:
+        index = strings.get(string)
+        if index is not None:
+            _put_varint(out, index)
+            return
+        strings[string] = len(strings) + 1
+        encoded = string.encode()
+        out.append(NEW_STRING)
+        _put_varint(out, len(encoded))
+        out += encoded
+
+    file.write(MAGIC)
+    stack: list[tuple[Widget, int]] = [(root, NO_PARENT)]
+    count = 0
+    while stack:
+        widget, parent = stack.pop()
+        count += 1
+        cls = type(widget)
+        name = class_names.get(cls)
+        if name is None:
+            name = class_names[cls] = get_name(cls)
+        values = [
+            (field_name, value) for field_name, default in write_plan(cls)
+            if (value := getattr(widget, field_name)) != default
+        ]
+        out = bytearray()
+        put_string(out, name)
+        put_string(out, widget.name)
+        _put_varint(out, parent)
+        _put_varint(out, len(values))
+        for field_name, value in values:
+            put_string(out, field_name)
+            if value is None:
+                out.append(NONE)
+            elif value is True or value is False:
+                out.append(TRUE if value else FALSE)
+            elif isinstance(value, int):
+                out.append(INT)
+                # Zigzag encoded, so small negative numbers stay short
+                _put_varint(
+                    out, value << 1 if value >= 0 else (~value << 1) | 1
+                )
+            elif isinstance(value, str):
+                out.append(STR)
+                put_string(out, value)
+            else:
+                raise ValueError(
+                    f"Cannot write {widget.name}.{field_name}: {value!r}"
+                )
+        file.write(out)
+        stack.extend(
+            (child, count)
+            for child in reversed(getattr(widget, "children", ()))
+        )
+
+
+def save_binary(
+    root: Widget, path: str | os.PathLike, get_name: ClassNamer = class_name
+) -> None:
+    with open(path, "wb") as f:
+        write_binary(root, f, get_name)
+
+
+def _put_varint(out: bytearray, value: int) -> None:
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+@dataclass(kw_only=True)
+class BinaryLoader:
+    get_class: WidgetClassFactory
+    # Widget classes by class name, as in Loader
+    _classes: dict[str, type[Widget]] = \
+        field(default_factory=dict, init=False, repr=False)
+    _field_names: dict[type[Widget], frozenset[str]] = \
+        field(default_factory=dict, init=False, repr=False)
+
+    def __call__(self, data: bytes) -> Widget:
+        if not data.startswith(MAGIC):
+            raise LoaderError("Not a binary UI definition")
+        try:
+            return self._load(memoryview(data), len(MAGIC))
+        except IndexError:
+            raise LoaderError("Truncated binary UI definition") from None
+        except UnicodeDecodeError as e:
+            raise LoaderError(f"Corrupt binary UI definition: {e}") from None
+
+    def load_file(self, path: str | os.PathLike) -> Widget:
+        with open(path, "rb") as f:
+            return self(f.read())
+
+    def _load(self, data: memoryview, pos: int) -> Widget:
+        strings: list[str] = []
+        widgets: list[Widget] = []
+
+        def get_varint() -> int:
+            nonlocal pos
+            value = shift = 0
+            while True:
+                byte = data[pos]
+                pos += 1
+                value |= (byte & 0x7F) << shift
+                if byte < 0x80:
+                    return value
+                shift += 7
+
+        def get_string() -> str:
+            nonlocal pos
+            index = get_varint()
+            if index != NEW_STRING:
+                if index > len(strings):
+                    raise LoaderError(f"Invalid string reference: {index}")
+                return strings[index - 1]
+            size = get_varint()
+            if pos + size > len(data):
+                raise IndexError()
+            string = str(data[pos:pos + size], "utf-8")
+            pos += size
+            strings.append(string)
+            return string
+
+        while pos < len(data):
+            cls = self._get_wgt_cls(get_string())
+            name = get_string()
+            parent = get_varint()
+            field_names = self._field_names[cls]
+            values = {}
+            for _ in range(get_varint()):
+                field_name = get_string()
+                if field_name not in field_names:
+                    raise LoaderError(
+                        f"Invalid field for {cls.__name__}: '{field_name}'"
+                    )
+                values[field_name] = self._get_value(get_varint, get_string)
+            widget = cls(name=name, **values)
+            if parent == NO_PARENT:
+                if widgets:
+                    raise LoaderError(
+                        f"Attempt to set '{name}' as root while"
+                        f" '{widgets[0].name}' is already set as such"
+                    )
+            elif parent > len(widgets):
+                raise LoaderError(f"Could not find the parent of '{name}'")
+            else:
+                parent_widget = widgets[parent - 1]
+                if not hasattr(parent_widget, "children"):
+                    raise LoaderError(
+                        f"'{parent_widget.name}' set as parent of '{name}',"
+                        " but its not a container"
+                    )
+                parent_widget.children.append(widget)
+            widgets.append(widget)
+        if not widgets:
+            raise LoaderError("Root widget not found!")
+        return widgets[0]
+
+    @staticmethod
+    def _get_value(
+        get_varint: Callable[[], int], get_string: Callable[[], str]
+    ) -> object:
+        tag = get_varint()
+        if tag == NONE:
+            return None
+        if tag == FALSE or tag == TRUE:
+            return tag == TRUE
+        if tag == INT:
+            value = get_varint()
+            return value >> 1 if not value & 1 else ~(value >> 1)
+        if tag == STR:
+            return get_string()
+        raise LoaderError(f"Invalid value tag: {tag}")
+
+    def _get_wgt_cls(self, wgt_cls_name: str) -> type[Widget]:
+        cls = self._classes.get(wgt_cls_name)
+        if cls is None:
+            cls = self.get_class(wgt_cls_name)
+            if cls is None:
+                raise LoaderError(f"Invalid widget class: '{wgt_cls_name}'")
+            self._classes[wgt_cls_name] = cls
+            self._field_names[cls] = frozenset(
+                name for name, _ in write_plan(cls)
+            )
+        return cls
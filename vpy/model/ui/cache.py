@@ -0,0 +1,216 @@
+"""On-disk cache of loaded UI definitions.
+
+A cache file holds a flat, marshalled list of the widgets a definition
+file was loaded into, so a warm load can construct the widgets directly
+without parsing or validating the definition again. Cache entries are
+keyed by the SHA-256 hash of the definition file and by the widget
+classes that were resolved while loading it. Any mismatch or sign of
+corruption is treated as a cache miss and the entry is rebuilt.
+"""
+from dataclasses import dataclass, fields
+from hashlib import blake2b, sha256
+from pathlib import Path
+import gc
+import marshal
+import os
+
+from vpy.interfaces.uikit import WidgetClassFactory
+from vpy.model.ui.base import Widget
+from vpy.model.ui.loader import Loader, LoaderError
+
+
+CACHE_DIR_NAME = "__vpycache__"
+CACHE_SUFFIX = ".vpyc"
+MAGIC = b"VPYC\x01"
+CHECKSUM_SIZE = 16
+
+# (class name, qualified class name, field names)
+ClassEntry = tuple[str, str, tuple[str, ...]]
+# (class index, widget name, non-default field values, parent index)
+WidgetRecord = tuple[int, str, dict[str, object], int]
+
+
+@dataclass(kw_only=True)
+class CachingLoader:
+    get_class: WidgetClassFactory
+    cache_dir: Path | None = None
+
+    def __call__(self, path: str | os.PathLike) -> Widget:
+        path = Path(path)
+        data = path.read_bytes()
+        content_hash = sha256(data).digest()
+        cache_path = self.cache_path(path)
+        widget = self._read_cache(cache_path, content_hash)
+        if widget is None:
+            resolved = {}
+            load = Loader(get_class=recording_factory(self.get_class, resolved))
+            try:
+                text = data.decode()
+            except UnicodeDecodeError as e:
+                raise LoaderError(f"Cannot decode {path}: {e}") from None
+            widget = load(text.splitlines())
+            self._write_cache(cache_path, content_hash, resolved, widget)
+        return widget
+
+    def cache_path(self, path: Path) -> Path:
+        if self.cache_dir is None:
+            return path.parent / CACHE_DIR_NAME / (path.name + CACHE_SUFFIX)
+        path_hash = sha256(str(path.resolve()).encode()).hexdigest()[:16]
+        return self.cache_dir / f"{path.name}-{path_hash}{CACHE_SUFFIX}"
+
+    def _read_cache(self, cache_path: Path, content_hash: bytes) -> Widget | None:
+        payload = read_checked(cache_path, MAGIC)
+        if payload is None:
+            return None
+        try:
+            cached_hash, class_table, records = marshal.loads(payload)
+            if cached_hash != content_hash:
+                return None
+            classes = [self._resolve_cached_class(*e) for e in class_table]
+            if None in classes:
+                return None
+            return decode_tree(classes, records)
+        except (ValueError, TypeError, EOFError, IndexError):
+            return None
+
+    def _resolve_cached_class(
+        self, class_name: str, qualname: str, field_names: tuple[str, ...]
+    ) -> type[Widget] | None:
+        cls = self.get_class(class_name)
+        if cls is None or _class_entry(class_name, cls) != (
+            class_name, qualname, field_names
+        ):
+            return None
+        return cls
+
+    @staticmethod
+    def _write_cache(
+        cache_path: Path,
+        content_hash: bytes,
+        resolved: dict[type[Widget], str],
+        widget: Widget,
+    ) -> None:
+        class_indexes = {cls: i for i, cls in enumerate(resolved)}
+        class_table = tuple(
+            _class_entry(class_name, cls)
+            for cls, class_name in resolved.items()
+        )
+        try:
+            payload = marshal.dumps(
+                (content_hash, class_table, encode_tree(class_indexes, widget))
+            )
+        except (ValueError, KeyError):
+            # Widget values marshal cannot handle, or classes that were
+            # not resolved through the factory, cannot be cached
+            return
+        write_checked(cache_path, MAGIC, payload)
+
+
+def read_checked(path: Path, magic: bytes) -> bytes | None:
+    """Read the payload of a file written by `write_checked`
+
+    Returns `None` if the file cannot be read, does not start with
+    `magic` or fails its checksum.
+    """
+    try:
+        blob = path.read_bytes()
+    except OSError:
+        return None
+    header_size = len(magic) + CHECKSUM_SIZE
+    checksum, payload = blob[len(magic):header_size], blob[header_size:]
+    if (
+        not blob.startswith(magic)
+        or blake2b(payload, digest_size=CHECKSUM_SIZE).digest() != checksum
+    ):
+        return None
+    return payload
+
+
+def write_checked(path: Path, magic: bytes, payload: bytes) -> None:
+    """Atomically write `payload` along with `magic` and a checksum
+
+    Errors are ignored, as cache files can always be rebuilt.
+    """
+    # tempfile takes longer to import than everything else loading needs
+    from tempfile import NamedTemporaryFile
+    checksum = blake2b(payload, digest_size=CHECKSUM_SIZE).digest()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with NamedTemporaryFile(
+            dir=path.parent, prefix=path.name, delete=False
+        ) as f:
+            f.write(magic + checksum + payload)
+        os.replace(f.name, path)
+    except OSError:
+        pass
+
+
+def recording_factory(
+    get_class: WidgetClassFactory, resolved: dict[type[Widget], str]
+) -> WidgetClassFactory:
+    """Wrap `get_class` to record the classes it resolves by name"""
+    def recording_get_class(class_name: str) -> type[Widget] | None:
+        cls = get_class(class_name)
+        if cls is not None:
+            resolved.setdefault(cls, class_name)
+        return cls
+    return recording_get_class
+
+
+def _class_entry(class_name: str, cls: type[Widget]) -> ClassEntry:
+    return (
+        class_name,
+        f"{cls.__module__}.{cls.__qualname__}",
+        tuple(f.name for f in fields(cls)),
+    )
+
+
+def encode_tree(
+    class_indexes: dict[type[Widget], int], root: Widget
+) -> list[WidgetRecord]:
+    """Flatten a widget tree into marshallable records, in pre-order"""
+    records = []
+    class_fields = {
+        cls: [
+            (f.name, f.default) for f in fields(cls)
+            if f.name not in ("name", "children")
+        ]
+        for cls in class_indexes
+    }
+    stack = [(root, -1)]
+    while stack:
+        widget, parent_index = stack.pop()
+        cls = type(widget)
+        values = {
+            name: value
+            for name, default in class_fields[cls]
+            if (value := getattr(widget, name)) != default
+        }
+        records.append((class_indexes[cls], widget.name, values, parent_index))
+        own_index = len(records) - 1
+        stack.extend(
+            (child, own_index)
+            for child in reversed(getattr(widget, "children", ()))
+        )
+    return records
+
+
+def decode_tree(
+    classes: list[type[Widget]], records: list[WidgetRecord]
+) -> Widget:
+    """Build a widget tree from records made by `encode_tree`"""
+    widgets = []
+    # Nothing created here can be garbage, so avoid the collector
+    # repeatedly scanning the growing tree
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for class_index, name, values, parent_index in records:
+            widget = classes[class_index](name=name, **values)
+            if parent_index >= 0:
+                widgets[parent_index].children.append(widget)
+            widgets.append(widget)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return widgets[0]
@@ -0,0 +1,116 @@
+"""Finding widgets that share cells of a grid.
+
+`collisions` sweeps over the rows of a grid. The widgets spanning the
+current row are kept in a segment tree over their columns, where every
+node holds the widgets covering all of its columns along with the
+lowest key found below it. Finding the widgets a widget overlaps then
+takes O(log² n) time, whatever number of cells widgets span, and
+checking a grid of n widgets O(n log² n).
+"""
+from collections.abc import Iterable, Iterator
+from heapq import heappop, heappush
+from math import inf
+
+
+# (key, row, rowspan, column, columnspan)
+Cell = tuple[int, int, int, int, int]
+
+
+def collisions(cells: Iterable[Cell]) -> Iterator[tuple[int, int]]:
+    """Yield `(other, key)` pairs of widgets in a grid that share cells
+
+    Every widget that shares cells with widgets starting in the same row
+    as it or above is yielded once, along with the lowest key among
+    those. Of widgets starting in the same row, the ones with lower keys
+    count as above. Spans must be positive.
+    """
+    cells = list(cells)
+    if len(cells) < 2:
+        return
+    columns = sorted(
+        {column for _, _, _, column, _ in cells}
+        | {column + span for _, _, _, column, span in cells}
+    )
+    column_index = {column: i for i, column in enumerate(columns)}
+    tree = _SegmentTree(len(columns) - 1)
+    # Rows end before the rows that start where they end, and widgets
+    # starting in the same row are checked in the order of their keys
+    events = []
+    for key, row, rowspan, column, columnspan in cells:
+        span = (column_index[column], column_index[column + columnspan])
+        events.append((row, 1, key, span))
+        events.append((row + rowspan, 0, key, span))
+    events.sort()
+    for _, starts, key, (first, last) in events:
+        if starts:
+            other = tree.min_key(first, last)
+            if other != inf:
+                yield other, key
+            tree.add(first, last, key)
+        else:
+            tree.remove(first, last, key)
+
+
+class _SegmentTree:
+    """Intervals of leaves, each with a key, finding the lowest key of
+    those that overlap an interval"""
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        # The keys of intervals covering every leaf of a node but not of
+        # its parent, lazily cleared of removed keys
+        self.keys: list[list[int]] = [[] for _ in range(4 * size)]
+        # The lowest key of intervals covering any leaf of a node
+        self.lowest: list[float] = [inf] * (4 * size)
+        self.active: set[int] = set()
+
+    def add(self, first: int, last: int, key: int) -> None:
+        self.active.add(key)
+        self._update(1, 0, self.size, first, last, key)
+
+    def remove(self, first: int, last: int, key: int) -> None:
+        self.active.discard(key)
+        self._update(1, 0, self.size, first, last, None)
+
+    def min_key(self, first: int, last: int) -> float:
+        """The lowest key of intervals overlapping leaves `first` up to,
+        but not including, `last`"""
+        return self._query(1, 0, self.size, first, last)
+
+    def _own(self, node: int) -> float:
+        keys = self.keys[node]
+        while keys and keys[0] not in self.active:
+            heappop(keys)
+        return keys[0] if keys else inf
+
+    def _update(
+        self, node: int, lo: int, hi: int, first: int, last: int,
+        key: int | None,
+    ) -> None:
+        if last <= lo or hi <= first:
+            return
+        if first <= lo and hi <= last:
+            if key is not None:
+                heappush(self.keys[node], key)
+        else:
+            mid = (lo + hi) // 2
+            self._update(2 * node, lo, mid, first, last, key)
+            self._update(2 * node + 1, mid, hi, first, last, key)
+        lowest = self._own(node)
+        if hi - lo > 1:
+            lowest = min(lowest, self.lowest[2 * node], self.lowest[2 * node + 1])
+        self.lowest[node] = lowest
+
+    def _query(
+        self, node: int, lo: int, hi: int, first: int, last: int
+    ) -> float:
+        if last <= lo or hi <= first or self.lowest[node] == inf:
+            return inf
+        if first <= lo and hi <= last:
+            return self.lowest[node]
+        mid = (lo + hi) // 2
+        return min(
+            self._own(node),
+            self._query(2 * node, lo, mid, first, last),
+            self._query(2 * node + 1, mid, hi, first, last),
+        )
@@ -0,0 +1,333 @@
+"""Undo history of widget trees with structural sharing.
+
+A `Node` is an immutable snapshot of a widget and the widgets below it.
+Editing a snapshot with `set_fields`, `insert_child` or `remove_child`
+returns a new snapshot that copies only the nodes on the path from the
+root to the edited widget and shares every other subtree with the old
+one, so a version costs time and memory in proportion to the depth of
+the edit rather than to the size of the form. `History` keeps a bounded
+list of versions for undo and redo, and `sync` brings a live widget
+tree from one version to another, skipping the subtrees both share.
+"""
+from dataclasses import dataclass, fields, replace, MISSING
+from collections.abc import Callable
+import sys
+
+from vpy.model.ui.base import Widget
+
+
+# Indexes into the children of the containers from the root to a widget
+Path = tuple[int, ...]
+
+DEFAULT_MAX_VERSIONS = 1000
+DEFAULT_MAX_BYTES = 64 * 2**20
+
+
+@dataclass(frozen=True, slots=True)
+class Node:
+    cls: type[Widget]
+    name: str
+    # The fields that differ from their defaults, except name and children
+    values: tuple[tuple[str, object], ...] = ()
+    # `None` for widgets that are not containers
+    children: tuple["Node", ...] | None = None
+
+    def get(self, field_name: str) -> object:
+        for name, value in self.values:
+            if name == field_name:
+                return value
+        return _defaults(self.cls)[field_name]
+
+    def to_widget(self) -> Widget:
+        """Materialize the widget along with all the widgets below it"""
+        widget = self.cls(name=self.name, **dict(self.values))
+        stack = [(widget, self)]
+        while stack:
+            parent, node = stack.pop()
+            for child_node in node.children or ():
+                child = child_node.cls(
+                    name=child_node.name, **dict(child_node.values)
+                )
+                parent.children.append(child)
+                stack.append((child, child_node))
+        return widget
+
+
+_class_defaults: dict[type[Widget], dict[str, object]] = {}
+
+
+def _defaults(cls: type[Widget]) -> dict[str, object]:
+    defaults = _class_defaults.get(cls)
+    if defaults is None:
+        defaults = _class_defaults[cls] = {
+            f.name: f.default for f in fields(cls)
+            if f.name not in ("name", "children") and f.default is not MISSING
+        }
+    return defaults
+
+
+def snapshot(root: Widget) -> Node:
+    """Take a snapshot of a widget tree"""
+    built: dict[int, Node] = {}
+    # Nodes are immutable, so children are built before their parents
+    stack = [(root, False)]
+    while stack:
+        widget, children_done = stack.pop()
+        children = getattr(widget, "children", None)
+        if children and not children_done:
+            stack.append((widget, True))
+            stack.extend((child, False) for child in children)
+            continue
+        defaults = _defaults(type(widget))
+        built[id(widget)] = Node(
+            cls=type(widget),
+            name=widget.name,
+            values=tuple(
+                (name, value) for name, default in defaults.items()
+                if (value := getattr(widget, name)) != default
+            ),
+            children=None if children is None
+            else tuple(built.pop(id(child)) for child in children),
+        )
+    return built[id(root)]
+
+
+def node_at(root: Node, path: Path) -> Node:
+    node = root
+    for index in path:
+        node = node.children[index]
+    return node
+
+
+def path_to(root: Node, name: str) -> Path | None:
+    """The path of the widget with the given name, if there is one"""
+    stack: list[tuple[Node, Path]] = [(root, ())]
+    while stack:
+        node, path = stack.pop()
+        if node.name == name:
+            return path
+        stack.extend(
+            (child, (*path, i)) for i, child in enumerate(node.children or ())
+        )
+    return None
+
+
+def set_fields(root: Node, path: Path, **values: object) -> Node:
+    """A new version of the tree with fields of a widget changed"""
+    def edit(node: Node) -> Node:
+        defaults = _defaults(node.cls)
+        name = values.pop("name", node.name)
+        unknown = values.keys() - defaults.keys()
+        if unknown:
+            raise TypeError(
+                f"{node.cls.__name__} has no field '{min(unknown)}'"
+            )
+        merged = dict(node.values)
+        merged.update(values)
+        new_values = tuple(
+            (field_name, merged[field_name]) for field_name in defaults
+            if field_name in merged
+            and merged[field_name] != defaults[field_name]
+        )
+        if name == node.name and new_values == node.values:
+            return node
+        return replace(node, name=name, values=new_values)
+    return _edit(root, path, edit)
+
+
+def insert_child(root: Node, path: Path, index: int, child: Node) -> Node:
+    """A new version of the tree with a widget added to a container"""
+    def edit(node: Node) -> Node:
+        if node.children is None:
+            raise ValueError(f"'{node.name}' is not a container")
+        children = node.children
+        return replace(
+            node, children=children[:index] + (child,) + children[index:]
+        )
+    return _edit(root, path, edit)
+
+
+def remove_child(root: Node, path: Path) -> Node:
+    """A new version of the tree without a widget"""
+    if not path:
+        raise ValueError("Cannot remove the root widget")
+    *parent_path, index = path
+    def edit(node: Node) -> Node:
+        children = node.children
+        return replace(node, children=children[:index] + children[index + 1:])
+    return _edit(root, tuple(parent_path), edit)
+
+
+def _edit(root: Node, path: Path, edit: Callable[[Node], Node]) -> Node:
+    nodes = [root]
+    for index in path:
+        nodes.append(nodes[-1].children[index])
+    old = nodes.pop()
+    new = edit(old)
+    if new is old:
+        return root
+    # Copies the containers above the edited widget, sharing their other
+    # children with the old version
+    for index in reversed(path):
+        parent = nodes.pop()
+        children = parent.children
+        new = replace(
+            parent, children=children[:index] + (new,) + children[index + 1:]
+        )
+    return new
+
+
+def sync(widget: Widget, old: Node, new: Node) -> list[Widget]:
+    """Update a widget tree that matches `old` to match `new`
+
+    Subtrees that the two versions share are skipped. Widgets are kept
+    as long as their name and class stay the same, and the widgets that
+    were patched, added, or had their children replaced are returned.
+    """
+    if old.cls is not new.cls:
+        raise ValueError(
+            f"Cannot turn the root widget '{old.name}' into a"
+            f" {new.cls.__name__}"
+        )
+    changed = []
+    stack = [(widget, old, new)]
+    while stack:
+        widget, old, new = stack.pop()
+        if old is new:
+            continue
+        if old.values != new.values or old.name != new.name:
+            widget.name = new.name
+            for field_name in dict(old.values).keys() | dict(new.values).keys():
+                setattr(widget, field_name, new.get(field_name))
+            changed.append(widget)
+        if old.children is new.children or old.children is None:
+            continue
+        by_identity = {
+            id(node): child for node, child in zip(old.children, widget.children)
+        }
+        by_name = {
+            node.name: (node, child)
+            for node, child in zip(old.children, widget.children)
+        }
+        children = []
+        for node in new.children:
+            child = by_identity.get(id(node))
+            if child is None:
+                old_node, child = by_name.get(node.name, (None, None))
+                if old_node is not None and old_node.cls is node.cls:
+                    stack.append((child, old_node, node))
+                else:
+                    child = node.to_widget()
+                    changed.append(child)
+            children.append(child)
+        if (
+            len(children) != len(widget.children)
+            or any(a is not b for a, b in zip(children, widget.children))
+        ):
+            widget.children[:] = children
+            changed.append(widget)
+    return changed
+
+
+class History:
+    """Versions of a widget tree to undo and redo edits through
+
+    At most `max_versions` are kept, and the oldest are dropped as long
+    as the estimated memory the history holds on top of a single version
+    of the tree exceeds `max_bytes`. The current version is never
+    dropped.
+    """
+
+    def __init__(
+        self,
+        root: Node,
+        *,
+        max_versions: int = DEFAULT_MAX_VERSIONS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+    ) -> None:
+        self.max_versions = max_versions
+        self.max_bytes = max_bytes
+        self._versions = [root]
+        # The estimated size of the nodes every version adds to the one
+        # before it
+        self._costs = [0]
+        self._bytes = 0
+        self._current = 0
+
+    @property
+    def current(self) -> Node:
+        return self._versions[self._current]
+
+    @property
+    def bytes(self) -> int:
+        return self._bytes
+
+    def __len__(self) -> int:
+        return len(self._versions)
+
+    @property
+    def can_undo(self) -> bool:
+        return self._current > 0
+
+    @property
+    def can_redo(self) -> bool:
+        return self._current < len(self._versions) - 1
+
+    def commit(self, root: Node) -> None:
+        """Make `root` the current version, dropping the ones to redo"""
+        if root is self.current:
+            return
+        del self._versions[self._current + 1:]
+        self._bytes -= sum(self._costs[self._current + 1:])
+        del self._costs[self._current + 1:]
+        cost = _added_bytes(self.current, root)
+        self._versions.append(root)
+        self._costs.append(cost)
+        self._bytes += cost
+        self._current += 1
+        while self._current > 0 and (
+            len(self._versions) > self.max_versions
+            or self._bytes > self.max_bytes
+        ):
+            del self._versions[0]
+            del self._costs[0]
+            # The oldest version left becomes the base
+            self._bytes -= self._costs[0]
+            self._costs[0] = 0
+            self._current -= 1
+
+    def undo(self) -> Node | None:
+        if not self.can_undo:
+            return None
+        self._current -= 1
+        return self.current
+
+    def redo(self) -> Node | None:
+        if not self.can_redo:
+            return None
+        self._current += 1
+        return self.current
+
+
+def _added_bytes(old: Node, new: Node) -> int:
+    """Estimated size of the nodes in `new` that are not in `old`"""
+    size = 0
+    stack: list[tuple[Node | None, Node]] = [(old, new)]
+    while stack:
+        old, new = stack.pop()
+        if old is new:
+            continue
+        size += (
+            sys.getsizeof(new) + sys.getsizeof(new.values)
+            + sum(map(sys.getsizeof, new.values))
+        )
+        if new.children is None:
+            continue
+        size += sys.getsizeof(new.children)
+        old_children = {
+            node.name: node for node in (old.children or ())
+        } if old is not None else {}
+        stack.extend(
+            (old_children.get(child.name), child) for child in new.children
+        )
+    return size
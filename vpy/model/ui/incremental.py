@@ -0,0 +1,265 @@
+"""Incremental reloading of UI definitions into a live widget tree.
+
+`IncrementalLoader` remembers the text and options of the sections it
+loaded last time. When the definition is loaded again, only chunks of
+text that changed are parsed, only sections whose options changed are
+turned into widgets, and the existing `Widget` objects are patched in
+place. The tree structure is only validated and relinked when parents,
+classes or the order of sections changed. The returned `ChangeSet`
+tells consumers what was touched, so they can refresh only the affected
+parts of whatever they derived from the tree.
+"""
+from dataclasses import dataclass, field, fields
+from collections.abc import Iterable
+
+from vpy.interfaces.uikit import WidgetClassFactory
+from vpy.model.ui.base import Widget, WidgetContainer
+from vpy.model.ui.loader import Loader, LoaderError
+from vpy.model.ui.parser import ParseError, Section, parse_sections, split_chunks
+
+
+@dataclass(kw_only=True)
+class ChangeSet:
+    added: list[Widget] = field(default_factory=list)
+    removed: list[Widget] = field(default_factory=list)
+    reparented: list[Widget] = field(default_factory=list)
+    changed: dict[str, dict[str, tuple[object, object]]] = \
+        field(default_factory=dict)
+    relinked: list[WidgetContainer] = field(default_factory=list)
+    root: Widget | None = None
+
+    def __bool__(self) -> bool:
+        return bool(
+            self.added or self.removed or self.reparented
+            or self.changed or self.relinked or self.root
+        )
+
+
+@dataclass(kw_only=True)
+class IncrementalLoader:
+    """Load a UI definition and keep the widget tree it produced up to date
+
+    `added` and `removed` in the returned change set hold widgets that
+    were created or dropped. Widgets whose class changed are reported
+    in both, as the old object is replaced. `changed` maps the names of
+    widgets that were patched in place to `{field: (old, new)}`.
+    `reparented` holds kept widgets that moved to another parent
+    object, and `relinked` holds containers whose `children` lists were
+    rewritten. `root` is set when the root widget was replaced.
+
+    If loading fails, the tree is left untouched.
+    """
+    get_class: WidgetClassFactory
+    root: Widget | None = field(default=None, init=False)
+    _loader: Loader = field(init=False, repr=False)
+    _chunks: dict[str, list[Section]] = \
+        field(default_factory=dict, init=False, repr=False)
+    _defaults: dict[str, str] = \
+        field(default_factory=dict, init=False, repr=False)
+    _sections: dict[str, dict[str, str]] = \
+        field(default_factory=dict, init=False, repr=False)
+    _widgets: dict[str, Widget] = \
+        field(default_factory=dict, init=False, repr=False)
+    _children: dict[str, list[str]] = \
+        field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._loader = Loader(get_class=self.get_class)
+
+    def __call__(self, stream: Iterable[str]) -> ChangeSet:
+        chunks, defaults, sections, dirty = self._parse_stream(stream)
+        changes = ChangeSet()
+        removed = self._widgets.keys() - sections.keys()
+        new_widgets, relink = \
+            self._load_changed_widgets(sections, dirty, changes)
+        if new_widgets or removed:
+            widgets = {
+                name: new_widgets[name] if name in new_widgets
+                else self._widgets[name]
+                for name in sections
+            }
+        else:
+            widgets = self._widgets
+        if (
+            self.root is None or relink or removed
+            or list(sections) != list(self._sections)
+        ):
+            root_name, children = self._link_widgets(sections, widgets)
+        else:
+            root_name, children = self.root.name, self._children
+
+        changes.removed.extend(self._widgets[name] for name in removed)
+        for name, diff in changes.changed.items():
+            for field_name, (_, value) in diff.items():
+                setattr(widgets[name], field_name, value)
+        if children is not self._children:
+            self._relink_children(widgets, children, changes)
+        if self.root is not widgets[root_name]:
+            self.root = changes.root = widgets[root_name]
+
+        self._chunks, self._defaults, self._sections = \
+            chunks, defaults, sections
+        self._widgets, self._children = widgets, children
+        return changes
+
+    def _parse_stream(self, stream: Iterable[str]) -> tuple[
+        dict[str, list[Section]],
+        dict[str, str],
+        dict[str, dict[str, str]],
+        list[str] | None,
+    ]:
+        """Parse the chunks of text that changed since the last load
+
+        Returns the parsed chunks, the defaults, all sections and the
+        names of the sections that were parsed again, or `None` if all
+        of them have to be considered changed.
+        """
+        texts = split_chunks(stream)
+        try:
+            return self._parse_chunks(texts)
+        except ParseError as e:
+            # Parse everything at once to report the right line number
+            lines = "\n".join(texts).splitlines()
+            list(self._loader._parse_stream(lines))
+            raise LoaderError(str(e)) from e
+
+    def _parse_chunks(self, texts: list[str]) -> tuple[
+        dict[str, list[Section]],
+        dict[str, str],
+        dict[str, dict[str, str]],
+        list[str] | None,
+    ]:
+        chunks = {}
+        defaults = {}
+        sections = {}
+        dirty = []
+        for text in texts:
+            parsed = chunks.get(text)
+            if parsed is None:
+                parsed = self._chunks.get(text)
+            if parsed is None:
+                chunk_defaults = {}
+                parsed = list(
+                    parse_sections(text.splitlines(), defaults=chunk_defaults)
+                )
+                if chunk_defaults:
+                    if sections:
+                        raise ParseError("'.default' follows other sections")
+                    defaults.update(chunk_defaults)
+                dirty.extend(name for name, _ in parsed)
+            chunks[text] = parsed
+            for name, items in parsed:
+                if name in sections:
+                    raise ParseError(f"section '{name}' already exists")
+                sections[name] = items
+        if defaults:
+            sections = {
+                name: {**defaults, **items} for name, items in sections.items()
+            }
+        if defaults != self._defaults:
+            dirty = None
+        return chunks, defaults, sections, dirty
+
+    def _load_changed_widgets(
+        self,
+        sections: dict[str, dict[str, str]],
+        dirty: list[str] | None,
+        changes: ChangeSet,
+    ) -> tuple[dict[str, Widget], bool]:
+        new_widgets = {}
+        relink = False
+        for name in sections if dirty is None else dirty:
+            items = sections[name]
+            old_items = self._sections.get(name)
+            if old_items == items:
+                continue
+            if old_items is None or \
+                    old_items.get("parent") != items.get("parent"):
+                relink = True
+            widget = self._loader._load_widget(name, items)
+            old_widget = self._widgets.get(name)
+            if type(old_widget) is not type(widget):
+                if old_widget is not None:
+                    changes.removed.append(old_widget)
+                changes.added.append(widget)
+                new_widgets[name] = widget
+                relink = True
+                continue
+            diff = {
+                f.name: (old_value, new_value)
+                for f in fields(widget)
+                if f.name not in ("name", "children")
+                and (old_value := getattr(old_widget, f.name))
+                != (new_value := getattr(widget, f.name))
+            }
+            if diff:
+                changes.changed[name] = diff
+        return new_widgets, relink
+
+    @staticmethod
+    def _link_widgets(
+        sections: dict[str, dict[str, str]], widgets: dict[str, Widget]
+    ) -> tuple[str, dict[str, list[str]]]:
+        root_name = None
+        children = {}
+        for name, items in sections.items():
+            if "parent" in items:
+                children.setdefault(items["parent"], []).append(name)
+            elif root_name is None:
+                root_name = name
+            else:
+                raise LoaderError(
+                    f"Attempt to set '{name}' as root"
+                    f" while '{root_name}' is already"
+                    " set as such"
+                )
+        if root_name is None:
+            raise LoaderError("Root widget not found!")
+        for parent_name, child_names in children.items():
+            parent = widgets.get(parent_name)
+            if parent is None:
+                raise LoaderError(
+                    f"Could not find '{parent_name}' the"
+                    f" parent of '{child_names[0]}'"
+                )
+            if not hasattr(parent, "children"):
+                raise LoaderError(
+                    f"'{parent_name}' set as parent of "
+                    f"'{child_names[0]}', but its not a"
+                    " container"
+                )
+        return root_name, children
+
+    def _relink_children(
+        self,
+        widgets: dict[str, Widget],
+        children: dict[str, list[str]],
+        changes: ChangeSet,
+    ) -> None:
+        added = {id(w) for w in changes.added}
+        for parent_name in children.keys() | self._children.keys():
+            parent = widgets.get(parent_name)
+            if parent is None:
+                continue
+            child_names = children.get(parent_name, [])
+            if not child_names and not hasattr(parent, "children"):
+                continue
+            parent_replaced = parent is not self._widgets.get(parent_name)
+            # Widgets whose class changed replace the old ones even if
+            # the names of the children stay the same
+            if not parent_replaced and \
+                    child_names == self._children.get(parent_name, []) and \
+                    not any(id(widgets[name]) in added for name in child_names):
+                continue
+            if not parent_replaced:
+                changes.relinked.append(parent)
+            parent.children[:] = [widgets[name] for name in child_names]
+            for name in child_names:
+                child = widgets[name]
+                if id(child) in added:
+                    continue
+                old_parent = self._widgets.get(
+                    self._sections[name].get("parent")
+                )
+                if old_parent is not parent:
+                    changes.reparented.append(child)
@@ -0,0 +1,260 @@
+"""Headless grid layout of widget trees.
+
+`GridLayout` computes the geometry a form would get from the Tk grid
+geometry manager, from the grid fields of its model alone, so previews,
+hit-testing and layout checks do not need to realize the form. Rows and
+columns are sized to fit the widgets in them, widgets spanning several
+of them get the missing space spread over those, and the grid is
+anchored at the top left of its container, as row and column weights
+are not part of the model, and negative rows and columns, which Tk
+refuses, raise a ValueError. The natural size of widgets that are not
+containers comes from a `measure` function, as it depends on the UI
+kit; `natural_size` gives rough estimates for the built-in widgets.
+
+The layout of every container is cached. When a widget changes, only
+the cached layouts of the containers holding it, up to the root, have to
+be dropped with `invalidate`.
+"""
+from dataclasses import dataclass
+from collections.abc import Callable, Iterator
+
+from vpy.model.ui.base import Widget
+from vpy.model.ui.widgets import Button
+
+
+# (x0, y0, x1, y1)
+Rect = tuple[int, int, int, int]
+Size = tuple[int, int]
+Measure = Callable[[Widget], Size]
+
+CHAR_WIDTH = 7
+LINE_HEIGHT = 17
+BUTTON_PADDING = 4
+BUTTON_MIN_CHARS = 11
+
+
+def natural_size(widget: Widget) -> Size:
+    """Estimated size of a widget without children, before grid padding"""
+    if isinstance(widget, Button):
+        return (
+            max(len(widget.text), BUTTON_MIN_CHARS) * CHAR_WIDTH
+            + 2 * BUTTON_PADDING,
+            LINE_HEIGHT + 2 * BUTTON_PADDING,
+        )
+    return 0, 0
+
+
+@dataclass(kw_only=True)
+class ContainerLayout:
+    column_widths: list[int]
+    row_heights: list[int]
+    # The children and their rectangles, relative to the container
+    cells: list[tuple[Widget, Rect]]
+
+    @property
+    def size(self) -> Size:
+        return sum(self.column_widths), sum(self.row_heights)
+
+
+@dataclass(kw_only=True)
+class LayoutStats:
+    hits: int = 0
+    misses: int = 0
+
+
+class GridLayout:
+    """Grid geometry of the widgets in the tree under `root`
+
+    Rectangles are relative to the top left corner of the root, which is
+    given its natural size.
+    """
+
+    def __init__(self, root: Widget, measure: Measure = natural_size) -> None:
+        self.root = root
+        self.measure = measure
+        self.stats = LayoutStats()
+        self._layouts: dict[int, ContainerLayout] = {}
+        self._sizes: dict[int, Size] = {}
+        self._parents: dict[int, Widget] = {}
+        self._relative: dict[int, Rect] = {}
+
+    def layout(self, container: Widget) -> ContainerLayout:
+        layout = self._layouts.get(id(container))
+        if layout is not None:
+            self.stats.hits += 1
+            return layout
+        # Containers are laid out after their children, without recursion
+        # as forms can nest deeply
+        stack = [(container, False)]
+        while stack:
+            widget, children_done = stack.pop()
+            if id(widget) in self._layouts:
+                continue
+            if children_done:
+                self._layouts[id(widget)] = self._lay_out(widget)
+                self.stats.misses += 1
+                continue
+            stack.append((widget, True))
+            stack.extend(
+                (child, False) for child in widget.children
+                if hasattr(child, "children")
+                and id(child) not in self._layouts
+            )
+        return self._layouts[id(container)]
+
+    def size(self, widget: Widget) -> Size:
+        """The size a widget asks for, including its internal padding"""
+        if hasattr(widget, "children"):
+            self.layout(widget)
+        return self._size(widget)
+
+    def rect(self, widget: Widget) -> Rect:
+        if widget is self.root:
+            return (0, 0, *self.size(widget))
+        if id(widget) not in self._parents:
+            self.layout(self.root)
+        x = y = 0
+        size = None
+        while widget is not self.root:
+            parent = self._parents.get(id(widget))
+            if parent is None:
+                raise ValueError(f"'{widget.name}' is not in the layout tree")
+            # Makes sure the offset of the widget in its parent is current
+            self.layout(parent)
+            x0, y0, x1, y1 = self._relative[id(widget)]
+            if size is None:
+                size = (x1 - x0, y1 - y0)
+            x, y = x + x0, y + y0
+            widget = parent
+        return x, y, x + size[0], y + size[1]
+
+    def rects(self) -> Iterator[tuple[Widget, Rect]]:
+        """Every widget in the tree with its rectangle, parents first"""
+        root_rect = self.rect(self.root)
+        yield self.root, root_rect
+        stack = [(self.root, root_rect)]
+        while stack:
+            container, (x, y, _, _) = stack.pop()
+            for child, (x0, y0, x1, y1) in self.layout(container).cells:
+                rect = (x + x0, y + y0, x + x1, y + y1)
+                yield child, rect
+                if hasattr(child, "children"):
+                    stack.append((child, rect))
+
+    def widget_at(self, x: int, y: int) -> Widget | None:
+        """The innermost widget holding a point"""
+        x0, y0, x1, y1 = self.rect(self.root)
+        if not (x0 <= x < x1 and y0 <= y < y1):
+            return None
+        found = self.root
+        while hasattr(found, "children"):
+            for child, (cx0, cy0, cx1, cy1) in self.layout(found).cells:
+                if x0 + cx0 <= x < x0 + cx1 and y0 + cy0 <= y < y0 + cy1:
+                    found, x0, y0 = child, x0 + cx0, y0 + cy0
+                    break
+            else:
+                break
+        return found
+
+    def invalidate(self, widget: Widget) -> None:
+        """Forget what depends on a widget whose fields or children changed"""
+        self._sizes.pop(id(widget), None)
+        while widget is not None:
+            self._layouts.pop(id(widget), None)
+            widget = self._parents.get(id(widget))
+
+    def _size(self, widget: Widget) -> Size:
+        if hasattr(widget, "children"):
+            width, height = self._layouts[id(widget)].size
+        else:
+            size = self._sizes.get(id(widget))
+            if size is None:
+                size = self._sizes[id(widget)] = self.measure(widget)
+            width, height = size
+        return width + 2 * widget.padding_x, height + 2 * widget.padding_y
+
+    def _lay_out(self, container: Widget) -> ContainerLayout:
+        placements = []
+        next_row = 0
+        for child in container.children:
+            # As Tk places widgets gridded without a row or column
+            row = next_row if child.grid_row is None else child.grid_row
+            column = 0 if child.grid_column is None else child.grid_column
+            if row < 0 or column < 0:
+                raise ValueError(
+                    f"Grid position ({row}, {column}) of '{child.name}'"
+                    " out of range"
+                )
+            rowspan = max(1, child.grid_rowspan)
+            columnspan = max(1, child.grid_columnspan)
+            next_row = max(next_row, row + rowspan)
+            placements.append(
+                (child, row, column, rowspan, columnspan, self._size(child))
+            )
+        column_widths = _track_sizes(
+            (column, columnspan, width + 2 * child.margin_x)
+            for child, _, column, _, columnspan, (width, _) in placements
+        )
+        row_heights = _track_sizes(
+            (row, rowspan, height + 2 * child.margin_y)
+            for child, row, _, rowspan, _, (_, height) in placements
+        )
+        column_starts = _starts(column_widths)
+        row_starts = _starts(row_heights)
+        cells = []
+        for child, row, column, rowspan, columnspan, (width, height) in placements:
+            x, width = _place(
+                column_starts[column] + child.margin_x,
+                column_starts[column + columnspan] - child.margin_x,
+                width, child.stick_west, child.stick_east,
+            )
+            y, height = _place(
+                row_starts[row] + child.margin_y,
+                row_starts[row + rowspan] - child.margin_y,
+                height, child.stick_north, child.stick_south,
+            )
+            rect = (x, y, x + width, y + height)
+            cells.append((child, rect))
+            self._parents[id(child)] = container
+            self._relative[id(child)] = rect
+        return ContainerLayout(
+            column_widths=column_widths, row_heights=row_heights, cells=cells
+        )
+
+
+def _track_sizes(spans: Iterator[tuple[int, int, int]]) -> list[int]:
+    """Sizes of rows or columns holding (start, span, size) widgets"""
+    spans = sorted(spans, key=lambda span: span[1])
+    sizes = [0] * max((start + span for start, span, _ in spans), default=0)
+    for start, span, size in spans:
+        if span == 1:
+            sizes[start] = max(sizes[start], size)
+            continue
+        missing = size - sum(sizes[start:start + span])
+        if missing > 0:
+            share, remainder = divmod(missing, span)
+            for i in range(span):
+                sizes[start + i] += share + (i >= span - remainder)
+    return sizes
+
+
+def _starts(sizes: list[int]) -> list[int]:
+    starts = [0]
+    for size in sizes:
+        starts.append(starts[-1] + size)
+    return starts
+
+
+def _place(
+    start: int, end: int, size: int, stick_start: bool, stick_end: bool
+) -> tuple[int, int]:
+    """Position and size of a widget within the space of its cell"""
+    space = end - start
+    if stick_start and stick_end:
+        return start, space
+    size = min(size, space)
+    if stick_start:
+        return start, size
+    if stick_end:
+        return end - size, size
+    return start + (space - size) // 2, size
@@ -3,6 +3,6 @@ from dataclasses import dataclass
 from .base import WidgetContainer
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Frame(WidgetContainer):
     pass
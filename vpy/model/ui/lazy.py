@@ -0,0 +1,352 @@
+"""Lazy loading of large UI definition files.
+
+`LazyLoader` makes a single pass over a memory-mapped definition file to
+index where every section starts and ends, along with its class and
+parent. It then returns a `LazyWidget` proxy for the root widget.
+Proxies can be navigated through their `children`, `parent` and
+`find()`. A proxy builds its `Widget` from its own section of the file
+the first time one of its fields is read. `LazyWidget.widget` builds
+the full widget subtree below a proxy, so code that needs real `Widget`
+objects only pays for the part of the form it uses.
+"""
+from dataclasses import dataclass, field
+import mmap
+import os
+import re
+
+from vpy.interfaces.uikit import WidgetClassFactory
+from vpy.model.ui.base import Widget
+from vpy.model.ui.loader import Loader, LoaderError
+from vpy.model.ui.parser import (
+    DEFAULT_SECTION, SECTRE, ParseError, Section, parse_sections
+)
+
+
+# Lines that are neither blank nor comments, split into their indentation
+# and value, which the index tells apart as `parse_sections` does
+LINERE = re.compile(rb"^([ \t\r\f\v]*)([^\s#][^\n]*)", re.MULTILINE)
+INDENTEDRE = re.compile(rb"^[ \t\r\f\v]+[^\s#]", re.MULTILINE)
+# Without indented lines, nothing continues a value, and only the lines
+# that may be section headers or indexed options have to be looked at
+UNINDENTED_LINERE = re.compile(
+    rb"^()(\[[^\n]*|(?:class|parent)[ \t\r\f\v]*:[^\n]*)",
+    re.MULTILINE | re.IGNORECASE,
+)
+# The options the index needs
+INDEXED_OPTIONS = (b"class", b"parent")
+
+
+class LazyWidget:
+    """Stand-in for a widget that is only built when it is used
+
+    Reading a field of the proxy builds the widget from its section,
+    but not the widgets below it.
+    """
+    __slots__ = ("_form", "_id")
+
+    def __init__(self, form: "_LazyForm", wgt_id: int) -> None:
+        self._form = form
+        self._id = wgt_id
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(name={self.name!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, LazyWidget):
+            return NotImplemented
+        return self._form is other._form and self._id == other._id
+
+    def __hash__(self) -> int:
+        return hash((id(self._form), self._id))
+
+    def __getattr__(self, name: str) -> object:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._form.own_widget(self._id), name)
+
+    @property
+    def name(self) -> str:
+        return self._form.names[self._id]
+
+    @property
+    def widget_class(self) -> type[Widget]:
+        return self._form.widget_class(self._id)
+
+    @property
+    def parent(self) -> "LazyWidget | None":
+        parent = self._form.parent_id(self._id)
+        return None if parent is None else LazyWidget(self._form, parent)
+
+    @property
+    def children(self) -> list["LazyWidget"]:
+        return [
+            LazyWidget(self._form, child)
+            for child in self._form.children_ids(self._id)
+        ]
+
+    @property
+    def widget(self) -> Widget:
+        """The widget along with all the widgets below it"""
+        return self._form.subtree(self._id)
+
+    def find(self, name: str) -> "LazyWidget | None":
+        """The proxy of the named widget, if it is below this one"""
+        wgt_id = self._form.ids.get(name)
+        while wgt_id is not None:
+            if wgt_id == self._id:
+                return LazyWidget(self._form, self._form.ids[name])
+            wgt_id = self._form.parent_id(wgt_id)
+        return None
+
+
+@dataclass(kw_only=True)
+class LazyLoader:
+    """Index a UI definition file and load its widgets on demand
+
+    Syntax errors in section headers, repeated sections and the root
+    widget are always checked when the file is indexed. If `strict` is
+    set, every parent link is checked as well, otherwise a missing or
+    non-container parent is only reported once it is reached through a
+    proxy. Other errors in a section are reported when its widget is
+    built.
+    """
+    get_class: WidgetClassFactory
+    strict: bool = True
+    _loader: Loader = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._loader = Loader(get_class=self.get_class)
+
+    def __call__(
+        self, path: str | os.PathLike, encoding: str = "utf-8"
+    ) -> LazyWidget:
+        form = _LazyForm(self._loader, path, encoding)
+        root = form.index()
+        if self.strict:
+            for wgt_id in range(len(form.names)):
+                form.parent_id(wgt_id)
+        return LazyWidget(form, root)
+
+
+class _LazyForm:
+    """The index of a memory-mapped definition file, and what was built"""
+
+    def __init__(
+        self, loader: Loader, path: str | os.PathLike, encoding: str
+    ) -> None:
+        self.loader = loader
+        self.path = path
+        self.encoding = encoding
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                raise LoaderError("Root widget not found!")
+            self.mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self.defaults: dict[str, str] = {}
+        self.names: list[str] = []
+        self.starts: list[int] = []
+        self.ends: list[int] = []
+        self.class_names: list[str | None] = []
+        self.parent_names: list[str | None] = []
+        self.ids: dict[str, int] = {}
+        self.children: dict[str, list[int]] = {}
+        self.widgets: dict[int, Widget] = {}
+        self.linked: set[int] = set()
+        self.checked_parents: dict[int, int | None] = {}
+        self.containers: dict[int, bool] = {}
+
+    def index(self) -> int:
+        """Index the sections of the file and return the root widget id"""
+        starts = []
+        names = []
+        # The indexed options of every section, as bytes
+        options: list[dict[bytes, bytes]] = []
+        # Headers, options and continuation lines are told apart as
+        # `parse_sections` does
+        indent_level = 0
+        option = None
+        if INDENTEDRE.search(self.mm) is None:
+            lines = UNINDENTED_LINERE.finditer(self.mm)
+        else:
+            lines = LINERE.finditer(self.mm)
+        for mo in lines:
+            indent, value = mo.groups()
+            indent = len(indent)
+            if indent and option is not None and indent > indent_level:
+                if option in INDEXED_OPTIONS:
+                    options[-1][option] += b"\n" + value.rstrip()
+                continue
+            indent_level = indent
+            first = value[:1]
+            if first == b"[":
+                header_mo = SECTRE.match(value.decode(self.encoding))
+                if header_mo is not None:
+                    starts.append(mo.start())
+                    names.append(header_mo["header"])
+                    options.append({})
+                    option = None
+                    continue
+                if b":" not in value:
+                    # Bad section headers are reported right away, other
+                    # syntax errors when the widget is built
+                    self.reparse()
+            if not starts:
+                break
+            if first in b"cCpP":
+                option, found, option_value = value.partition(b":")
+                option = option.rstrip().lower()
+                if found and option in INDEXED_OPTIONS:
+                    options[-1][option] = option_value
+            else:
+                # Another option, whose continuation lines are skipped
+                option = b""
+        if not starts or starts[0]:
+            # Anything but comments before the first section is an error
+            self.parse_sections(0, starts[0] if starts else None)
+        ends = starts[1:]
+        ends.append(len(self.mm))
+        for start, end, name, section_options in zip(
+            starts, ends, names, options
+        ):
+            if name == DEFAULT_SECTION:
+                if self.names:
+                    self.reparse()
+                self.parse_sections(start, end, self.defaults)
+                continue
+            if name in self.ids:
+                self.reparse()
+            class_name, parent_name = (
+                None if value is None else value.strip().decode(self.encoding)
+                for value in map(section_options.get, INDEXED_OPTIONS)
+            )
+            self.ids[name] = len(self.names)
+            self.names.append(name)
+            self.starts.append(start)
+            self.ends.append(end)
+            self.class_names.append(class_name)
+            self.parent_names.append(parent_name)
+        return self.link()
+
+    def link(self) -> int:
+        default_class = self.defaults.get("class")
+        default_parent = self.defaults.get("parent")
+        root = None
+        for wgt_id, (name, parent_name) in enumerate(
+            zip(self.names, self.parent_names)
+        ):
+            if self.class_names[wgt_id] is None:
+                self.class_names[wgt_id] = default_class
+            if parent_name is None:
+                parent_name = self.parent_names[wgt_id] = default_parent
+            if parent_name is not None:
+                self.children.setdefault(parent_name, []).append(wgt_id)
+            elif root is None:
+                root = wgt_id
+            else:
+                raise LoaderError(
+                    f"Attempt to set '{name}' as root"
+                    f" while '{self.names[root]}' is already"
+                    " set as such"
+                )
+        if root is None:
+            raise LoaderError("Root widget not found!")
+        return root
+
+    def widget_class(self, wgt_id: int) -> type[Widget]:
+        class_name = self.class_names[wgt_id]
+        return self.loader.widget_class(
+            self.names[wgt_id],
+            {} if class_name is None else {"class": class_name},
+        )
+
+    def is_container(self, wgt_id: int) -> bool:
+        is_container = self.containers.get(wgt_id)
+        if is_container is None:
+            is_container = self.containers[wgt_id] = \
+                hasattr(self.widget_class(wgt_id), "children")
+        return is_container
+
+    def parent_id(self, wgt_id: int) -> int | None:
+        """The id of the parent of a widget, after checking the link"""
+        try:
+            return self.checked_parents[wgt_id]
+        except KeyError:
+            pass
+        parent_name = self.parent_names[wgt_id]
+        if parent_name is None:
+            parent = None
+        else:
+            parent = self.ids.get(parent_name)
+            if parent is None:
+                raise LoaderError(
+                    f"Could not find '{parent_name}' the"
+                    f" parent of '{self.names[wgt_id]}'"
+                )
+            if not self.is_container(parent):
+                raise LoaderError(
+                    f"'{parent_name}' set as parent of "
+                    f"'{self.names[wgt_id]}', but its not a"
+                    " container"
+                )
+        self.checked_parents[wgt_id] = parent
+        return parent
+
+    def children_ids(self, wgt_id: int) -> list[int]:
+        children = self.children.get(self.names[wgt_id], [])
+        for child in children:
+            self.parent_id(child)
+        if not children and not self.is_container(wgt_id):
+            raise AttributeError(
+                f"'{self.names[wgt_id]}' is not a container"
+            )
+        return children
+
+    def own_widget(self, wgt_id: int) -> Widget:
+        """The widget built from its section, without its children"""
+        widget = self.widgets.get(wgt_id)
+        if widget is None:
+            self.parent_id(wgt_id)
+            sections = self.parse_sections(
+                self.starts[wgt_id], self.ends[wgt_id]
+            )
+            (_, items), = sections
+            widget = self.widgets[wgt_id] = self.loader._load_widget(
+                self.names[wgt_id], {**self.defaults, **items}
+            )
+        return widget
+
+    def subtree(self, wgt_id: int) -> Widget:
+        root = self.own_widget(wgt_id)
+        stack = [wgt_id]
+        while stack:
+            parent = stack.pop()
+            if parent in self.linked:
+                continue
+            children = self.children.get(self.names[parent], [])
+            if children:
+                for child in children:
+                    self.parent_id(child)
+                self.own_widget(parent).children[:] = [
+                    self.own_widget(child) for child in children
+                ]
+                stack.extend(children)
+            self.linked.add(parent)
+        return root
+
+    def parse_sections(
+        self, start: int, end: int | None, defaults: dict[str, str] = None
+    ) -> list[Section]:
+        lines = self.mm[start:end].decode(self.encoding).splitlines()
+        try:
+            return list(parse_sections(lines, defaults=defaults))
+        except ParseError:
+            self.reparse()
+
+    def reparse(self) -> None:
+        """Report a syntax error found while indexing or building widgets
+
+        The whole file is parsed to report the error with the right line
+        number.
+        """
+        for _ in self.loader._parse_file(self.path, self.encoding):
+            pass
+        raise LoaderError(f"Could not index '{self.path}'")
@@ -1,37 +1,153 @@
-from dataclasses import dataclass, fields, Field
-from collections.abc import Iterable
-from configparser import ConfigParser, SectionProxy
-import re
+from dataclasses import dataclass, field, fields, Field
+from collections.abc import Callable, Iterable, Iterator
+from time import perf_counter
+import os
 
 from vpy.interfaces.uikit import WidgetClassFactory
 from vpy.model.ui.base import Widget
+from vpy.model.ui.parser import (
+    ParseError, Section, parse_file_sections, parse_sections
+)
+from vpy.model.ui.profiling import LoaderObserver, LoadProfile
+from vpy.model.ui.store import WidgetStore
+
+
+BOOLEAN_STATES = {
+    '1': True, 'yes': True, 'true': True, 'on': True,
+    '0': False, 'no': False, 'false': False, 'off': False,
+}
 
 
 class LoaderError(Exception):
     pass
 
 
+Converter = Callable[[str, str], object]
+CoercionPlan = dict[str, Converter]
+
+
 @dataclass(kw_only=True)
 class Loader:
     get_class: WidgetClassFactory
-    
+    # Gets a profile of every load, loading is not profiled without one
+    observer: LoaderObserver | None = None
+    _coercion_plans: dict[type[Widget], CoercionPlan] = \
+        field(default_factory=dict, init=False, repr=False)
+    # Widget classes by class name, so get_class is called once per name.
+    # Names it does not know are asked for again, as classes can be
+    # registered later
+    _classes: dict[str, type[Widget]] = \
+        field(default_factory=dict, init=False, repr=False)
+
     def __call__(self, stream: Iterable[str]) -> Widget:
+        if self.observer is not None:
+            return self._load_profiled(self._parse_stream(stream))
         root_widget, widget_namespace, children_map = \
-            self._load_widgets(stream)
+            self._load_widgets(self._parse_stream(stream))
+        self._build_tree(widget_namespace, children_map)
+        return root_widget
+
+    def load_file(
+        self, path: str | os.PathLike, encoding: str = "utf-8"
+    ) -> Widget:
+        """Load a UI definition file without reading it into a string"""
+        if self.observer is not None:
+            return self._load_profiled(self._parse_file(path, encoding))
+        root_widget, widget_namespace, children_map = \
+            self._load_widgets(self._parse_file(path, encoding))
+        self._build_tree(widget_namespace, children_map)
+        return root_widget
+
+    def load_store(self, stream: Iterable[str]) -> WidgetStore:
+        """Load the widgets into a columnar store rather than a tree"""
+        store = WidgetStore()
+        parent_names = []
+        root_name = None
+        for section, items in self._parse_stream(stream):
+            cls, wgt_cfg = self._load_fields(section, items)
+            try:
+                store.add(section, cls, wgt_cfg)
+            except OverflowError:
+                raise LoaderError(f"Value out of range in {section}")
+            parent_names.append(items.get("parent"))
+            if "parent" not in items:
+                if root_name is None:
+                    root_name = section
+                else:
+                    raise LoaderError(
+                        f"Attempt to set '{section}' as root"
+                        f" while '{root_name}' is already"
+                        " set as such"
+                    )
+        if root_name is None:
+            raise LoaderError("Root widget not found!")
+        for wgt_id, parent_name in enumerate(parent_names):
+            if parent_name is None:
+                continue
+            parent = store.ids.get(parent_name)
+            if parent is None:
+                raise LoaderError(
+                    f"Could not find '{parent_name}' the"
+                    f" parent of '{store.names[wgt_id]}'"
+                )
+            if not store.is_container(parent):
+                raise LoaderError(
+                    f"'{parent_name}' set as parent of "
+                    f"'{store.names[wgt_id]}', but its not a"
+                    " container"
+                )
+            store.set_parent(wgt_id, parent)
+        return store
+
+    def _load_profiled(self, sections: Iterable[Section]) -> Widget:
+        profile = LoadProfile()
+        start = perf_counter()
+        root_widget, widget_namespace, children_map = self._load_widgets(
+            _timed_sections(sections, profile),
+            lambda section, items: self._load_widget_profiled(
+                section, items, profile
+            ),
+        )
+        tree_start = perf_counter()
         self._build_tree(widget_namespace, children_map)
+        end = perf_counter()
+        profile.phases["build_tree"] += end - tree_start
+        profile.widgets = len(widget_namespace)
+        profile.total_time = end - start
+        self.observer.load_profiled(profile)
         return root_widget
 
+    def _load_widget_profiled(
+        self, section: str, items: dict[str, str], profile: LoadProfile
+    ) -> Widget:
+        start = perf_counter()
+        cls = self.widget_class(section, items)
+        resolved = perf_counter()
+        wgt_cfg = self.coerce_fields(cls, section, items)
+        coerced = perf_counter()
+        widget = cls(name=section, **wgt_cfg)
+        end = perf_counter()
+        phases = profile.phases
+        phases["resolve"] += resolved - start
+        phases["coerce"] += coerced - resolved
+        phases["construct"] += end - coerced
+        cls_name = cls.__name__
+        profile.widget_classes[cls_name] += 1
+        profile.coercions.update(f"{cls_name}.{name}" for name in wgt_cfg)
+        return widget
+
     def _load_widgets(
-        self, stream: Iterable[str]
+        self,
+        sections: Iterable[Section],
+        load_widget: Callable[[str, dict[str, str]], Widget] | None = None,
     ) -> tuple[Widget, dict[str, Widget], dict[str, list[Widget]]]:
-        cfg = self._parse_stream(stream)
+        if load_widget is None:
+            load_widget = self._load_widget
         root_widget = None
         widget_namespace = {}
         children_map = {}
-        for section, items in cfg.items():
-            if section == ".default":
-                continue
-            widget = self._load_widget(section, items)
+        for section, items in sections:
+            widget = load_widget(section, items)
             widget_namespace[widget.name] = widget
             if "parent" in items:
                 children_map\
@@ -70,51 +186,118 @@ class Loader:
                 )
             parent.children = children
 
-    def _load_widget(self, section: str, items: SectionProxy) -> Widget:
-            cls = self._get_wgt_cls(section, items)
-            wgt_cfg = {
-                field.name: self._data_for_field(field, items)
-                for field in fields(cls)
-                if field.name in items
-            }
+    def _load_widget(self, section: str, items: dict[str, str]) -> Widget:
+            cls, wgt_cfg = self._load_fields(section, items)
             widget = cls(name=section, **wgt_cfg)
             return widget
 
+    def _load_fields(
+        self, section: str, items: dict[str, str]
+    ) -> tuple[type[Widget], dict[str, object]]:
+            cls = self.widget_class(section, items)
+            return cls, self.coerce_fields(cls, section, items)
+
+    def coerce_fields(
+        self, cls: type[Widget], section: str, items: dict[str, str]
+    ) -> dict[str, object]:
+        """Convert the options of a section to the fields of `cls` they set
+
+        Options that are not fields of `cls` are left out.
+        """
+        plan = self._coercion_plans.get(cls)
+        if plan is None:
+            plan = self._coercion_plans[cls] = self._mk_coercion_plan(cls)
+        return {
+            name: plan[name](section, value)
+            for name, value in items.items()
+            if name in plan
+        }
+
+    @classmethod
+    def _mk_coercion_plan(cls, wgt_cls: type[Widget]) -> CoercionPlan:
+        return {
+            field.name: cls._mk_converter(field)
+            for field in fields(wgt_cls)
+        }
+
     @staticmethod
-    def _data_for_field(field: Field, items: SectionProxy) -> object:
+    def _mk_converter(field: Field) -> Converter:
         types_and_getters = {
-            int: items.getint,
-            bool: items.getboolean,
-            str: items.get,
+            int: int,
+            bool: _getboolean,
+            str: str,
         }
         for type_, getter in types_and_getters.items():
-            if issubclass(type_, field.type):
+            try:
+                if not issubclass(type_, field.type):
+                    continue
+            except TypeError:
+                break
+
+            def convert(
+                section: str, value: str,
+                getter=getter, type_name=type_.__name__, name=field.name
+            ) -> object:
                 try:
-                    return getter(field.name)
+                    return getter(value)
                 except ValueError:
                     raise LoaderError(
-                        f"Invalid {type_.__name__} value "
-                        f"for {items.name}.{field.name}"
+                        f"Invalid {type_name} value for {section}.{name}"
                     )
-        else:
-            raise TypeError(f"Unsupported Widget field type: {field.type}")
+            return convert
+
+        def unsupported(section: str, value: str, type_=field.type) -> object:
+            raise TypeError(f"Unsupported Widget field type: {type_}")
+        return unsupported
 
-    def _get_wgt_cls(self, section: str, items: SectionProxy) -> type(Widget):
+    def widget_class(self, section: str, items: dict[str, str]) -> type(Widget):
+            """The widget class named by the `class` option of a section"""
             wgt_cls_name = items.get('class', None)
             if wgt_cls_name is None:
                 raise LoaderError(f"Widget class not specified for '{section}'")
-            cls = self.get_class(wgt_cls_name)
+            cls = self._classes.get(wgt_cls_name)
             if cls is None:
-                raise LoaderError(f"Invalid widget class: '{wgt_cls_name}'")
+                cls = self.get_class(wgt_cls_name)
+                if cls is None:
+                    raise LoaderError(f"Invalid widget class: '{wgt_cls_name}'")
+                self._classes[wgt_cls_name] = cls
             return cls
 
-    def _parse_stream(self, stream: Iterable[str]) -> ConfigParser:
-        cfg = ConfigParser(
-            delimiters=(':',),
-            comment_prefixes=('#',),
-            default_section=".default",
-            interpolation=None
-        )
-        cfg.SECTRE = re.compile(r"\[\s*(?P<header>(:?\.?\w+))\s*\]")
-        cfg.read_file(stream)
-        return cfg
+    def _parse_stream(self, stream: Iterable[str]) -> Iterator[Section]:
+        try:
+            yield from parse_sections(stream)
+        except ParseError as e:
+            raise LoaderError(str(e)) from e
+
+    def _parse_file(
+        self, path: str | os.PathLike, encoding: str
+    ) -> Iterator[Section]:
+        try:
+            yield from parse_file_sections(path, encoding=encoding)
+        except ParseError as e:
+            raise LoaderError(str(e)) from e
+
+
+def _timed_sections(
+    sections: Iterable[Section], profile: LoadProfile
+) -> Iterator[Section]:
+    """Pass sections through, adding the time taken to get them to the
+    parse phase"""
+    phases = profile.phases
+    sections = iter(sections)
+    while True:
+        start = perf_counter()
+        try:
+            section = next(sections)
+        except StopIteration:
+            phases["parse"] += perf_counter() - start
+            return
+        phases["parse"] += perf_counter() - start
+        yield section
+
+
+def _getboolean(value: str) -> bool:
+    try:
+        return BOOLEAN_STATES[value.lower()]
+    except KeyError:
+        raise ValueError(f"Not a boolean: {value}")
@@ -0,0 +1,193 @@
+"""Streaming parser for UI definition files.
+
+UI definitions use a small subset of the `.ini` syntax that ConfigParser
+understands: `[section]` headers, `key: value` options, `#` comment
+lines, indented continuation lines and a `.default` section whose
+options apply to every other section. Unlike ConfigParser, this parser
+never holds more than a single section in memory, it yields every
+section as soon as its last line was read.
+"""
+from collections.abc import Callable, Iterable, Iterator
+import mmap
+import os
+import re
+
+
+DEFAULT_SECTION = ".default"
+SECTRE = re.compile(r"\[\s*(?P<header>(:?\.?\w+))\s*\]")
+DELIMITER = ":"
+CHUNKRE = re.compile(r"\n(?=\[)")
+COMMENT_PREFIX = "#"
+
+Section = tuple[str, dict[str, str]]
+# Called with the line number, section name and option name of a
+# repeated option
+RepeatedOption = Callable[[int, str, str], None]
+
+
+class ParseError(Exception):
+    pass
+
+
+def parse_sections(
+    stream: Iterable[str],
+    *,
+    strict: bool = True,
+    defaults: dict[str, str] | None = None,
+    on_repeated_option: RepeatedOption | None = None,
+) -> Iterator[Section]:
+    """Yield `(section, items)` pairs from the given lines as they are read.
+
+    The `items` of every section include the options set in the
+    `.default` section. Since sections are yielded before the rest of
+    the file is read, `.default` must appear before any other section.
+    Options of `.default` are collected into `defaults` if it is given.
+    When `strict` is set, repeated sections or options are errors,
+    otherwise repeated sections are yielded again and the last value of
+    a repeated option wins. `on_repeated_option` is then told about
+    every repeated option, so callers can report them without stopping.
+    """
+    return _parse_lines(stream, strict, defaults, None, on_repeated_option)
+
+
+def parse_file_sections(
+    path: str | os.PathLike,
+    *,
+    strict: bool = True,
+    defaults: dict[str, str] | None = None,
+    encoding: str = "utf-8",
+    on_repeated_option: RepeatedOption | None = None,
+) -> Iterator[Section]:
+    """Like `parse_sections`, but read the file at `path` directly
+
+    The file is memory-mapped and scanned as bytes. Only section names,
+    option names and values are decoded, the file as a whole never is,
+    so `encoding` must be ASCII compatible.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield from _parse_lines(
+                iter(mm.readline, b""), strict, defaults, encoding,
+                on_repeated_option,
+            )
+
+
+def _parse_lines(
+    stream: Iterable[str] | Iterable[bytes],
+    strict: bool,
+    defaults: dict[str, str] | None,
+    encoding: str | None,
+    on_repeated_option: RepeatedOption | None = None,
+) -> Iterator[Section]:
+    """Parse lines of text, or of bytes in the given encoding"""
+    is_text = encoding is None
+    if is_text:
+        comment, bracket, delimiter = COMMENT_PREFIX, "[", DELIMITER
+    else:
+        # Indexing bytes gives ints
+        comment, bracket = COMMENT_PREFIX.encode(encoding)[0], ord("[")
+        delimiter = DELIMITER.encode(encoding)
+    if defaults is None:
+        defaults = {}
+    # Option names repeat in every section, so share their objects
+    option_names: dict[str | bytes, str] = {}
+    seen_sections: set[str] = set()
+    sectname: str | None = None
+    cursect: dict[str, str] | None = None
+    optname: str | None = None
+    blank_lines = 0
+    indent_level = 0
+    lineno = 0
+
+    def decode(raw: bytes) -> str:
+        try:
+            return raw.decode(encoding)
+        except UnicodeDecodeError as e:
+            raise ParseError(f"Line {lineno}: {e}") from e
+
+    for lineno, line in enumerate(stream, start=1):
+        value = line.strip()
+        if not value:
+            blank_lines += 1
+            continue
+        if value[0] == comment:
+            continue
+        if line[:1].isspace():
+            cur_indent_level = len(line) - len(line.lstrip())
+            if optname is not None and cur_indent_level > indent_level:
+                # Blank lines within a value are kept, trailing ones are not
+                cursect[optname] += "\n" * (blank_lines + 1) + (
+                    value if is_text else decode(value)
+                )
+                blank_lines = 0
+                continue
+        else:
+            cur_indent_level = 0
+        indent_level = cur_indent_level
+        blank_lines = 0
+        if value[0] == bracket and (
+            mo := SECTRE.match(value if is_text else decode(value))
+        ):
+            if cursect is not None and cursect is not defaults:
+                yield sectname, {**defaults, **cursect} if defaults else cursect
+            sectname = mo.group("header")
+            optname = None
+            if sectname == DEFAULT_SECTION:
+                if seen_sections:
+                    raise ParseError(
+                        f"Line {lineno}: '{DEFAULT_SECTION}' must precede"
+                        " all other sections"
+                    )
+                cursect = defaults
+                continue
+            if sectname in seen_sections and strict:
+                raise ParseError(
+                    f"Line {lineno}: section '{sectname}' already exists"
+                )
+            seen_sections.add(sectname)
+            cursect = {}
+        elif cursect is None:
+            raise ParseError(
+                f"Line {lineno}: no section header before"
+                f" '{value if is_text else decode(value)}'"
+            )
+        else:
+            raw_optname, found, optval = value.partition(delimiter)
+            optname = option_names.get(raw_optname)
+            if optname is None:
+                optname = raw_optname.rstrip()
+                optname = option_names[raw_optname] = (
+                    optname if is_text else decode(optname)
+                ).lower()
+            if not (found and optname):
+                raise ParseError(
+                    f"Line {lineno}: cannot parse"
+                    f" '{value if is_text else decode(value)}'"
+                )
+            if optname in cursect:
+                if strict:
+                    raise ParseError(
+                        f"Line {lineno}: option '{optname}' in section"
+                        f" '{sectname}' already exists"
+                    )
+                if on_repeated_option is not None:
+                    on_repeated_option(lineno, sectname, optname)
+            optval = optval.lstrip()
+            cursect[optname] = optval if is_text else decode(optval)
+    if cursect is not None and cursect is not defaults:
+        yield sectname, {**defaults, **cursect} if defaults else cursect
+
+
+def split_chunks(stream: Iterable[str]) -> list[str]:
+    """Split the text into chunks that parse the same way on their own.
+
+    Every chunk but the first starts with a line beginning with `[`.
+    Such a line can never continue a value, so the parser state is
+    reset there and each chunk can be parsed separately. The lines must
+    either all include their line endings or all omit them.
+    """
+    lines = list(stream)
+    separator = "" if lines and lines[0].endswith("\n") else "\n"
+    return CHUNKRE.split(separator.join(lines))
@@ -0,0 +1,77 @@
+"""Profiling of UI definition loading.
+
+A `Loader` with an observer times the phases of every load, counts the
+widgets it creates by class and the option values it coerces by field,
+and hands the resulting `LoadProfile` to the observer. Loaders without
+an observer skip all of this. `ProfileCollector` is an observer that
+sums up the profiles of many loads into a report.
+"""
+from abc import abstractmethod
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Protocol
+
+
+PHASES = ("parse", "resolve", "coerce", "construct", "build_tree")
+
+
+@dataclass(kw_only=True)
+class LoadProfile:
+    # Seconds spent in each of PHASES
+    phases: dict[str, float] = field(
+        default_factory=lambda: dict.fromkeys(PHASES, 0.0)
+    )
+    # Widgets created, by class name
+    widget_classes: Counter[str] = field(default_factory=Counter)
+    # Option values coerced, by "<class name>.<field name>"
+    coercions: Counter[str] = field(default_factory=Counter)
+    widgets: int = 0
+    total_time: float = 0.0
+
+
+class LoaderObserver(Protocol):
+    @abstractmethod
+    def load_profiled(self, profile: LoadProfile) -> None:
+        pass
+
+
+@dataclass(kw_only=True)
+class ProfileCollector:
+    """Sum up the profiles of many loads"""
+    loads: int = 0
+    total: LoadProfile = field(default_factory=LoadProfile)
+
+    def load_profiled(self, profile: LoadProfile) -> None:
+        self.loads += 1
+        for phase, seconds in profile.phases.items():
+            self.total.phases[phase] = self.total.phases.get(phase, 0.0) + seconds
+        self.total.widget_classes.update(profile.widget_classes)
+        self.total.coercions.update(profile.coercions)
+        self.total.widgets += profile.widgets
+        self.total.total_time += profile.total_time
+
+    def report(self, top: int = 10) -> str:
+        total = self.total
+        lines = [
+            f"{self.loads} loads, {total.widgets} widgets,"
+            f" {total.total_time * 1000:.3f}ms"
+        ]
+        lines.append("Phases (ms total, ms per load, share):")
+        for phase, seconds in total.phases.items():
+            share = seconds / total.total_time if total.total_time else 0.0
+            per_load = seconds / self.loads if self.loads else 0.0
+            lines.append(
+                f"  {phase:<12} {seconds * 1000:>10.3f}"
+                f" {per_load * 1000:>10.3f} {share:>7.1%}"
+            )
+        lines.append("Widget classes:")
+        lines.extend(
+            f"  {name:<24} {count:>8}"
+            for name, count in total.widget_classes.most_common(top)
+        )
+        lines.append("Coerced fields:")
+        lines.extend(
+            f"  {name:<24} {count:>8}"
+            for name, count in total.coercions.most_common(top)
+        )
+        return "\n".join(lines)
@@ -0,0 +1,238 @@
+"""Columnar storage for large widget trees.
+
+`WidgetStore` keeps the grid geometry and stickiness of every widget in
+typed `array` columns, indexed by a dense widget id, next to a name to
+id index and a parent to children adjacency index. Whole-form queries
+and layout validation then scan columns instead of walking `Widget`
+objects. Fields that are not part of the geometry are kept sparsely,
+per widget, only when they differ from their defaults. Geometry fields
+that can be `None` have a presence column next to their values, as any
+int is a valid grid position. `Widget` objects can be materialized from
+the store for code that needs them.
+"""
+from dataclasses import dataclass, field, fields, MISSING
+from array import array
+from collections.abc import Iterator
+from itertools import compress, repeat
+from operator import eq
+
+from vpy.model.ui.base import Widget
+from vpy.model.ui.grid import collisions
+
+
+GEOMETRY_FIELDS = (
+    "grid_column", "grid_row", "grid_columnspan", "grid_rowspan",
+    "margin_x", "margin_y", "padding_x", "padding_y",
+)
+STICK_FIELDS = ("stick_north", "stick_east", "stick_south", "stick_west")
+STICK_BITS = {name: 1 << i for i, name in enumerate(STICK_FIELDS)}
+# Geometry fields that can be unset
+NULLABLE_FIELDS = ("grid_column", "grid_row")
+# Stored in the geometry columns of unset fields
+UNSET_VALUE = 0
+NO_PARENT = -1
+
+
+@dataclass(kw_only=True)
+class WidgetStore:
+    names: list[str] = field(default_factory=list)
+    classes: list[type[Widget]] = field(default_factory=list)
+    parents: array = field(default_factory=lambda: array("i"))
+    geometry: dict[str, array] = field(
+        default_factory=lambda: {name: array("i") for name in GEOMETRY_FIELDS}
+    )
+    # 1 where a nullable geometry field is set, 0 where it is `None`
+    present: dict[str, array] = field(
+        default_factory=lambda: {name: array("B") for name in NULLABLE_FIELDS}
+    )
+    sticky: array = field(default_factory=lambda: array("B"))
+    extras: dict[int, dict[str, object]] = field(default_factory=dict)
+    ids: dict[str, int] = field(default_factory=dict)
+    children: dict[int, list[int]] = field(default_factory=dict)
+    _defaults: dict[type[Widget], dict[str, object]] = \
+        field(default_factory=dict, init=False, repr=False)
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def add(
+        self,
+        name: str,
+        cls: type[Widget],
+        values: dict[str, object],
+        parent: int = NO_PARENT,
+    ) -> int:
+        """Add a widget and return its id
+
+        `values` holds the widget fields that are not left at their
+        defaults, except for `name` and `children`.
+        """
+        if name in self.ids:
+            raise ValueError(f"Widget '{name}' already exists")
+        defaults = self._class_defaults(cls)
+        wgt_id = len(self.names)
+        for field_name, column in self.geometry.items():
+            value = values.get(field_name, defaults[field_name])
+            if field_name in self.present:
+                self.present[field_name].append(value is not None)
+            column.append(UNSET_VALUE if value is None else value)
+        sticky = 0
+        for field_name, bit in STICK_BITS.items():
+            if values.get(field_name, defaults[field_name]):
+                sticky |= bit
+        self.sticky.append(sticky)
+        extras = {
+            field_name: value for field_name, value in values.items()
+            if field_name not in self.geometry and field_name not in STICK_BITS
+            and value != defaults.get(field_name, MISSING)
+        }
+        if extras:
+            self.extras[wgt_id] = extras
+        self.names.append(name)
+        self.classes.append(cls)
+        self.parents.append(NO_PARENT)
+        self.ids[name] = wgt_id
+        if parent != NO_PARENT:
+            self.set_parent(wgt_id, parent)
+        return wgt_id
+
+    def set_parent(self, wgt_id: int, parent: int) -> None:
+        old_parent = self.parents[wgt_id]
+        if old_parent != NO_PARENT:
+            self.children[old_parent].remove(wgt_id)
+        self.parents[wgt_id] = parent
+        if parent != NO_PARENT:
+            self.children.setdefault(parent, []).append(wgt_id)
+
+    def is_container(self, wgt_id: int) -> bool:
+        return "children" in self._class_defaults(self.classes[wgt_id])
+
+    def roots(self) -> list[int]:
+        return self.where("parents", NO_PARENT)
+
+    def children_of(self, wgt_id: int) -> list[int]:
+        return self.children.get(wgt_id, [])
+
+    def column(self, field_name: str) -> array:
+        if field_name == "parents":
+            return self.parents
+        return self.geometry[field_name]
+
+    def where(self, field_name: str, value: int | None) -> list[int]:
+        """Ids of widgets whose geometry field holds the given value"""
+        present = self.present.get(field_name)
+        if value is None:
+            if present is None:
+                return []
+            return list(compress(range(len(present)), map(eq, present, repeat(0))))
+        column = self.column(field_name)
+        ids = compress(range(len(column)), map(eq, column, repeat(value)))
+        if present is not None:
+            ids = (wgt_id for wgt_id in ids if present[wgt_id])
+        return list(ids)
+
+    def stuck_to(self, *sides: str) -> list[int]:
+        """Ids of widgets stuck to all the given sides"""
+        mask = sum(STICK_BITS[f"stick_{side}"] for side in sides)
+        matches = bytes(bits & mask == mask for bits in range(256))
+        return list(compress(
+            range(len(self.sticky)), self.sticky.tobytes().translate(matches)
+        ))
+
+    def in_grid_row(self, row: int, parent: int | None = None) -> list[int]:
+        ids = self.where("grid_row", row)
+        if parent is None:
+            return ids
+        return [wgt_id for wgt_id in ids if self.parents[wgt_id] == parent]
+
+    def in_grid_column(self, column: int, parent: int | None = None) -> list[int]:
+        ids = self.where("grid_column", column)
+        if parent is None:
+            return ids
+        return [wgt_id for wgt_id in ids if self.parents[wgt_id] == parent]
+
+    def grid_collisions(self) -> Iterator[tuple[int, int]]:
+        """Yield pairs of sibling widgets that share a grid cell
+
+        Widgets without a grid row and column are not checked. Every
+        widget sharing cells with siblings that start in the same row or
+        above is paired with the lowest id of them, in the order of the
+        widget ids. Cells are never gone through one by one, see
+        `grid.collisions`.
+        """
+        g, present = self.geometry, self.present
+        grids: dict[int, list[tuple[int, int, int, int, int]]] = {}
+        for wgt_id, parent in enumerate(self.parents):
+            if not (present["grid_column"][wgt_id] and present["grid_row"][wgt_id]):
+                continue
+            colspan = g["grid_columnspan"][wgt_id]
+            rowspan = g["grid_rowspan"][wgt_id]
+            # Widgets spanning nothing take no cells
+            if colspan > 0 and rowspan > 0:
+                grids.setdefault(parent, []).append((
+                    wgt_id, g["grid_row"][wgt_id], rowspan,
+                    g["grid_column"][wgt_id], colspan,
+                ))
+        pairs = [pair for cells in grids.values() for pair in collisions(cells)]
+        yield from sorted(pairs, key=lambda pair: pair[::-1])
+
+    def values(self, wgt_id: int) -> dict[str, object]:
+        """The field values of a widget, except `name` and `children`"""
+        values = {
+            field_name: None if field_name in self.present
+            and not self.present[field_name][wgt_id]
+            else column[wgt_id]
+            for field_name, column in self.geometry.items()
+        }
+        sticky = self.sticky[wgt_id]
+        values.update(
+            (field_name, bool(sticky & bit))
+            for field_name, bit in STICK_BITS.items()
+        )
+        values.update(self.extras.get(wgt_id, ()))
+        return values
+
+    def to_widget(self, wgt_id: int) -> Widget:
+        """Materialize a widget along with all the widgets below it"""
+        widget = self.classes[wgt_id](name=self.names[wgt_id], **self.values(wgt_id))
+        stack = [(widget, wgt_id)]
+        while stack:
+            parent, parent_id = stack.pop()
+            for child_id in self.children.get(parent_id, ()):
+                child = self.classes[child_id](
+                    name=self.names[child_id], **self.values(child_id)
+                )
+                parent.children.append(child)
+                stack.append((child, child_id))
+        return widget
+
+    @classmethod
+    def from_tree(cls, root: Widget) -> "WidgetStore":
+        store = cls()
+        stack = [(root, NO_PARENT)]
+        while stack:
+            widget, parent = stack.pop()
+            wgt_id = store.add(
+                widget.name,
+                type(widget),
+                {
+                    f.name: getattr(widget, f.name)
+                    for f in fields(widget)
+                    if f.name not in ("name", "children")
+                },
+                parent,
+            )
+            stack.extend(
+                (child, wgt_id)
+                for child in reversed(getattr(widget, "children", ()))
+            )
+        return store
+
+    def _class_defaults(self, cls: type[Widget]) -> dict[str, object]:
+        defaults = self._defaults.get(cls)
+        if defaults is None:
+            defaults = self._defaults[cls] = {
+                f.name: None if f.default is MISSING else f.default
+                for f in fields(cls)
+            }
+        return defaults
@@ -0,0 +1,336 @@
+"""Validation of UI definitions that reports every problem at once.
+
+`Loader` stops at the first error it runs into, and some mistakes it
+does not notice at all: a repeated widget name replaces the widget
+defined before it, and widgets can be gridded over each other.
+`Validator` reads a definition without building the tree and collects
+all the problems it finds, which are syntax errors, duplicate widget
+names, repeated options, unknown classes, invalid field values,
+missing or non-container parents, missing or repeated roots, cycles of
+parent links, grid positions and spans out of range, and siblings
+sharing grid cells.
+
+Widgets are indexed by name in a dict, and collisions are found by
+sweeping over the rows of every grid with `grid.collisions`, without
+going through the cells widgets span, so checking a form takes
+O(n log² n) time in the number of widgets. `validate_project` checks
+the definition files of a directory in parallel.
+"""
+from dataclasses import dataclass, field
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+import os
+
+from vpy.interfaces.uikit import WidgetClassFactory
+from vpy.model.ui.batch import map_files, resolve_kit
+from vpy.model.ui.grid import Cell, collisions
+from vpy.model.ui.loader import Loader, LoaderError
+from vpy.model.ui.parser import (
+    ParseError, RepeatedOption, Section, parse_file_sections, parse_sections
+)
+
+
+# Kinds of problems
+UNREADABLE = "unreadable"
+SYNTAX = "syntax"
+DUPLICATE_NAME = "duplicate name"
+DUPLICATE_OPTION = "duplicate option"
+INVALID_CLASS = "invalid class"
+INVALID_VALUE = "invalid value"
+MISSING_PARENT = "missing parent"
+NOT_A_CONTAINER = "not a container"
+ROOT = "root"
+PARENT_CYCLE = "parent cycle"
+GRID_RANGE = "grid range"
+GRID_COLLISION = "grid collision"
+
+# Tk refuses grid rows and columns from this one on
+GRID_LIMIT = 10000
+NO_PARENT = -1
+
+
+@dataclass(kw_only=True)
+class Problem:
+    kind: str
+    message: str
+    # The widgets involved, the one at fault first
+    widgets: tuple[str, ...] = ()
+
+
+@dataclass(kw_only=True)
+class ValidationResult:
+    path: Path
+    problems: list[Problem] = field(default_factory=list)
+
+
+@dataclass(kw_only=True)
+class Validator:
+    get_class: WidgetClassFactory
+    _loader: Loader = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._loader = Loader(get_class=self.get_class)
+
+    def __call__(self, stream: Iterable[str]) -> list[Problem]:
+        problems: list[Problem] = []
+        # Repeated sections are reported as duplicate names, but parsing
+        # goes on past them
+        return self._validate(parse_sections(
+            stream, strict=False,
+            on_repeated_option=_option_reporter(problems),
+        ), problems)
+
+    def validate_file(
+        self, path: str | os.PathLike, encoding: str = "utf-8"
+    ) -> list[Problem]:
+        problems: list[Problem] = []
+        try:
+            return self._validate(parse_file_sections(
+                path, strict=False, encoding=encoding,
+                on_repeated_option=_option_reporter(problems),
+            ), problems)
+        except OSError as e:
+            return [
+                Problem(kind=UNREADABLE, message=f"Cannot read {path}: {e}")
+            ]
+
+    def _validate(
+        self, sections: Iterator[Section], problems: list[Problem]
+    ) -> list[Problem]:
+        names: list[str] = []
+        parent_names: list[str | None] = []
+        # Coerced fields of widgets whose class is known
+        values: list[dict[str, object] | None] = []
+        is_container: list[bool] = []
+        ids: dict[str, int] = {}
+        try:
+            for name, items in sections:
+                if name in ids:
+                    problems.append(Problem(
+                        kind=DUPLICATE_NAME,
+                        message=f"Widget '{name}' is defined more than once",
+                        widgets=(name,),
+                    ))
+                    continue
+                ids[name] = len(names)
+                names.append(name)
+                parent_names.append(items.get("parent"))
+                try:
+                    cls = self._loader.widget_class(name, items)
+                except LoaderError as e:
+                    problems.append(Problem(
+                        kind=INVALID_CLASS, message=str(e), widgets=(name,)
+                    ))
+                    values.append(None)
+                    is_container.append(True)
+                    continue
+                values.append(self._coerce(cls, name, items, problems))
+                is_container.append(hasattr(cls, "children"))
+        except ParseError as e:
+            # The rest of the file cannot be read reliably
+            problems.append(Problem(kind=SYNTAX, message=str(e)))
+            return problems
+
+        parents = self._link(names, parent_names, is_container, ids, problems)
+        for cycle in _find_cycles(parents):
+            cycle_names = tuple(names[wgt_id] for wgt_id in cycle)
+            problems.append(Problem(
+                kind=PARENT_CYCLE,
+                message="Parent links form a cycle: "
+                + " -> ".join((*cycle_names, cycle_names[0])),
+                widgets=cycle_names,
+            ))
+        cells = self._check_ranges(names, values, parents, problems)
+        problems.extend(_collisions(names, parents, cells))
+        return problems
+
+    def _coerce(
+        self,
+        cls: type,
+        name: str,
+        items: dict[str, str],
+        problems: list[Problem],
+    ) -> dict[str, object]:
+        try:
+            return self._loader.coerce_fields(cls, name, items)
+        except (LoaderError, TypeError):
+            pass
+        # Field by field, to find all the invalid ones
+        coerced = {}
+        for option, value in items.items():
+            try:
+                coerced.update(
+                    self._loader.coerce_fields(cls, name, {option: value})
+                )
+            except (LoaderError, TypeError) as e:
+                problems.append(Problem(
+                    kind=INVALID_VALUE, message=str(e), widgets=(name,)
+                ))
+        return coerced
+
+    @staticmethod
+    def _link(
+        names: list[str],
+        parent_names: list[str | None],
+        is_container: list[bool],
+        ids: dict[str, int],
+        problems: list[Problem],
+    ) -> list[int]:
+        parents = []
+        roots = []
+        for wgt_id, (name, parent_name) in enumerate(zip(names, parent_names)):
+            parent = NO_PARENT
+            if parent_name is None:
+                roots.append(wgt_id)
+            elif (parent := ids.get(parent_name, NO_PARENT)) == NO_PARENT:
+                problems.append(Problem(
+                    kind=MISSING_PARENT,
+                    message=f"Could not find '{parent_name}' the parent"
+                    f" of '{name}'",
+                    widgets=(name,),
+                ))
+            elif not is_container[parent]:
+                problems.append(Problem(
+                    kind=NOT_A_CONTAINER,
+                    message=f"'{parent_name}' set as parent of '{name}',"
+                    " but its not a container",
+                    widgets=(name, parent_name),
+                ))
+                parent = NO_PARENT
+            parents.append(parent)
+        if not roots:
+            problems.append(Problem(kind=ROOT, message="Root widget not found!"))
+        for wgt_id in roots[1:]:
+            problems.append(Problem(
+                kind=ROOT,
+                message=f"Attempt to set '{names[wgt_id]}' as root while"
+                f" '{names[roots[0]]}' is already set as such",
+                widgets=(names[wgt_id], names[roots[0]]),
+            ))
+        return parents
+
+    @staticmethod
+    def _check_ranges(
+        names: list[str],
+        values: list[dict[str, object] | None],
+        parents: list[int],
+        problems: list[Problem],
+    ) -> list[Cell]:
+        """Report grid positions out of range, return the (widget id,
+        row, rowspan, column, columnspan) of the others that have one"""
+        cells = []
+        for wgt_id, (name, wgt_values) in enumerate(zip(names, values)):
+            if wgt_values is None:
+                continue
+            row = wgt_values.get("grid_row")
+            column = wgt_values.get("grid_column")
+            rowspan = wgt_values.get("grid_rowspan", 1)
+            columnspan = wgt_values.get("grid_columnspan", 1)
+            invalid = []
+            for field_name, start, span in [
+                ("row", row, rowspan), ("column", column, columnspan)
+            ]:
+                if span < 1:
+                    invalid.append(f"{field_name}span {span}")
+                elif start is not None and (
+                    start < 0 or start + span > GRID_LIMIT
+                ):
+                    invalid.append(
+                        f"{field_name} {start}"
+                        + (f" spanning {span}" if span > 1 else "")
+                    )
+            if invalid:
+                problems.append(Problem(
+                    kind=GRID_RANGE,
+                    message=f"Grid {' and '.join(invalid)} of '{name}'"
+                    " out of range",
+                    widgets=(name,),
+                ))
+            elif (
+                row is not None and column is not None
+                and parents[wgt_id] != NO_PARENT
+            ):
+                cells.append((wgt_id, row, rowspan, column, columnspan))
+        return cells
+
+
+def _option_reporter(problems: list[Problem]) -> RepeatedOption:
+    def report(lineno: int, section: str, option: str) -> None:
+        problems.append(Problem(
+            kind=DUPLICATE_OPTION,
+            message=f"Line {lineno}: option '{option}' in section"
+            f" '{section}' already exists",
+            widgets=(section,),
+        ))
+    return report
+
+
+def _find_cycles(parents: list[int]) -> list[list[int]]:
+    """Cycles of parent links, every one starting with the widget
+    defined first among the widgets leading to it"""
+    # 0 for unvisited widgets, 1 while following their parents and 2 once
+    # done with them
+    state = [0] * len(parents)
+    cycles = []
+    for start in range(len(parents)):
+        path = []
+        wgt_id = start
+        while wgt_id != NO_PARENT and state[wgt_id] == 0:
+            state[wgt_id] = 1
+            path.append(wgt_id)
+            wgt_id = parents[wgt_id]
+        if wgt_id != NO_PARENT and state[wgt_id] == 1:
+            cycles.append(path[path.index(wgt_id):])
+        for wgt_id in path:
+            state[wgt_id] = 2
+    return cycles
+
+
+def _collisions(
+    names: list[str],
+    parents: list[int],
+    cells: list[Cell],
+) -> Iterator[Problem]:
+    """Report siblings that share grid cells
+
+    Every widget sharing cells with widgets that start in the same row
+    or above is reported along with the first defined of them.
+    """
+    grids: dict[int, list[Cell]] = {}
+    for cell in cells:
+        grids.setdefault(parents[cell[0]], []).append(cell)
+    pairs = [pair for grid in grids.values() for pair in collisions(grid)]
+    for first, second in sorted(pairs, key=lambda pair: pair[::-1]):
+        yield Problem(
+            kind=GRID_COLLISION,
+            message=f"'{names[second]}' shares grid cells with"
+            f" '{names[first]}' in '{names[parents[second]]}'",
+            widgets=(names[second], names[first]),
+        )
+
+
+def validate_project(
+    directory: str | os.PathLike,
+    kit: str,
+    *,
+    pattern: str = "**/*.ini",
+    max_workers: int | None = None,
+) -> list[ValidationResult]:
+    """Validate the definition files under `directory` in parallel
+
+    The UI kit is named as for `load_many`. Returns a result for every
+    file matching `pattern`, sorted by path.
+    """
+    paths = sorted(Path(directory).glob(pattern))
+    return [
+        ValidationResult(path=path, problems=problems)
+        for path, problems in zip(paths, map_files(
+            paths, kit, _file_validator, max_workers=max_workers
+        ))
+    ]
+
+
+def _file_validator(kit: str) -> Callable[[Path], list[Problem]]:
+    return Validator(
+        get_class=resolve_kit(kit).widget_class_factory
+    ).validate_file
@@ -3,6 +3,6 @@ from dataclasses import dataclass
 from .base import Widget
 
 
-@dataclass(kw_only=True)
+@dataclass(kw_only=True, slots=True)
 class Button(Widget):
     text: str = "Click me!"
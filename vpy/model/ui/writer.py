@@ -0,0 +1,120 @@
+"""Writing widget trees back to UI definition files.
+
+`ini_lines` yields the lines of a definition that `Loader` reads back
+into an identical tree, one section per widget with parents before
+their children and fields in the order their class declares them.
+Fields left at their defaults are omitted. `write_ini` and `save_ini`
+stream those lines to a file, so the output is never held in memory as
+a whole.
+"""
+from dataclasses import fields
+from collections.abc import Callable, Iterator
+from typing import TextIO
+import os
+import re
+
+from vpy.model.ui.base import Widget
+from vpy.model.ui.parser import COMMENT_PREFIX
+
+
+ClassNamer = Callable[[type[Widget]], str]
+# (field name, default value) for every field written
+WritePlan = list[tuple[str, object]]
+
+# Section names that `SECTRE` reads back unchanged
+NAMERE = re.compile(r"\w+")
+
+_write_plans: dict[type[Widget], WritePlan] = {}
+
+
+def class_name(cls: type[Widget]) -> str:
+    """The name built-in UI kits resolve a widget class by"""
+    return cls.__name__
+
+
+def ini_lines(root: Widget, get_name: ClassNamer = class_name) -> Iterator[str]:
+    """Yield the lines of a UI definition of the tree under `root`
+
+    Lines do not include line endings. Sections are separated by a
+    blank line. `get_name` gives the name to write as the class of a
+    widget, which must be one the UI kit resolves back to its class.
+    """
+    class_names: dict[type[Widget], str] = {}
+    stack: list[tuple[Widget, str | None]] = [(root, None)]
+    first = True
+    while stack:
+        widget, parent = stack.pop()
+        cls = type(widget)
+        name = class_names.get(cls)
+        if name is None:
+            name = class_names[cls] = get_name(cls)
+        if not first:
+            yield ""
+        first = False
+        if not NAMERE.fullmatch(widget.name):
+            raise ValueError(f"Cannot write widget name '{widget.name}'")
+        yield f"[{widget.name}]"
+        yield f"class: {name}"
+        if parent is not None:
+            yield f"parent: {parent}"
+        for field_name, default in write_plan(cls):
+            value = getattr(widget, field_name)
+            if value != default:
+                yield from _option_lines(widget.name, field_name, value)
+        stack.extend(
+            (child, widget.name)
+            for child in reversed(getattr(widget, "children", ()))
+        )
+
+
+def write_ini(
+    root: Widget, file: TextIO, get_name: ClassNamer = class_name
+) -> None:
+    for line in ini_lines(root, get_name):
+        file.write(line)
+        file.write("\n")
+
+
+def save_ini(
+    root: Widget,
+    path: str | os.PathLike,
+    get_name: ClassNamer = class_name,
+    encoding: str = "utf-8",
+) -> None:
+    with open(path, "w", encoding=encoding) as f:
+        write_ini(root, f, get_name)
+
+
+def write_plan(cls: type[Widget]) -> WritePlan:
+    """The fields of a widget class that are written, with their defaults"""
+    plan = _write_plans.get(cls)
+    if plan is None:
+        plan = _write_plans[cls] = [
+            (f.name, f.default) for f in fields(cls)
+            if f.name not in ("name", "children")
+        ]
+    return plan
+
+
+def _option_lines(section: str, name: str, value: object) -> Iterator[str]:
+    if isinstance(value, bool):
+        yield f"{name}: {'yes' if value else 'no'}"
+    elif isinstance(value, int):
+        yield f"{name}: {value}"
+    elif isinstance(value, str):
+        lines = value.split("\n")
+        # The parser strips values and drops comment lines and trailing
+        # blank lines, and files are read with universal newlines, so
+        # such values would not read back the same
+        if (
+            "\r" in value
+            or any(line != line.strip() for line in lines)
+            or any(line.startswith(COMMENT_PREFIX) for line in lines[1:])
+            or (len(lines) > 1 and not lines[-1])
+        ):
+            raise ValueError(f"Cannot write {section}.{name}: {value!r}")
+        yield f"{name}: {lines[0]}"
+        # Continuation lines, blank ones are kept within a value
+        yield from (f"    {line}" if line else "" for line in lines[1:])
+    else:
+        raise ValueError(f"Cannot write {section}.{name}: {value!r}")
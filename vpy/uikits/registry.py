@@ -0,0 +1,107 @@
+"""Registry of UI kits and widget classes.
+
+UI kits and widget classes are registered by name along with the
+`module:attribute` import path of their implementation, and are only
+imported when first used. Besides the built-in kits, other packages can
+provide kits and widget classes through the `vpy.uikits` and
+`vpy.widgets` entry point groups, which are read on first lookup.
+Widget classes are resolved once per class name, and the result is
+remembered, so resolving the classes of a large form with classes from
+several kits costs one lookup per distinct class.
+"""
+from dataclasses import dataclass, field
+from importlib import import_module
+
+from vpy.interfaces.uikit import UiKit
+from vpy.model.ui.base import Widget
+
+
+KIT_GROUP = "vpy.uikits"
+WIDGET_GROUP = "vpy.widgets"
+
+BUILTIN_KITS = {
+    "tkinter": "vpy.uikits.tkinter:TkInterKit",
+}
+
+
+def import_object(path: str) -> object:
+    """Import an object given as a `module:attribute` import path"""
+    module_name, sep, attr_name = path.partition(":")
+    if not sep:
+        raise ValueError(f"Not a 'module:attribute' import path: '{path}'")
+    obj = import_module(module_name)
+    for name in attr_name.split("."):
+        obj = getattr(obj, name)
+    return obj
+
+
+@dataclass(kw_only=True)
+class Registry:
+    # Import paths by name, add to them with the register methods, which
+    # also forget classes resolved so far
+    kits: dict[str, str] = field(default_factory=lambda: dict(BUILTIN_KITS))
+    widgets: dict[str, str] = field(default_factory=dict)
+    # Look for more kits and widget classes in entry points
+    discover: bool = True
+    _discovered: bool = field(default=False, init=False, repr=False)
+    _kit_instances: dict[str, UiKit] = \
+        field(default_factory=dict, init=False, repr=False)
+    _classes: dict[str, type[Widget] | None] = \
+        field(default_factory=dict, init=False, repr=False)
+
+    def register_kit(self, name: str, path: str) -> None:
+        self.kits[name] = path
+        self._classes.clear()
+
+    def register_widget(self, class_name: str, path: str) -> None:
+        self.widgets[class_name] = path
+        self._classes.clear()
+
+    def kit_names(self) -> list[str]:
+        self._discover()
+        return list(self.kits)
+
+    def kit(self, name: str) -> UiKit:
+        """The instance of a UI kit, imported and created on first use"""
+        kit = self._kit_instances.get(name)
+        if kit is None:
+            self._discover()
+            path = self.kits.get(name)
+            if path is None:
+                raise ValueError(f"Unknown UI kit: '{name}'")
+            kit = self._kit_instances[name] = import_object(path)()
+        return kit
+
+    def widget_class_factory(self, class_name: str) -> type[Widget] | None:
+        """Resolve a widget class from the registered widget classes,
+        then from the UI kits, in the order they were registered"""
+        try:
+            return self._classes[class_name]
+        except KeyError:
+            pass
+        self._discover()
+        path = self.widgets.get(class_name)
+        if path is not None:
+            cls = import_object(path)
+        else:
+            cls = None
+            for kit_name in self.kits:
+                cls = self.kit(kit_name).widget_class_factory(class_name)
+                if cls is not None:
+                    break
+        self._classes[class_name] = cls
+        return cls
+
+    def _discover(self) -> None:
+        if self._discovered or not self.discover:
+            return
+        self._discovered = True
+        # Reading package metadata costs more to import than the rest of
+        # this module, so only pay for it when looking for plugins
+        from importlib.metadata import entry_points
+        for group, names in ((KIT_GROUP, self.kits), (WIDGET_GROUP, self.widgets)):
+            for entry_point in entry_points(group=group):
+                names.setdefault(entry_point.name, entry_point.value)
+
+
+default_registry = Registry()
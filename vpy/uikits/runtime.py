@@ -0,0 +1,106 @@
+"""Runtime loading of the code generated for UI models.
+
+`UiModuleLoader` turns a model into the module its UI kit generates for
+it, without parsing or compiling the generated code more than once. The
+compiled code object is marshalled into a cache file keyed by a hash of
+the model, the UI kit and the version of its code generator, and the
+Python version. Once loaded, modules are also kept in memory, so
+opening the same window again only hashes the model.
+"""
+from dataclasses import dataclass, field, fields
+from hashlib import sha256
+from importlib.util import MAGIC_NUMBER
+from pathlib import Path
+from types import CodeType, ModuleType
+from collections.abc import Callable
+from operator import attrgetter
+import marshal
+import sys
+
+from vpy.interfaces.uikit import UiKit
+from vpy.model.ui.base import Widget
+from vpy.model.ui.cache import read_checked, write_checked
+
+
+CACHE_SUFFIX = ".vpyc"
+MAGIC = b"VPYM\x01" + MAGIC_NUMBER
+
+
+@dataclass(kw_only=True)
+class UiModuleLoader:
+    kit: UiKit
+    cache_dir: Path
+    _modules: dict[str, ModuleType] = \
+        field(default_factory=dict, init=False, repr=False)
+
+    def __call__(self, model: Widget) -> ModuleType:
+        """The module generated for the model, executed"""
+        key = self.cache_key(model)
+        module = self._modules.get(key)
+        if module is None:
+            cache_path = self.cache_dir / (key + CACHE_SUFFIX)
+            code = self._read_cache(cache_path)
+            if code is None:
+                code = compile(
+                    self.kit.compile_user_class_dec(model),
+                    f"<vpy:{model.name}>",
+                    "exec",
+                )
+                write_checked(cache_path, MAGIC, marshal.dumps(code))
+            module = ModuleType(f"vpy_ui_{key}")
+            exec(code, module.__dict__)
+            self._modules[key] = module
+        return module
+
+    def decorator(self, model: Widget) -> Callable[[type], type]:
+        return self(model).decorate_class
+
+    def cache_key(self, model: Widget) -> str:
+        kit_cls = type(self.kit)
+        key_hash = sha256(
+            f"{kit_cls.__module__}.{kit_cls.__qualname__}"
+            f":{self.kit.CODEGEN_VERSION}:{sys.implementation.cache_tag}"
+            .encode()
+        )
+        try:
+            key_hash.update(marshal.dumps(_model_records(model)))
+        except ValueError:
+            # Values marshal cannot handle, fall back to their repr
+            key_hash.update(repr(_model_records(model)).encode())
+        return key_hash.hexdigest()
+
+    @staticmethod
+    def _read_cache(cache_path: Path) -> CodeType | None:
+        payload = read_checked(cache_path, MAGIC)
+        if payload is None:
+            return None
+        try:
+            code = marshal.loads(payload)
+        except (ValueError, TypeError, EOFError):
+            return None
+        return code if isinstance(code, CodeType) else None
+
+
+def _model_records(model: Widget) -> list[tuple]:
+    """Flatten a model tree into records of everything code depends on"""
+    records = []
+    class_entries = {}
+    stack = [model]
+    while stack:
+        widget = stack.pop()
+        cls = type(widget)
+        entry = class_entries.get(cls)
+        if entry is None:
+            field_names = tuple(
+                f.name for f in fields(cls) if f.name != "children"
+            )
+            entry = class_entries[cls] = (
+                f"{cls.__module__}.{cls.__qualname__}",
+                field_names,
+                attrgetter(*field_names),
+            )
+        class_name, field_names, get_values = entry
+        children = getattr(widget, "children", ())
+        records.append((class_name, field_names, get_values(widget), len(children)))
+        stack.extend(reversed(children))
+    return records
@@ -1,14 +1,17 @@
-from typing import Final
-from collections.abc import Mapping
-from textwrap import dedent
+from typing import Final, TYPE_CHECKING
+from collections.abc import Iterable, Mapping
 
 from vpy.interfaces.uikit import UiKit
 from vpy.model.ui.base import Widget
 from vpy.model.ui.widgets import Button
 from vpy.model.ui.layout_widgets import Frame
 
+if TYPE_CHECKING:
+    from .codegen import CacheStats, CodeGenerator
+
 
 class TkInterKit(UiKit):
+    CODEGEN_VERSION: Final[str] = "2"
     WIDGET_CLASSES: Final[Mapping] = {
         cls.__name__: cls for cls in [
             Button,
@@ -16,39 +19,45 @@ class TkInterKit(UiKit):
         ]
     }
     
+    def __init__(self) -> None:
+        # Created on first use, so resolving widget classes does not
+        # import the code generator
+        self._codegen_instance: "CodeGenerator | None" = None
+
     def widget_class_factory(self, class_name: str) -> type[Widget]|None:
         return self.WIDGET_CLASSES.get(class_name)
 
-    def compile_user_class_dec(self, model: Widget) -> str:
-        generated_code = dedent(
-            """\
-            import tkinter as tk
-            import tkinter.ttk as ttk
-            from typing import TypeVar
-
-            _CT = TypeVar("_CT", bound=tk.Misc)
-
-            def decorate_class(cls: _CT) -> _CT:
-                def _new_init(self, parent: tk.Misc|None = None):
-                    super(cls, self).__init__(parent)
-                    
-                cls.__init__ = _new_init
-                return cls
-            """
-        )
-        ( # this is for later...
-            """\
-            _CT = TypeVar("_CT", bound=tk.Misc)
-
-            def decorate_class(cls: _CT) -> _CT:
-                def _new_init(self, parent: tk.Misc|None = None, **options):
-                    config = {}
-                    config.update(options)
-                    super(cls, self).__init__(parent, **config)
-
-                cls.__init__ = _new_init
-                cls.__init__.__qualname__ = f"{cls.__qualname__}.__init__"
-                return cls
-            """
-        )
-        return generated_code
+    @property
+    def _codegen(self) -> "CodeGenerator":
+        if self._codegen_instance is None:
+            from .codegen import CodeGenerator
+            self._codegen_instance = CodeGenerator()
+        return self._codegen_instance
+
+    @property
+    def codegen_stats(self) -> "CacheStats":
+        """Hits and misses of the code fragment cache"""
+        return self._codegen.stats
+
+    def compile_user_class_dec(
+        self, model: Widget, changed: Iterable[Widget] | None = None
+    ) -> str:
+        """Compile a model into a class decorator
+
+        If the model was compiled before, `changed` can list the widgets
+        whose fields or children changed since then, so that only the
+        parts of the model tree around them are looked at.
+        """
+        return self._codegen(model, changed)
+
+    def compile_module(
+        self,
+        models: dict[str, Widget],
+        changed: Iterable[Widget] | None = None,
+    ) -> str:
+        """Compile many models into one module
+
+        `models` maps the names of the class decorators to define to the
+        models they are compiled from.
+        """
+        return self._codegen.compile_module(models, changed)
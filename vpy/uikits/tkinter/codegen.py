@@ -0,0 +1,349 @@
+"""Generation of tkinter code from widget model trees.
+
+The generated code defines class decorators. Decorating a tkinter
+widget class with one makes its `__init__` create and grid all the
+widgets below the model root. Templates are dedented once at import
+time, and what each widget class needs to generate is worked out once
+per class, so generating code for a widget only formats strings. The
+code of every subtree is cached, so compiling a model again only
+generates code for the widgets along the paths to what changed. Many
+model roots can be compiled into a single module, which is assembled
+from a list of fragments joined once at the end.
+
+Widgets are also set as attributes of the decorated class instances,
+named after them, unless that would replace attributes of the class or
+those tkinter sets on its instances.
+"""
+from dataclasses import dataclass, field, fields, MISSING
+from collections.abc import Callable, Iterable, Iterator
+from itertools import count
+from keyword import iskeyword
+from operator import attrgetter
+from textwrap import dedent, indent
+from unicodedata import normalize
+
+from vpy.model.ui.base import Widget, WidgetContainer
+from vpy.model.ui.widgets import Button
+from vpy.model.ui.layout_widgets import Frame
+
+
+MODULE_HEADER = dedent(
+    """\
+    import tkinter as tk
+    import tkinter.ttk as ttk
+    from typing import TypeVar
+
+    _CT = TypeVar("_CT", bound=tk.Misc)
+    """
+)
+DECORATOR_HEADER = dedent(
+    """\
+
+    def {function}(cls: _CT) -> _CT:
+        def _new_init(self, parent: tk.Misc|None = None, **options):
+            config = {{}}
+            config.update(options)
+            super(cls, self).__init__(parent, **config)
+    """
+)
+DECORATOR_FOOTER = indent(
+    dedent(
+        """\
+
+        cls.__init__ = _new_init
+        cls.__init__.__qualname__ = f"{cls.__qualname__}.__init__"
+        return cls
+        """
+    ),
+    " " * 4,
+)
+INDENT = " " * 8
+CONSTRUCT_TEMPLATE = INDENT + "{var} = {tk_class}({args})\n"
+ATTRIBUTE_TEMPLATE = (
+    INDENT + "if not hasattr(cls, {name!r}):\n"
+    + INDENT + "    self.{name} = {var}\n"
+)
+GRID_TEMPLATE = INDENT + "{var}.grid({options})\n"
+
+# tkinter widget classes by model class
+TK_CLASSES = {
+    Button: "ttk.Button",
+    Frame: "ttk.Frame",
+}
+# `grid()` options by model field
+GRID_OPTIONS = {
+    "grid_row": "row",
+    "grid_column": "column",
+    "grid_rowspan": "rowspan",
+    "grid_columnspan": "columnspan",
+    "margin_x": "padx",
+    "margin_y": "pady",
+    "padding_x": "ipadx",
+    "padding_y": "ipady",
+}
+STICKY = {
+    "stick_north": "n",
+    "stick_east": "e",
+    "stick_south": "s",
+    "stick_west": "w",
+}
+# Attributes tkinter sets on widget instances, not on their classes
+TK_INSTANCE_ATTRIBUTES = frozenset({"tk", "master", "children", "widgetName"})
+# Fields of every widget that are not passed as widget options
+MODEL_FIELDS = frozenset(
+    f.name for f in fields(WidgetContainer)
+)
+
+# (field name, default value, option name)
+OptionPlan = list[tuple[str, object, str]]
+
+
+# (serial number, code of the widget, fragments of its children)
+Fragment = tuple[int, str, tuple["Fragment", ...]]
+
+
+@dataclass(kw_only=True)
+class ClassPlan:
+    tk_class: str
+    widget_options: OptionPlan
+    grid_options: OptionPlan
+    sticky: OptionPlan
+    # Returns the values of all the fields code is generated from
+    values: Callable[[Widget], tuple]
+
+
+@dataclass(kw_only=True)
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+
+
+@dataclass(kw_only=True)
+class _TreeCache:
+    """What was generated for the model root of a given name"""
+    fragments: dict[tuple, Fragment] = field(default_factory=dict)
+    # Widget id to (widget, parent variable name, fragment)
+    widgets: dict[int, tuple[Widget, str, Fragment]] = \
+        field(default_factory=dict)
+    # Widget id to parent widget
+    parents: dict[int, Widget] = field(default_factory=dict)
+
+
+@dataclass(kw_only=True)
+class CodeGenerator:
+    """Generate tkinter code, reusing the code of unchanged subtrees
+
+    The code generated for every widget is kept as a fragment, keyed by
+    the widget fields, its parent and the keys of its children, per
+    model root name. On the next compile of a model with the same root
+    name, only widgets whose subtree changed are generated again, but
+    every widget is still looked up. Fragments that the last compile of
+    a root did not use are dropped.
+
+    Callers that track changes to the model can pass the widgets whose
+    fields or children changed since the last compile as `changed`.
+    Subtrees without any of them are then reused without being walked,
+    and are kept until the next compile without `changed`.
+    """
+    stats: CacheStats = field(default_factory=CacheStats)
+    _class_plans: dict[type[Widget], ClassPlan] = \
+        field(default_factory=dict, init=False, repr=False)
+    _trees: dict[str, _TreeCache] = \
+        field(default_factory=dict, init=False, repr=False)
+    _serials: Iterator[int] = \
+        field(default_factory=count, init=False, repr=False)
+
+    def __call__(
+        self, model: Widget, changed: Iterable[Widget] | None = None
+    ) -> str:
+        """Generate a module defining a `decorate_class` decorator"""
+        return self.compile_module({"decorate_class": model}, changed)
+
+    def compile_module(
+        self,
+        models: dict[str, Widget],
+        changed: Iterable[Widget] | None = None,
+    ) -> str:
+        """Generate a module defining a decorator for every model root
+
+        `models` maps the names of the decorator functions to generate
+        to the model roots they are generated from.
+        """
+        if changed is not None:
+            changed = list(changed)
+        parts = [MODULE_HEADER]
+        for function, model in models.items():
+            parts.append(DECORATOR_HEADER.format(function=function))
+            stack = list(reversed(self._compile_children(model, changed)))
+            while stack:
+                _, code, children = stack.pop()
+                parts.append(code)
+                stack.extend(reversed(children))
+            parts.append(DECORATOR_FOOTER)
+        return "".join(parts)
+
+    def _compile_children(
+        self, root: Widget, changed: list[Widget] | None
+    ) -> list[Fragment]:
+        """Fragments of the subtrees below `root`"""
+        cache = self._trees.get(root.name)
+        if cache is None or changed is None:
+            old_cache = cache or _TreeCache()
+            cache = self._trees[root.name] = _TreeCache()
+            dirty = None
+        else:
+            old_cache = cache
+            dirty = set()
+            for widget in changed:
+                while widget is not None and id(widget) not in dirty:
+                    dirty.add(id(widget))
+                    widget = cache.parents.get(id(widget))
+        # Fragments of the children of the widgets being compiled
+        results: list[list[Fragment]] = [[]]
+        stack = [
+            (child, "self", root, False)
+            for child in reversed(getattr(root, "children", ()))
+        ]
+        while stack:
+            widget, parent_var, parent, children_done = stack.pop()
+            if not children_done:
+                if dirty is not None and id(widget) not in dirty:
+                    cached_widget, cached_parent_var, fragment = \
+                        cache.widgets.get(id(widget), (None, None, None))
+                    if cached_widget is widget and cached_parent_var == parent_var:
+                        cache.parents[id(widget)] = parent
+                        self.stats.hits += 1
+                        results[-1].append(fragment)
+                        continue
+                stack.append((widget, parent_var, parent, True))
+                results.append([])
+                var = _var_name(widget.name)
+                stack.extend(
+                    (child, var, widget, False)
+                    for child in reversed(getattr(widget, "children", ()))
+                )
+                continue
+            child_fragments = tuple(results.pop())
+            plan = self._get_class_plan(type(widget))
+            key = (
+                parent_var, type(widget), widget.name, plan.values(widget),
+                tuple(serial for serial, _, _ in child_fragments),
+            )
+            try:
+                fragment = old_cache.fragments.get(key) \
+                    or cache.fragments.get(key)
+            except TypeError:
+                # Unhashable field values, the code is not cached
+                key = fragment = None
+            if fragment is None:
+                self.stats.misses += 1
+                fragment = (
+                    next(self._serials),
+                    self._widget_code(widget, parent_var, plan),
+                    child_fragments,
+                )
+            else:
+                self.stats.hits += 1
+            if key is not None:
+                cache.fragments[key] = fragment
+            cache.widgets[id(widget)] = (widget, parent_var, fragment)
+            cache.parents[id(widget)] = parent
+            results[-1].append(fragment)
+        return results[0]
+
+    @staticmethod
+    def _widget_code(widget: Widget, parent: str, plan: ClassPlan) -> str:
+        var = _var_name(widget.name)
+        parts = [CONSTRUCT_TEMPLATE.format(
+            var=var,
+            tk_class=plan.tk_class,
+            args=", ".join([parent, *_options(widget, plan.widget_options)]),
+        )]
+        if _is_attribute_name(widget.name):
+            parts.append(ATTRIBUTE_TEMPLATE.format(name=widget.name, var=var))
+        grid_options = _options(widget, plan.grid_options)
+        sticky = "".join(
+            side for field_name, default, side in plan.sticky
+            if getattr(widget, field_name) != default
+        )
+        if sticky:
+            grid_options.append(f"sticky={sticky!r}")
+        parts.append(GRID_TEMPLATE.format(
+            var=var, options=", ".join(grid_options)
+        ))
+        return "".join(parts)
+
+    def _get_class_plan(self, cls: type[Widget]) -> ClassPlan:
+        plan = self._class_plans.get(cls)
+        if plan is None:
+            plan = self._class_plans[cls] = self._mk_class_plan(cls)
+        return plan
+
+    @staticmethod
+    def _mk_class_plan(cls: type[Widget]) -> ClassPlan:
+        tk_class = next(
+            (TK_CLASSES[base] for base in cls.__mro__ if base in TK_CLASSES),
+            None
+        )
+        if tk_class is None:
+            raise TypeError(f"Unsupported widget class: {cls.__qualname__}")
+        defaults = {
+            f.name: None if f.default is MISSING else f.default
+            for f in fields(cls)
+        }
+        return ClassPlan(
+            tk_class=tk_class,
+            widget_options=[
+                (name, default, name)
+                for name, default in defaults.items()
+                if name not in MODEL_FIELDS
+            ],
+            grid_options=[
+                (name, defaults[name], option)
+                for name, option in GRID_OPTIONS.items()
+            ],
+            sticky=[
+                (name, defaults[name], side)
+                for name, side in STICKY.items()
+            ],
+            values=attrgetter(*(
+                name for name in defaults if name not in ("name", "children")
+            )),
+        )
+
+
+def _is_attribute_name(name: str) -> bool:
+    """Whether widgets of a name are set as attributes of the decorated
+    class instances
+
+    Names of private and tkinter attributes are left out, and so are the
+    attributes of the decorated class, which the generated code checks.
+    """
+    return (
+        name.isidentifier() and not iskeyword(name)
+        and not name.startswith("_") and name not in TK_INSTANCE_ATTRIBUTES
+        # Python normalizes identifiers, so they could name other widgets
+        and normalize("NFKC", name) == name
+    )
+
+
+def _var_name(name: str) -> str:
+    """The local variable of a widget, unique among the widget names
+
+    Names that do not make ASCII identifiers, which Python could
+    normalize to those of other names, are hex encoded under another
+    prefix.
+    """
+    var = f"w_{name}"
+    if var.isidentifier() and var.isascii():
+        return var
+    return f"wh_{name.encode().hex()}"
+
+
+def _options(widget: Widget, plan: OptionPlan) -> list[str]:
+    """Format the options whose fields are not left at their defaults"""
+    return [
+        f"{option}={value!r}"
+        for name, default, option in plan
+        if (value := getattr(widget, name)) != default
+    ]